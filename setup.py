@@ -3,6 +3,7 @@
 Setup script for Vendra Quote Parser
 """
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -13,6 +14,20 @@ long_description = (this_directory / "README.md").read_text()
 # Read requirements
 requirements = (this_directory / "requirements.txt").read_text().splitlines()
 
+# Optional Cython build of the text post-processing modules. Off by default so
+# pure-Python installs never need a compiler; the .py sources remain the
+# fallback whenever the compiled modules are not present.
+ext_modules = []
+if os.environ.get("VENDRA_ENABLE_CYTHON") == "1":
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [
+            "src/vendra_parser/ocr_parser.py",
+            "src/vendra_parser/domain_parser.py",
+        ],
+        language_level=3,
+    )
+
 setup(
     name="vendra-quote-parser",
     version="1.0.0",
@@ -38,9 +53,16 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "speedups": ["orjson>=3.9.0", "xxhash>=3.0.0"],
+        "tesserocr": ["tesserocr>=2.6.0"],
+        "pymupdf": ["pymupdf>=1.23.0"],
+    },
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "vendra-parser=vendra_parser.cli:cli",
+            "parse-quote=vendra_parser.__main__:main",
         ],
     },
     include_package_data=True,
@@ -8,10 +8,34 @@ __version__ = "1.0.0"
 __author__ = "Vendra Intern Coding Challenge"
 __email__ = "mmandapa@ucsc.edu"
 
-from .comprehensive_parser import ComprehensivePDFParser
-from .multi_format_parser import MultiFormatPDFParser
-from .ocr_parser import OCRParser, DynamicOCRParser
-from .invoice2data_parser import Invoice2DataParser
+import importlib
+
+# Parsers are imported on first attribute access (PEP 562) so that importing
+# the package, or one parser, does not load every PDF/OCR backend up front
+_LAZY_IMPORTS = {
+    "ComprehensivePDFParser": (".comprehensive_parser", "ComprehensivePDFParser"),
+    "MultiFormatPDFParser": (".multi_format_parser", "MultiFormatPDFParser"),
+    "OCRParser": (".ocr_parser", "OCRParser"),
+    "DynamicOCRParser": (".ocr_parser", "DynamicOCRParser"),
+    "Invoice2DataParser": (".invoice2data_parser", "Invoice2DataParser"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    # Advertise lazily imported names to dir() and tab completion
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "ComprehensivePDFParser",
@@ -19,4 +43,4 @@ __all__ = [
     "OCRParser",
     "DynamicOCRParser",
     "Invoice2DataParser",
-] 
\ No newline at end of file
+] 
@@ -0,0 +1,17 @@
+"""
+Entry point for ``python -m vendra_parser``.
+
+Runs the same Click CLI as the ``vendra-parser`` console script, so an
+installed package (``pip install -e .``) never needs sys.path tweaks.
+"""
+
+from .cli import cli
+
+
+def main():
+    """Run the vendra-parser command line interface."""
+    cli()
+
+
+if __name__ == '__main__':
+    main()
@@ -5,35 +5,377 @@ Learns patterns from the document itself rather than using hardcoded rules.
 """
 
 import re
+import copy
+import functools
+import heapq
 import logging
+from bisect import bisect_left, bisect_right
 import subprocess
 import tempfile
 import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple, Set
 from decimal import Decimal, InvalidOperation
 import json
 from collections import defaultdict, Counter
+from itertools import permutations
+from operator import itemgetter
 
 from .models import LineItem, QuoteGroup
 from .domain_parser import parse_with_domain_knowledge
+from .ocr_parser import TESSEROCR_AVAILABLE, TesserocrAPIPool, file_sha256
+
+# Optional MuPDF bindings, much faster than pdfplumber for plain text
+try:
+    import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
+# Optional fast JSON encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Price patterns for extract_prices_flexible in order of reliability, fused
+# into one alternation so the text is scanned once. At each position the
+# first (most reliable) branch that matches wins; the named group holds the value.
+_PRICE_PATTERN = re.compile('|'.join([
+    r'(?P<symbol>[$€£¥][\d,]+\.?\d*)',                      # $1,234.56
+    r'(?P<per_unit>[\d,]+\.?\d*)\s*(?:/EA|/EACH|each|per)',  # 123.45 /EA
+    r'(?P<currency_code>[\d,]+\.?\d*)\s*(?:USD|EUR|GBP|CAD)', # 123.45 USD
+    r'(?P<line_end>[\d,]+\.?\d*)(?=\s*$)',                   # Numbers at line end
+    r'(?P<decimal>[\d,]+\.\d{2})',                           # Decimal currency format
+    r'(?P<number>[\d,]+\.?\d*)',                             # Any decimal number
+]), re.IGNORECASE)
+
+# Number patterns for _extract_all_numbers
+# Each pattern is paired with a character it cannot match without, so
+# lines lacking it skip that scan entirely (None: always scan)
+_NUMBER_PATTERNS = [(re.compile(pattern), marker) for pattern, marker in [
+    (r'(-?\$?[\d,]+\.?\d*%?)', None),  # Basic numbers with optional currency/percent
+    (r'(-?\d+\.?\d*e[+-]?\d+)', 'e'),  # Scientific notation
+    (r'(-?\d+/\d+)', '/'),  # Fractions
+    (r'(-?\d+:\d+)', ':'),  # Ratios/time
+]]
+
+# Anything _NUMBER_PATTERNS can match contains one of these
+_NUMBER_CHAR_PATTERN = re.compile(r'[\d,]')
+
+# Quantity patterns for extract_quantity_flexible, tried in order
+_QUANTITY_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(?:qty|quantity|amount|count):\s*(\d+)',     # Qty: 5
+    r'(?:qty|quantity|amount|count)\s+(\d+)',      # Qty 5
+    r'(\d+)\s*(?:pieces?|units?|ea|each|pcs)',     # 5 pieces
+    r'^(\d+)\s+',                                  # Number at start of line
+    r'(\d+)(?=\s*[×x])',                          # 5 x item
+    r'(\d+)(?=\s*[@])',                           # 5 @ $10.00
+    r'(\d+)(?=\s*\$)',                            # 5 $10.00
+]]
+
+# Keyword checks, each a single alternation instead of one substring scan
+# per keyword
+_CURRENCY_SYMBOL_PATTERN = re.compile(r'[$€£¥]')
+_PRICE_KEYWORD_PATTERN = re.compile('|'.join(['price', 'cost', 'total', 'amount', 'rate', 'fee', 'charge']))
+_CURRENCY_CONTEXT_PATTERN = re.compile('|'.join(['price', 'cost', 'total', 'amount']))
+_QUANTITY_CONTEXT_PATTERN = re.compile('|'.join(['qty', 'quantity', 'pcs', 'each', 'ea']))
+_QUANTITY_INDICATOR_PATTERN = re.compile('|'.join(['qty', 'quantity', 'pcs', 'ea', 'each', 'units']))
+# Header/footer lines that are never pricing data
+_SKIP_INDICATOR_PATTERN = re.compile('|'.join(map(re.escape, [
+    'total:', 'subtotal:', 'tax:', 'shipping:', 'discount:',
+    'phone:', 'email:', 'address:', 'thank you', 'terms',
+    'conditions', 'payment', 'due date', 'valid until'
+])))
+# Industry keywords for apply_industry_heuristics, checked in this order
+_MANUFACTURING_KEYWORD_PATTERN = re.compile('|'.join([
+    'part', 'component', 'machining', 'fabrication', 'cnc', 'assembly', 'bracket', 'widget', 'motor'
+]))
+_SERVICE_KEYWORD_PATTERN = re.compile('|'.join([
+    'labor', 'consultation', 'service', 'support', 'training', 'maintenance', 'installation'
+]))
+_MATERIAL_KEYWORD_PATTERN = re.compile('|'.join([
+    'steel', 'aluminum', 'plastic', 'lumber', 'concrete', 'fabric', 'raw material'
+]))
+# Part numbers such as "AB-1234" in line item descriptions
+_PART_NUMBER_PATTERN = re.compile(r'[A-Z0-9]+-[A-Z0-9]+')
+# Pricing-unit keywords in lowercased descriptions; plain substrings, so
+# 'sq' and 'lb' also hit 'sqft' and '10lb'
+_HOURLY_KEYWORD_PATTERN = re.compile('|'.join(['hour', 'hr', 'time', 'labor', 'service', 'consultation']))
+_AREA_KEYWORD_PATTERN = re.compile('|'.join(['sq', 'area', 'coverage', 'surface', 'sqft', 'sqm']))
+_WEIGHT_KEYWORD_PATTERN = re.compile('|'.join(['lb', 'kg', 'weight', 'pound', 'kilogram', 'ton']))
+_VOLUME_KEYWORD_PATTERN = re.compile('|'.join(['gallon', 'liter', 'cubic', 'volume', 'gal', 'l']))
+_SERVICE_RATE_KEYWORD_PATTERN = re.compile('|'.join(['hour', 'labor', 'service']))
+_MEASURED_UNIT_KEYWORD_PATTERN = re.compile('|'.join(['lb', 'kg', 'sqft', 'sqm']))
+_PRODUCT_KEYWORD_PATTERN = re.compile('|'.join([
+    'widget', 'assembly', 'kit', 'service', 'product', 'item', 'part', 'component'
+]))
+
+# Normalized amounts are quantized to cents
+_CENT = Decimal('0.01')
+# Integer part with comma thousands separators ("1,234,567")
+_THOUSANDS_GROUPED_PATTERN = re.compile(r'[0-9]{1,3}(?:,[0-9]{3})+')
+
+_NUMBER_TOKEN_PATTERN = re.compile(r'[\d,]+\.?\d*')
+_STANDALONE_INTEGER_PATTERN = re.compile(r'\b(\d+)\b')
+_NON_NUMERIC_PATTERN = re.compile(r'[^\d,.-]')
+# str.translate table deleting every ASCII character _NON_NUMERIC_PATTERN
+# would; for ASCII input it is a single C pass instead of a regex sub
+_ASCII_NON_NUMERIC_TABLE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(128) if chr(code) not in '0123456789,.-'
+))
+_COLUMN_GAP_PATTERN = re.compile(r'\s{2,}')  # Potential column separators
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+_WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+_EDGE_NON_WORD_PATTERN = re.compile(r'^[^\w]+|[^\w]+$')
+_LETTER_PATTERN = re.compile(r'[A-Za-z]')
+# Description followed by three numbers, for the regex fallback strategy
+_DESCRIPTION_AND_NUMBERS_PATTERN = re.compile(
+    r'([A-Za-z][A-Za-z0-9\s\-_\.]+?)\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)'
+)
+# Layout signatures for _classify_layout: a qty / price / total column
+# header, or rows split into columns by pipes or tabs
+_TABLE_HEADER_PATTERN = re.compile(
+    r'(?:qty|quantity)\s+(?:unit\s*price|price)\s+(?:total|amount)', re.IGNORECASE
+)
+_DELIMITED_ROW_PATTERN = re.compile(r'^[^\n|\t]*[|\t][^\n|\t]*[|\t]', re.MULTILINE)
+# Total amounts for create_minimal_result, tried in order
+_MINIMAL_TOTAL_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'total[:\s]+\$?([\d,]+\.?\d*)',
+    r'\$?([\d,]+\.?\d*)\s*total',
+    r'amount[:\s]+\$?([\d,]+\.?\d*)'
+]]
+# Page suffix pdftoppm appends to its output root: -<page>.pgm
+_PAGE_IMAGE_SUFFIX_PATTERN = re.compile(r'-(\d+)\.pgm')
+
+
+# The same raw values ("$10.00", "1") recur on line after line, so
+# normalization and price confidence are memoized on their string inputs.
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_number_text(raw_value: str) -> Optional[str]:
+    """Normalize a number string to two decimals (see AdaptivePDFParser._normalize_number)."""
+    # Fast path: plain ASCII "123", "123.4" or "123.45" without a leading
+    # zero, optionally "$"-prefixed and with "1,234" thousands grouping,
+    # already is (or pads to) what Decimal.quantize would print
+    plain = raw_value.strip()
+    int_part, dot, frac_part = (plain[1:] if plain[:1] == '$' else plain).partition('.')
+    if ',' in int_part and _THOUSANDS_GROUPED_PATTERN.fullmatch(int_part):
+        int_part = int_part.replace(',', '')
+    if (0 < len(int_part) <= 20 and int_part.isascii() and int_part.isdigit()
+            and (int_part[0] != '0' or len(int_part) == 1)):
+        if not dot:
+            return int_part + '.00'
+        if len(frac_part) == 2 and frac_part.isascii() and frac_part.isdigit():
+            return f"{int_part}.{frac_part}"
+        if len(frac_part) == 1 and frac_part.isascii() and frac_part.isdigit():
+            return f"{int_part}.{frac_part}0"
+    
+    try:
+        # Remove currency symbols, text, and extra whitespace
+        if plain.isascii():
+            cleaned = plain.translate(_ASCII_NON_NUMERIC_TABLE)
+        else:
+            cleaned = _NON_NUMERIC_PATTERN.sub('', plain)
+        
+        if not cleaned:
+            return None
+        
+        # Handle European format (1.234,56) vs US format (1,234.56)
+        if ',' in cleaned and '.' in cleaned:
+            # Determine format by position of last comma vs last dot
+            last_comma = cleaned.rfind(',')
+            last_dot = cleaned.rfind('.')
+            
+            if last_comma > last_dot:
+                # European: 1.234,56 -> 1234.56
+                cleaned = cleaned.replace('.', '').replace(',', '.')
+            else:
+                # US: 1,234.56 -> 1234.56
+                cleaned = cleaned.replace(',', '')
+        elif ',' in cleaned and len(cleaned.split(',')[-1]) <= 2:
+            # European decimal: 123,45 -> 123.45
+            cleaned = cleaned.replace(',', '.')
+        else:
+            # Remove commas (thousands separators)
+            cleaned = cleaned.replace(',', '')
+        
+        # Validate and convert
+        value = Decimal(cleaned)
+        return str(value.quantize(_CENT))
+        
+    except (InvalidOperation, ValueError, TypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _price_confidence(raw_value: str, has_price_keyword: bool, normalized: Optional[str]) -> float:
+    """Confidence that raw_value is a price; has_price_keyword is whether its context names one."""
+    confidence = 0.5  # Base confidence
+    
+    # Higher confidence for currency symbols
+    if _CURRENCY_SYMBOL_PATTERN.search(raw_value):
+        confidence += 0.3
+        
+    # Higher confidence for price-related context
+    if has_price_keyword:
+        confidence += 0.2
+        
+    # Higher confidence for proper decimal format
+    if '.' in raw_value and len(raw_value.split('.')[-1]) == 2:
+        confidence += 0.2
+        
+    # Lower confidence for very small or large numbers
+    try:
+        value = float(normalized) if normalized else 0.0
+        if 0.01 <= value <= 100000:
+            confidence += 0.1
+        elif value > 100000:
+            confidence -= 0.2
+    except (ValueError, TypeError):
+        pass
+        
+    return min(confidence, 1.0)
+
+
+def _dumps_json_bytes(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _within_tolerance(qty_num: Dict[str, Any], price_num: Dict[str, Any],
+                      total_num: Dict[str, Any], limit: float) -> bool:
+    """
+    Check |qty x price - total| <= limit x |total| for three extracted numbers.
+    
+    Float arithmetic settles all but near-boundary cases, which are redone in
+    Decimal so a product landing exactly on the limit is judged as before.
+    """
+    qty, price, total = qty_num['value'], price_num['value'], total_num['value']
+    if not total:
+        return False
+    difference = abs(qty * price - total)
+    bound = limit * abs(total)
+    if abs(difference - bound) > 1e-9 * max(1.0, bound):
+        return difference <= bound
+    exact_total = Decimal(total_num['normalized'])
+    exact_difference = abs(Decimal(qty_num['normalized']) * Decimal(price_num['normalized']) - exact_total)
+    return exact_difference / abs(exact_total) <= limit
+
+
+@functools.lru_cache(maxsize=4096)
+def _description_pricing_type(desc_lower: str) -> Optional[str]:
+    """Pricing type named by a lowercased description's keywords, if any."""
+    # Time-based pricing indicators
+    if _HOURLY_KEYWORD_PATTERN.search(desc_lower):
+        return 'hourly'
+    
+    # Area-based pricing indicators  
+    if _AREA_KEYWORD_PATTERN.search(desc_lower):
+        return 'area'
+        
+    # Weight-based pricing indicators
+    if _WEIGHT_KEYWORD_PATTERN.search(desc_lower):
+        return 'weight'
+        
+    # Volume-based pricing indicators
+    if _VOLUME_KEYWORD_PATTERN.search(desc_lower):
+        return 'volume'
+    
+    return None
+
 
 class AdaptivePDFParser:
     """Truly adaptive parser that learns document structure dynamically."""
     
-    def __init__(self):
+    # A text layer with more than this many non-whitespace characters (and
+    # no CID sequences) is used as-is instead of OCR'ing the rendered pages
+    MIN_TEXT_LAYER_CHARS = 50
+    
+    # Pages are rendered as 8-bit grayscale PGM at OCR_DPI: plenty for typed
+    # text, far fewer pixels than 300 DPI colour, and no PNG compression
+    OCR_DPI = 200
+    
+    # Lines whose extracted numbers are remembered; the same lines are
+    # scanned by the structure analysis, region extraction and every strategy
+    NUMBERS_CACHE_SIZE = 4096
+    
+    # For documents laid out as a table (see _classify_layout) the table
+    # strategy's result is accepted from this confidence on, without trying
+    # the weaker strategies
+    TABLE_LAYOUT_CONFIDENCE = 60
+    
+    # A strategy result with at least CONSISTENT_MIN_ITEMS line items, of
+    # which at least CONSISTENT_ITEM_RATE satisfy quantity x unit price =
+    # cost, is trusted without trying the remaining strategies
+    CONSISTENT_MIN_ITEMS = 3
+    CONSISTENT_ITEM_RATE = 0.95
+    
+    # Parse results remembered by PDF content hash
+    RESULT_CACHE_SIZE = 128
+    
+    def __init__(self, n_jobs: Optional[int] = None, parallel_strategies: bool = False):
+        """
+        Args:
+            n_jobs: Number of pages to OCR at once (default: one per CPU core)
+            parallel_strategies: Run the parsing strategies of
+                parse_quote_robust concurrently instead of one by one
+        """
         self.learned_patterns = {}
         self.document_structure = {}
-        
+        self.n_jobs = max(1, n_jobs or os.cpu_count() or 1)
+        self.parallel_strategies = parallel_strategies
+        # tesserocr APIs reused across pages and documents, one per OCR worker
+        self._tesserocr_pool = TesserocrAPIPool(self.n_jobs)
+        self._tesserocr_pool_finalizer = weakref.finalize(self, self._tesserocr_pool.close)
+        # _extract_all_numbers results keyed by line text (treat as read-only)
+        self._numbers_cache: Dict[str, List[Dict[str, Any]]] = {}
+        # _scan_line_prices results keyed by line text (treat as read-only)
+        self._line_prices_cache: Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+        # (text, _content_lines(text)) for the last document split, which
+        # every strategy of the cascade asks for again
+        self._last_content_lines: Optional[Tuple[str, List[str]]] = None
+        # parse_quote results keyed by the PDF's SHA-256 (copied on the way
+        # in and out, since callers own the dicts they get back)
+        self._result_cache: Dict[str, Dict[str, Any]] = {}
+    
+    def close(self) -> None:
+        """Release the tesserocr APIs held by this parser."""
+        self._tesserocr_pool_finalizer()
+    
     def extract_text_with_ocr(self, pdf_path: str) -> str:
-        """Extract text from PDF using OCR or direct extraction."""
+        """
+        Extract text from PDF using direct extraction or OCR.
+        
+        Digital PDFs carry a text layer that is read in milliseconds, so OCR
+        only runs when that layer is missing, too short or CID garbage.
+        """
+        try:
+            text = self._extract_text_directly(pdf_path)
+        except Exception as e:
+            logger.warning(f"Direct text extraction failed: {e}")
+            text = ""
+        
+        if self._has_usable_text_layer(text):
+            return text
+        
         try:
             return self._extract_with_ocr_tools(pdf_path)
         except Exception as e:
             logger.warning(f"OCR extraction failed: {e}")
-            return self._extract_text_directly(pdf_path)
+            return text
+    
+    def _has_usable_text_layer(self, text: str) -> bool:
+        """Check whether directly extracted text is substantial and not CID garbage."""
+        if 'cid:' in text:
+            return False
+        return len(_WHITESPACE_RUN_PATTERN.sub('', text)) > self.MIN_TEXT_LAYER_CHARS
     
     def _extract_with_ocr_tools(self, pdf_path: str) -> str:
         """Extract text using external OCR tools."""
@@ -41,48 +383,109 @@ class AdaptivePDFParser:
             # Convert PDF to images
             image_path = os.path.join(temp_dir, "page")
             subprocess.run([
-                'pdftoppm', '-png', '-r', '300', pdf_path, image_path
+                'pdftoppm', '-gray', '-r', str(self.OCR_DPI), pdf_path, image_path
             ], check=True)
             
-            # Extract text from each image
-            all_text = ""
-            page_num = 1
+            # Extract text from each image, several pages at once. Tesseract
+            # does its work outside the GIL, so threads scale with cores.
+            # With tesserocr each thread loads the model once and reuses it.
+            ocr_page = self._ocr_with_api if TESSEROCR_AVAILABLE else self._ocr_with_subprocess
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                page_texts = list(executor.map(ocr_page, self._rendered_page_images(image_path)))
             
-            while True:
-                image_file = f"{image_path}-{page_num}.png"
-                if not os.path.exists(image_file):
-                    break
-                
-                result = subprocess.run([
-                    'tesseract', image_file, 'stdout', '--psm', '6'
-                ], capture_output=True, text=True, check=True)
-                
-                page_text = result.stdout.strip()
-                if page_text:
-                    all_text += f"\n=== PAGE {page_num} ===\n{page_text}\n"
-                
-                page_num += 1
-            
-            return all_text
+            return "".join(
+                f"\n=== PAGE {page_num} ===\n{page_text}\n"
+                for page_num, page_text in enumerate(page_texts, 1)
+                if page_text
+            )
+    
+    def _rendered_page_images(self, image_path: str) -> List[str]:
+        """Return the page images pdftoppm wrote for image_path, in page order."""
+        # One directory listing instead of a stat per page; pdftoppm zero-pads
+        # the page number to the page count's width (page-01, ...), so sort
+        # on its value
+        directory, prefix = os.path.split(image_path)
+        pages = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix):
+                    match = _PAGE_IMAGE_SUFFIX_PATTERN.fullmatch(entry.name, len(prefix))
+                    if match:
+                        pages.append((int(match.group(1)), entry.path))
+        pages.sort()
+        return [path for _, path in pages]
+    
+    def _ocr_with_api(self, image_file: str) -> str:
+        """OCR one page image with a pooled tesserocr API (uniform block of text)."""
+        with self._tesserocr_pool.api(['--psm', '6']) as api:
+            api.SetImageFile(image_file)
+            return api.GetUTF8Text().strip()
+    
+    def _ocr_with_subprocess(self, image_file: str) -> str:
+        """OCR one page image with a tesseract process."""
+        # Parallel pages each get a single OpenMP thread so the tesseract
+        # processes do not oversubscribe the cores
+        env = None
+        if self.n_jobs > 1:
+            env = dict(os.environ)
+            env['OMP_THREAD_LIMIT'] = '1'
+        result = subprocess.run([
+            'tesseract', image_file, 'stdout', '--psm', '6'
+        ], capture_output=True, text=True, check=True, env=env)
+        return result.stdout.strip()
     
     def _extract_text_directly(self, pdf_path: str) -> str:
-        """Extract text directly from PDF."""
+        """Extract text directly from PDF, with PyMuPDF when installed or pdfplumber."""
+        if PYMUPDF_AVAILABLE:
+            try:
+                page_texts = []
+                with fitz.open(pdf_path) as doc:
+                    for page_num, page in enumerate(doc, 1):
+                        text = page.get_text().strip()
+                        if text:
+                            page_texts.append(f"\n=== PAGE {page_num} ===\n{text}\n")
+                return "".join(page_texts)
+            except Exception as e:
+                logger.debug(f"PyMuPDF extraction failed, trying pdfplumber: {e}")
+        
         try:
             import pdfplumber
-            all_text = ""
+            page_texts = []
             with pdfplumber.open(pdf_path) as pdf:
                 for page_num, page in enumerate(pdf.pages, 1):
                     text = page.extract_text()
+                    # Drop the page's parsed layout objects now rather than
+                    # holding every page's until the document closes
+                    page.flush_cache()
                     if text:
-                        all_text += f"\n=== PAGE {page_num} ===\n{text}\n"
-            return all_text
+                        page_texts.append(f"\n=== PAGE {page_num} ===\n{text}\n")
+            return "".join(page_texts)
         except Exception as e:
             logger.error(f"Direct text extraction failed: {e}")
             raise
     
-    def analyze_document_structure(self, text: str) -> Dict[str, Any]:
-        """Analyze document structure to understand layout patterns."""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+    def _content_lines(self, text: str) -> List[str]:
+        """
+        Return the stripped, non-empty lines of text (each line stripped once).
+        
+        The list is shared between calls for the same text; treat it as
+        read-only.
+        """
+        cached = self._last_content_lines
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        lines = [line for line in (raw.strip() for raw in text.split('\n')) if line]
+        self._last_content_lines = (text, lines)
+        return lines
+    
+    def analyze_document_structure(self, text: str, lines: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Analyze document structure to understand layout patterns.
+        
+        lines may pass in _content_lines(text) when the caller already has it.
+        """
+        if lines is None:
+            lines = self._content_lines(text)
         
         structure = {
             'total_lines': len(lines),
@@ -119,91 +522,59 @@ class AdaptivePDFParser:
         """Extract prices using flexible patterns (Priority Fix #1)."""
         prices = []
         
-        # Multiple price patterns in order of reliability
-        price_patterns = [
-            r'([$€£¥][\d,]+\.?\d*)',                    # $1,234.56
-            r'([\d,]+\.?\d*)\s*(?:/EA|/EACH|each|per)',  # 123.45 /EA
-            r'([\d,]+\.?\d*)\s*(?:USD|EUR|GBP|CAD)',     # 123.45 USD
-            r'([\d,]+\.?\d*)(?=\s*$)',                   # Numbers at line end
-            r'([\d,]+\.\d{2})',                          # Decimal currency format
-            r'([\d,]+\.?\d*)'                            # Any decimal number
-        ]
-        
-        for pattern in price_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                raw_value = match.group(1)
-                start_pos = match.start()
-                end_pos = match.end()
-                
-                # Get context for classification
-                context_start = max(0, start_pos - 15)
-                context_end = min(len(text), end_pos + 15)
-                context = text[context_start:context_end].lower()
-                
-                normalized = self._normalize_number(raw_value)
-                if normalized:
-                    prices.append({
-                        'raw': raw_value,
-                        'normalized': normalized,
-                        'position': (start_pos, end_pos),
-                        'context': context,
-                        'is_currency': True,
-                        'confidence': self._calculate_price_confidence(raw_value, context)
-                    })
-        
-        # Remove duplicates and sort by confidence
-        seen_positions = set()
-        unique_prices = []
-        for price in sorted(prices, key=lambda x: x['confidence'], reverse=True):
-            if price['position'] not in seen_positions:
-                unique_prices.append(price)
-                seen_positions.add(price['position'])
-        
-        return unique_prices
-    
-    def _calculate_price_confidence(self, raw_value: str, context: str) -> float:
-        """Calculate confidence score for price detection."""
-        confidence = 0.5  # Base confidence
-        
-        # Higher confidence for currency symbols
-        if any(symbol in raw_value for symbol in ['$', '€', '£', '¥']):
-            confidence += 0.3
+        # A single scan yields non-overlapping matches, so every price
+        # position is unique and needs no deduplication
+        for match in _PRICE_PATTERN.finditer(text):
+            raw_value = match.group(match.lastgroup)
+            start_pos = match.start()
+            end_pos = match.end()
             
-        # Higher confidence for price-related context
-        price_keywords = ['price', 'cost', 'total', 'amount', 'rate', 'fee', 'charge']
-        if any(keyword in context for keyword in price_keywords):
-            confidence += 0.2
-            
-        # Higher confidence for proper decimal format
-        if '.' in raw_value and len(raw_value.split('.')[-1]) == 2:
-            confidence += 0.2
-            
-        # Lower confidence for very small or large numbers
-        try:
-            value = float(self._normalize_number(raw_value) or 0)
-            if 0.01 <= value <= 100000:
-                confidence += 0.1
-            elif value > 100000:
-                confidence -= 0.2
-        except:
-            pass
+            # Get context for classification
+            context_start = max(0, start_pos - 15)
+            context_end = min(len(text), end_pos + 15)
+            context = text[context_start:context_end].lower()
             
-        return min(confidence, 1.0)
+            normalized = self._normalize_number(raw_value)
+            if normalized:
+                prices.append({
+                    'raw': raw_value,
+                    'normalized': normalized,
+                    'position': (start_pos, end_pos),
+                    'context': context,
+                    'is_currency': True,
+                    'confidence': self._calculate_price_confidence(raw_value, context, normalized)
+                })
+        
+        # Sort by confidence, in place since the list is ours
+        prices.sort(key=itemgetter('confidence'), reverse=True)
+        return prices
+    
+    def _calculate_price_confidence(self, raw_value: str, context: str,
+                                    normalized: Optional[str] = None) -> float:
+        """
+        Calculate confidence score for price detection.
+        
+        normalized is raw_value already run through _normalize_number, when
+        the caller has it.
+        """
+        if normalized is None:
+            normalized = self._normalize_number(raw_value)
+        return _price_confidence(raw_value, bool(_PRICE_KEYWORD_PATTERN.search(context)), normalized)
 
     def _extract_all_numbers(self, text: str) -> List[Dict[str, Any]]:
         """Extract all numbers with their positions and context."""
-        numbers = []
+        cached = self._numbers_cache.get(text)
+        if cached is not None:
+            return cached
         
-        # Various number patterns
-        patterns = [
-            r'(-?\$?[\d,]+\.?\d*%?)',  # Basic numbers with optional currency/percent
-            r'(-?\d+\.?\d*e[+-]?\d+)',  # Scientific notation
-            r'(-?\d+/\d+)',  # Fractions
-            r'(-?\d+:\d+)',  # Ratios/time
-        ]
+        numbers = []
+        if not _NUMBER_CHAR_PATTERN.search(text):
+            return numbers
         
-        for pattern in patterns:
-            for match in re.finditer(pattern, text):
+        for pattern, marker in _NUMBER_PATTERNS:
+            if marker is not None and marker not in text:
+                continue
+            for match in pattern.finditer(text):
                 raw_value = match.group(1)
                 start_pos = match.start()
                 end_pos = match.end()
@@ -212,6 +583,7 @@ class AdaptivePDFParser:
                 context_start = max(0, start_pos - 10)
                 context_end = min(len(text), end_pos + 10)
                 context = text[context_start:context_end]
+                context_lower = context.lower()
                 
                 # Try to normalize the number
                 normalized = self._normalize_number(raw_value)
@@ -219,52 +591,26 @@ class AdaptivePDFParser:
                 numbers.append({
                     'raw': raw_value,
                     'normalized': normalized,
+                    # Float copy for the arithmetic checks, which only need
+                    # percent-level tolerance rather than exact decimals
+                    'value': float(normalized) if normalized else None,
                     'position': (start_pos, end_pos),
                     'context': context,
-                    'is_currency': '$' in raw_value or any(word in context.lower() for word in ['price', 'cost', 'total', 'amount']),
-                    'is_quantity': any(word in context.lower() for word in ['qty', 'quantity', 'pcs', 'each', 'ea']),
+                    'is_currency': '$' in raw_value or bool(_CURRENCY_CONTEXT_PATTERN.search(context_lower)),
+                    'is_quantity': bool(_QUANTITY_CONTEXT_PATTERN.search(context_lower)),
                     'is_percentage': '%' in raw_value
                 })
         
+        if len(self._numbers_cache) >= self.NUMBERS_CACHE_SIZE:
+            self._numbers_cache.clear()
+        self._numbers_cache[text] = numbers
         return numbers
     
     def _normalize_number(self, raw_value: str) -> Optional[str]:
         """Improved number normalization handling international formats."""
         if not raw_value:
             return None
-            
-        try:
-            # Remove currency symbols, text, and extra whitespace
-            cleaned = re.sub(r'[^\d,.-]', '', str(raw_value).strip())
-            
-            if not cleaned:
-                return None
-            
-            # Handle European format (1.234,56) vs US format (1,234.56)
-            if ',' in cleaned and '.' in cleaned:
-                # Determine format by position of last comma vs last dot
-                last_comma = cleaned.rfind(',')
-                last_dot = cleaned.rfind('.')
-                
-                if last_comma > last_dot:
-                    # European: 1.234,56 -> 1234.56
-                    cleaned = cleaned.replace('.', '').replace(',', '.')
-                else:
-                    # US: 1,234.56 -> 1234.56
-                    cleaned = cleaned.replace(',', '')
-            elif ',' in cleaned and len(cleaned.split(',')[-1]) <= 2:
-                # European decimal: 123,45 -> 123.45
-                cleaned = cleaned.replace(',', '.')
-            else:
-                # Remove commas (thousands separators)
-                cleaned = cleaned.replace(',', '')
-            
-            # Validate and convert
-            value = Decimal(cleaned)
-            return str(value.quantize(Decimal('0.01')))
-            
-        except (InvalidOperation, ValueError, TypeError):
-            return None
+        return _normalize_number_text(str(raw_value))
     
     def _detect_column_patterns(self, lines: List[str]) -> Dict[str, Any]:
         """Detect potential columnar layouts in the document."""
@@ -274,16 +620,14 @@ class AdaptivePDFParser:
             'alignment_patterns': []
         }
         
-        # Look for consistent spacing patterns that suggest columns
-        tab_positions = []
-        for line in lines:
-            # Find positions of multiple consecutive spaces (potential column separators)
-            for match in re.finditer(r'\s{2,}', line):
-                tab_positions.append(match.start())
+        # Look for consistent spacing patterns that suggest columns: count the
+        # positions of multiple consecutive spaces (potential column separators)
+        position_counts = Counter(
+            match.start() for line in lines for match in _COLUMN_GAP_PATTERN.finditer(line)
+        )
         
         # Find common tab positions
-        if tab_positions:
-            position_counts = Counter(tab_positions)
+        if position_counts:
             common_positions = [pos for pos, count in position_counts.most_common(5) if count >= 3]
             column_info['column_positions'] = common_positions
             column_info['detected_columns'] = len(common_positions) + 1
@@ -324,44 +668,28 @@ class AdaptivePDFParser:
         """Check if line contains pricing data indicators."""
         # Skip obvious header/footer lines
         line_lower = line.lower()
-        skip_indicators = [
-            'total:', 'subtotal:', 'tax:', 'shipping:', 'discount:',
-            'phone:', 'email:', 'address:', 'thank you', 'terms',
-            'conditions', 'payment', 'due date', 'valid until'
-        ]
-        
-        if any(skip in line_lower for skip in skip_indicators):
+        if _SKIP_INDICATOR_PATTERN.search(line_lower):
             return False
         
         # Look for numeric patterns that suggest pricing
-        numbers = re.findall(r'[\d,]+\.?\d*', line)
+        numbers = _NUMBER_TOKEN_PATTERN.findall(line)
         
         # Need at least 2 numbers
         if len(numbers) < 2:
             return False
             
         # Check for price-like patterns
-        has_currency = any(symbol in line for symbol in ['$', '€', '£', '¥'])
+        has_currency = bool(_CURRENCY_SYMBOL_PATTERN.search(line))
         has_decimal_price = any('.' in num and len(num.split('.')[-1]) <= 2 for num in numbers)
-        has_quantity_indicator = any(word in line_lower for word in ['qty', 'quantity', 'pcs', 'ea', 'each', 'units'])
+        has_quantity_indicator = bool(_QUANTITY_INDICATOR_PATTERN.search(line_lower))
         
         # More likely to be pricing data if it has these characteristics
         return has_currency or has_decimal_price or (len(numbers) >= 3 and has_quantity_indicator)
     
     def extract_quantity_flexible(self, text_section: str) -> str:
         """Flexible quantity detection with multiple fallbacks (Priority Fix #3)."""
-        qty_patterns = [
-            r'(?:qty|quantity|amount|count):\s*(\d+)',     # Qty: 5
-            r'(?:qty|quantity|amount|count)\s+(\d+)',      # Qty 5
-            r'(\d+)\s*(?:pieces?|units?|ea|each|pcs)',     # 5 pieces
-            r'^(\d+)\s+',                                  # Number at start of line
-            r'(\d+)(?=\s*[×x])',                          # 5 x item
-            r'(\d+)(?=\s*[@])',                           # 5 @ $10.00
-            r'(\d+)(?=\s*\$)',                            # 5 $10.00
-        ]
-        
-        for pattern in qty_patterns:
-            match = re.search(pattern, text_section, re.IGNORECASE)
+        for pattern in _QUANTITY_PATTERNS:
+            match = pattern.search(text_section)
             if match:
                 qty_val = int(match.group(1))
                 # Validate reasonable quantity range
@@ -369,7 +697,7 @@ class AdaptivePDFParser:
                     return str(qty_val)
         
         # Fallback: look for standalone numbers in reasonable range
-        numbers = re.findall(r'\b(\d+)\b', text_section)
+        numbers = _STANDALONE_INTEGER_PATTERN.findall(text_section)
         for num_str in numbers:
             try:
                 num_val = int(num_str)
@@ -395,7 +723,7 @@ class AdaptivePDFParser:
                     regions.append(current_region)
                 
                 current_region = {
-                    'type': self._classify_region_type(line_characteristics),
+                    'type': self._classify_region_type(line_characteristics, line.lower()),
                     'start_line': i,
                     'lines': [line],
                     'characteristics': line_characteristics
@@ -421,17 +749,21 @@ class AdaptivePDFParser:
     
     def _analyze_line_characteristics(self, line: str) -> Dict[str, Any]:
         """Analyze characteristics of a single line."""
+        # Digit tests look at the first/last non-space character directly
+        # (str.isdecimal is what regex \d matches) rather than running a
+        # regex that retries from every position of the line
+        stripped = line.strip()
         characteristics = {
             'length': len(line),
             'word_count': len(line.split()),
             'number_count': len(self._extract_all_numbers(line)),
-            'has_currency': any(symbol in line for symbol in ['$', '€', '£', '¥']),
+            'has_currency': bool(_CURRENCY_SYMBOL_PATTERN.search(line)),
             'has_percentage': '%' in line,
             'has_colon': ':' in line,
-            'all_caps': line.isupper() and len(line) > 5,
-            'starts_with_number': bool(re.match(r'^\s*\d', line)),
-            'ends_with_number': bool(re.search(r'\d\s*$', line)),
-            'punctuation_density': len(re.findall(r'[^\w\s]', line)) / len(line) if line else 0
+            'all_caps': len(line) > 5 and line.isupper(),
+            'starts_with_number': stripped[:1].isdecimal(),
+            'ends_with_number': stripped[-1:].isdecimal(),
+            'punctuation_density': len(_PUNCTUATION_PATTERN.findall(line)) / len(line) if line else 0
         }
         
         return characteristics
@@ -449,15 +781,20 @@ class AdaptivePDFParser:
             (current_char['has_currency'] and not previous_char.get('has_currency', False))
         )
     
-    def _classify_region_type(self, characteristics: Dict[str, Any]) -> str:
-        """Classify the type of document region based on characteristics."""
+    def _classify_region_type(self, characteristics: Dict[str, Any], text: str = '') -> str:
+        """
+        Classify the type of document region based on characteristics.
+        
+        text is the lowercased line that starts the region; it is checked for
+        total keywords.
+        """
         if characteristics['all_caps'] and characteristics['word_count'] < 10:
             return 'header'
         elif characteristics['number_count'] >= 2 and characteristics['has_currency']:
             return 'line_items'  # Lowered threshold from 3 to 2 numbers
         elif characteristics['number_count'] >= 3:  # Multiple numbers even without currency
             return 'line_items'
-        elif characteristics['has_currency'] and any(word in ['total', 'subtotal', 'sum'] for word in ['total', 'subtotal', 'sum']):
+        elif characteristics['has_currency'] and ('total' in text or 'sum' in text):  # "total" also covers "subtotal"
             return 'totals'
         elif characteristics['has_colon']:
             return 'metadata'
@@ -466,11 +803,13 @@ class AdaptivePDFParser:
     
     def discover_line_items_adaptively(self, text: str) -> List[LineItem]:
         """Discover line items using adaptive pattern recognition."""
+        # Split once and share the lines with the structure analysis
+        lines = self._content_lines(text)
+        
         # First analyze the document structure
-        structure = self.analyze_document_structure(text)
+        structure = self.analyze_document_structure(text, lines)
         
         line_items = []
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
         
         # Focus on regions likely to contain line items, but be more inclusive
         line_item_regions = [region for region in structure['text_regions'] 
@@ -527,87 +866,83 @@ class AdaptivePDFParser:
                 # Try to infer quantity from other numbers
                 for num in numbers:
                     if num not in currency_candidates:
-                        normalized = num.get('normalized')
-                        if normalized:
-                            try:
-                                qty_val = float(normalized)
-                                if 1 <= qty_val <= 10000:  # Reasonable quantity range
-                                    quantity = num
-                                    break
-                            except ValueError:
-                                continue
+                        qty_val = num.get('value')
+                        if qty_val is not None and 1 <= qty_val <= 10000:  # Reasonable quantity range
+                            quantity = num
+                            break
             
             if quantity and unit_price and total:
                 # Validate the math
-                try:
-                    qty_val = Decimal(quantity['normalized'])
-                    price_val = Decimal(unit_price['normalized'])
-                    total_val = Decimal(total['normalized'])
-                    
-                    expected_total = qty_val * price_val
-                    tolerance = abs(expected_total - total_val) / abs(total_val) if total_val != 0 else 1
-                    
-                    if tolerance <= 0.15:  # Allow 15% tolerance for rounding differences
-                        description = self._extract_description_adaptively(line, [quantity, unit_price, total])
-                        if description and len(description.strip()) > 2:
-                            return LineItem(
-                                description=description.strip(),
-                                quantity=quantity['normalized'],
-                                unit_price=unit_price['normalized'],
-                                cost=total['normalized']
-                            )
-                except (InvalidOperation, ValueError, ZeroDivisionError):
-                    pass
+                # Allow 15% tolerance for rounding differences
+                if (quantity.get('value') is not None and unit_price.get('value') is not None
+                        and total.get('value') and _within_tolerance(quantity, unit_price, total, 0.15)):
+                    description = self._extract_description_adaptively(line, [quantity, unit_price, total])
+                    if description and len(description.strip()) > 2:
+                        return LineItem(
+                            description=description.strip(),
+                            quantity=quantity['normalized'],
+                            unit_price=unit_price['normalized'],
+                            cost=total['normalized']
+                        )
         
         # Strategy 2: Mathematical validation approach
-        # Try all possible combinations of 3 numbers and see which ones satisfy qty * price = total
+        # Look for three numbers that satisfy qty * price = total
         if len(numbers) >= 3:
-            for i in range(len(numbers)):
-                for j in range(i+1, len(numbers)):
-                    for k in range(j+1, len(numbers)):
-                        num_combo = [numbers[i], numbers[j], numbers[k]]
-                        line_item = self._try_mathematical_validation(line, num_combo)
-                        if line_item:
-                            return line_item
+            line_item = self._try_mathematical_validation(line, numbers)
+            if line_item:
+                return line_item
         
         # Strategy 3: Pattern-based fallback
         return self._pattern_based_extraction(line, numbers)
     
     def _try_mathematical_validation(self, line: str, numbers: List[Dict[str, Any]]) -> Optional[LineItem]:
-        """Try to validate line item using mathematical relationships."""
-        # Try all permutations of the three numbers as qty, unit_price, total
-        from itertools import permutations
-        
-        for perm in permutations(numbers):
-            qty_num, price_num, total_num = perm
+        """
+        Try to validate line item using mathematical relationships.
+        
+        Each ordered (quantity, unit price) pair implies a total; numbers
+        within tolerance of it are found by binary search over the sorted
+        values instead of permuting every combination of three numbers.
+        Earlier numbers on the line are preferred as the quantity.
+        """
+        candidates = [num for num in numbers if num['normalized']]
+        by_value = sorted(candidates, key=lambda num: num['value'])
+        values = [num['value'] for num in by_value]
+        
+        for qty_num in candidates:
+            qty = qty_num['value']
+            # Validate quantity is reasonable
+            if not (0.1 <= qty <= 10000):
+                continue
             
-            try:
-                if not qty_num['normalized'] or not price_num['normalized'] or not total_num['normalized']:
+            for price_num in candidates:
+                price = price_num['value']
+                if price_num is qty_num or price == 0:
                     continue
-                    
-                qty = Decimal(qty_num['normalized'])
-                price = Decimal(price_num['normalized'])
-                total = Decimal(total_num['normalized'])
                 
-                # Validate quantity is reasonable
-                if not (0.1 <= qty <= 10000):
-                    continue
-                    
-                # Check if qty * price ≈ total
+                # |qty * price - total| <= 10% of |total| bounds the total to
+                # [expected / 1.1, expected / 0.9] (same sign as expected).
+                # Slightly widened for float error; the exact check follows.
                 expected_total = qty * price
-                tolerance = abs(expected_total - total) / abs(total) if total != 0 else 1
+                low, high = sorted((expected_total / 1.1, expected_total / 0.9))
+                margin = 1e-9 * max(1.0, abs(low), abs(high))
+                in_range = by_value[bisect_left(values, low - margin):bisect_right(values, high + margin)]
                 
-                if tolerance <= 0.1:  # Within 10% tolerance
-                    description = self._extract_description_adaptively(line, list(perm))
+                for total_num in sorted(in_range, key=lambda num: abs(num['value'] - expected_total)):
+                    total = total_num['value']
+                    if total_num is qty_num or total_num is price_num or total == 0:
+                        continue
+                    if not _within_tolerance(qty_num, price_num, total_num, 0.1):
+                        continue
+                    
+                    description = self._extract_description_adaptively(line, [qty_num, price_num, total_num])
                     if description and len(description.strip()) > 2:
+                        # The normalized strings are what Decimal would have printed
                         return LineItem(
                             description=description.strip(),
-                            quantity=str(qty),
-                            unit_price=str(price),
-                            cost=str(total)
+                            quantity=qty_num['normalized'],
+                            unit_price=price_num['normalized'],
+                            cost=total_num['normalized']
                         )
-            except (InvalidOperation, ValueError, ZeroDivisionError):
-                continue
         
         return None
     
@@ -633,7 +968,7 @@ class AdaptivePDFParser:
                             if description and len(description.strip()) > 2:
                                 return LineItem(
                                     description=description.strip(),
-                                    quantity=str(qty.quantize(Decimal('0.01'))),
+                                    quantity=str(qty.quantize(_CENT)),
                                     unit_price=str(price),
                                     cost=str(total)
                                 )
@@ -644,16 +979,20 @@ class AdaptivePDFParser:
     
     def _extract_description_adaptively(self, line: str, used_numbers: List[Dict[str, Any]]) -> str:
         """Extract description by removing the used numbers from the line."""
-        description = line
-        
-        # Remove the used numbers from the line to get description
-        for num in sorted(used_numbers, key=lambda x: x['position'][1], reverse=True):
-            start, end = num['position']
-            description = description[:start] + description[end:]
+        # Remove the used numbers from the line to get description, keeping
+        # the text between their spans and joining it once
+        parts = []
+        pos = 0
+        for start, end in sorted(num['position'] for num in used_numbers):
+            if start > pos:
+                parts.append(line[pos:start])
+            pos = max(pos, end)
+        parts.append(line[pos:])
+        description = ''.join(parts)
         
         # Clean up the description
-        description = re.sub(r'\s+', ' ', description).strip()
-        description = re.sub(r'^[^\w]+|[^\w]+$', '', description)  # Remove leading/trailing non-word chars
+        description = _WHITESPACE_RUN_PATTERN.sub(' ', description).strip()
+        description = _EDGE_NON_WORD_PATTERN.sub('', description)  # Remove leading/trailing non-word chars
         
         return description
     
@@ -695,27 +1034,53 @@ class AdaptivePDFParser:
         
         best_result = None
         best_confidence = 0
+        layout = self._classify_layout(text)
         
-        for strategy in strategies:
-            try:
-                logger.info(f"Trying strategy: {strategy.__name__}")
-                result = strategy(text)
-                confidence = self.calculate_confidence(result)
-                
-                logger.info(f"Strategy {strategy.__name__} confidence: {confidence:.1f}%")
-                
-                if confidence > best_confidence:
-                    best_result = result
-                    best_confidence = confidence
+        # Concurrent strategies are still weighed in the order above, so the
+        # chosen result does not depend on which finishes first
+        executor = ThreadPoolExecutor(max_workers=len(strategies)) if self.parallel_strategies else None
+        futures = [executor.submit(strategy, text) for strategy in strategies] if executor else None
+        
+        try:
+            for index, strategy in enumerate(strategies):
+                try:
+                    logger.info(f"Trying strategy: {strategy.__name__}")
+                    result = futures[index].result() if futures else strategy(text)
+                    confidence = self.calculate_confidence(result)
                     
-                # If we get high confidence, stop trying
-                if confidence > 80:
-                    logger.info(f"High confidence achieved ({confidence:.1f}%), stopping")
-                    break
+                    logger.info(f"Strategy {strategy.__name__} confidence: {confidence:.1f}%")
                     
-            except Exception as e:
-                logger.warning(f"Strategy {strategy.__name__} failed: {e}")
-                continue
+                    if confidence > best_confidence:
+                        best_result = result
+                        best_confidence = confidence
+                        
+                    # If we get high confidence, stop trying
+                    if confidence > 80:
+                        logger.info(f"High confidence achieved ({confidence:.1f}%), stopping")
+                        break
+                    
+                    # A table-shaped document that the table strategy parses
+                    # reasonably well gains nothing from the line-scanning ones
+                    if (layout == 'table' and strategy == self.parse_structured_table
+                            and confidence >= self.TABLE_LAYOUT_CONFIDENCE):
+                        logger.info(f"Table layout parsed ({confidence:.1f}%), stopping")
+                        break
+                    
+                    if self._is_arithmetically_consistent(result):
+                        logger.info(f"Strategy {strategy.__name__} line items check out, stopping")
+                        break
+                        
+                except Exception as e:
+                    logger.warning(f"Strategy {strategy.__name__} failed: {e}")
+                    continue
+        finally:
+            if executor:
+                # Strategies not yet started are no longer needed; wait for
+                # running ones so they stop touching this parser's caches
+                # before the next parse on this instance
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
         
         final_result = best_result or self.create_minimal_result(text)
         
@@ -733,22 +1098,77 @@ class AdaptivePDFParser:
         
         return final_result
     
+    def _is_arithmetically_consistent(self, result: Dict[str, Any]) -> bool:
+        """Check whether enough of result's line items have quantity x unit price = cost."""
+        items = [item for group in result.get('groups', []) for item in group.get('lineItems', [])]
+        if len(items) < self.CONSISTENT_MIN_ITEMS:
+            return False
+        
+        # Stop counting as soon as the remaining items can no longer reach
+        # the required rate
+        allowed_failures = len(items) - self.CONSISTENT_ITEM_RATE * len(items)
+        failures = 0
+        for item in items:
+            try:
+                quantity = float(item.get('quantity', 1))
+                consistent = abs(quantity * float(item.get('unitPrice', 0)) - float(item.get('cost', 0))) <= 0.01
+            except (ValueError, TypeError):
+                consistent = False
+            if not consistent:
+                failures += 1
+                if failures > allowed_failures:
+                    return False
+        return True
+    
+    def _classify_layout(self, text: str) -> str:
+        """Return 'table' when text carries a column header or delimited rows, else 'unstructured'."""
+        if _TABLE_HEADER_PATTERN.search(text):
+            return 'table'
+        
+        delimited_rows = 0
+        for _ in _DELIMITED_ROW_PATTERN.finditer(text):
+            delimited_rows += 1
+            if delimited_rows >= 3:
+                return 'table'
+        return 'unstructured'
+    
     def parse_quote(self, pdf_path: str) -> Dict[str, Any]:
-        """Main parse method - uses robust multi-strategy approach."""
-        return self.parse_quote_robust(pdf_path)
+        """
+        Main parse method - uses robust multi-strategy approach.
+        
+        Results are remembered by the PDF's SHA-256, so parsing identical
+        content again skips extraction and the strategy cascade.
+        """
+        try:
+            digest = file_sha256(pdf_path)
+        except OSError as e:
+            logger.debug(f"Could not hash PDF for result cache: {e}")
+            digest = None
+        
+        if digest is not None and digest in self._result_cache:
+            logger.info("Using cached parse result for identical PDF content")
+            return copy.deepcopy(self._result_cache[digest])
+        
+        result = self.parse_quote_robust(pdf_path)
+        
+        if digest is not None:
+            if len(self._result_cache) >= self.RESULT_CACHE_SIZE:
+                self._result_cache.clear()
+            self._result_cache[digest] = copy.deepcopy(result)
+        return result
     
     def parse_quote_to_json(self, pdf_path: str, output_path: Optional[str] = None) -> str:
         """Parse quote and return JSON string."""
         result = self.parse_quote(pdf_path)
         
-        json_str = json.dumps(result, indent=2)
+        json_bytes = _dumps_json_bytes(result)
         
         if output_path:
-            with open(output_path, 'w') as f:
-                f.write(json_str)
+            with open(output_path, 'wb') as f:
+                f.write(json_bytes)
             logger.info(f"Results saved to: {output_path}")
         
-        return json_str
+        return json_bytes.decode('utf-8')
     
     # ============= BUSINESS LOGIC IMPROVEMENTS =============
     
@@ -771,14 +1191,18 @@ class AdaptivePDFParser:
                         
                         # If stated unit price is missing or significantly different, use implied
                         if stated_unit_price == 0 or abs(stated_unit_price - implied_unit) > 0.01:
-                            item['calculatedUnitPrice'] = f"{implied_unit:.2f}"
-                            item['unitPrice'] = f"{implied_unit:.2f}"
+                            unit_price_text = f"{implied_unit:.2f}"
+                            item['calculatedUnitPrice'] = unit_price_text
+                            item['unitPrice'] = unit_price_text
+                            stated_unit_price = float(unit_price_text)
                         
                         # Infer pricing type from description + math
                         item['pricingType'] = self._infer_pricing_type(description, implied_unit)
                         
                         # Add confidence indicators
-                        item['confidence'] = self._calculate_item_confidence(item)
+                        item['confidence'] = self._calculate_item_confidence(
+                            item, (quantity, stated_unit_price, total_cost)
+                        )
                         
                 except (ValueError, TypeError, ZeroDivisionError):
                     # Set defaults for problematic items
@@ -788,24 +1212,10 @@ class AdaptivePDFParser:
         return extracted_data
     
     def _infer_pricing_type(self, description: str, unit_price: float) -> str:
-        """Infer pricing type from description and unit price."""
-        desc_lower = description.lower()
-        
-        # Time-based pricing indicators
-        if any(word in desc_lower for word in ['hour', 'hr', 'time', 'labor', 'service', 'consultation']):
-            return 'hourly'
-        
-        # Area-based pricing indicators  
-        if any(word in desc_lower for word in ['sq', 'area', 'coverage', 'surface', 'sqft', 'sqm']):
-            return 'area'
-            
-        # Weight-based pricing indicators
-        if any(word in desc_lower for word in ['lb', 'kg', 'weight', 'pound', 'kilogram', 'ton']):
-            return 'weight'
-            
-        # Volume-based pricing indicators
-        if any(word in desc_lower for word in ['gallon', 'liter', 'cubic', 'volume', 'gal', 'l']):
-            return 'volume'
+        """Infer pricing type from lowercased description and unit price."""
+        pricing_type = _description_pricing_type(description)
+        if pricing_type:
+            return pricing_type
             
         # High unit price often indicates hourly/service pricing
         if unit_price > 100:
@@ -815,15 +1225,25 @@ class AdaptivePDFParser:
         else:
             return 'unit'
     
-    def _calculate_item_confidence(self, item: Dict[str, Any]) -> float:
-        """Calculate confidence score for individual line item."""
+    def _calculate_item_confidence(self, item: Dict[str, Any],
+                                   amounts: Optional[Tuple[float, float, float]] = None) -> float:
+        """
+        Calculate confidence score for individual line item.
+        
+        amounts may pass the item's quantity, unitPrice and cost as floats
+        when the caller has already parsed them.
+        """
         confidence = 0.5  # Base confidence
         
         try:
             # Mathematical consistency
-            qty = float(item.get('quantity', 1))
-            unit_price = float(item.get('unitPrice', 0))
-            total = float(item.get('cost', 0))
+            if amounts is None:
+                amounts = (
+                    float(item.get('quantity', 1)),
+                    float(item.get('unitPrice', 0)),
+                    float(item.get('cost', 0)),
+                )
+            qty, unit_price, total = amounts
             
             if abs(qty * unit_price - total) <= 0.01:
                 confidence += 0.3
@@ -844,34 +1264,31 @@ class AdaptivePDFParser:
     
     def apply_industry_heuristics(self, quote_data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply industry-specific rules (Business Logic #2)."""
-        # Analyze the overall quote to determine likely industry
-        all_descriptions = []
+        # Analyze the overall quote to determine likely industry; the
+        # lowercased descriptions are shared with the rules below
+        descriptions_lower = []
         for group in quote_data.get('groups', []):
             for item in group.get('lineItems', []):
-                all_descriptions.append(item.get('description', ''))
+                descriptions_lower.append(item.get('description', '').lower())
         
-        all_text = ' '.join(all_descriptions).lower()
+        all_text = ' '.join(descriptions_lower)
         
         # Industry keyword detection
-        manufacturing_keywords = ['part', 'component', 'machining', 'fabrication', 'cnc', 'assembly', 'bracket', 'widget', 'motor']
-        service_keywords = ['labor', 'consultation', 'service', 'support', 'training', 'maintenance', 'installation']
-        material_keywords = ['steel', 'aluminum', 'plastic', 'lumber', 'concrete', 'fabric', 'raw material']
-        
         industry_type = 'general'
-        if any(kw in all_text for kw in manufacturing_keywords):
+        if _MANUFACTURING_KEYWORD_PATTERN.search(all_text):
             industry_type = 'manufacturing'
-        elif any(kw in all_text for kw in service_keywords):
+        elif _SERVICE_KEYWORD_PATTERN.search(all_text):
             industry_type = 'service'
-        elif any(kw in all_text for kw in material_keywords):
+        elif _MATERIAL_KEYWORD_PATTERN.search(all_text):
             industry_type = 'material'
         
         # Apply industry-specific rules
         if industry_type == 'manufacturing':
             quote_data = self.apply_manufacturing_rules(quote_data)
         elif industry_type == 'service':
-            quote_data = self.apply_service_rules(quote_data)
+            quote_data = self.apply_service_rules(quote_data, descriptions_lower)
         elif industry_type == 'material':
-            quote_data = self.apply_material_rules(quote_data)
+            quote_data = self.apply_material_rules(quote_data, descriptions_lower)
         
         # Add industry classification to summary
         if 'summary' not in quote_data:
@@ -882,55 +1299,82 @@ class AdaptivePDFParser:
     
     def apply_manufacturing_rules(self, quote_data: Dict[str, Any]) -> Dict[str, Any]:
         """Apply manufacturing-specific business rules."""
-        for group in quote_data.get('groups', []):
-            for item in group.get('lineItems', []):
-                desc = item.get('description', '').lower()
-                
-                # Manufacturing items often have part numbers
-                if re.search(r'[A-Z0-9]+-[A-Z0-9]+', item.get('description', '')):
-                    item['hasPartNumber'] = True
-                
-                # Common manufacturing pricing expectations
-                unit_price = float(item.get('unitPrice', 0))
-                if unit_price > 500:
-                    item['note'] = 'High-value component or assembly'
-                elif unit_price < 1:
-                    item['note'] = 'Low-cost component or fastener'
+        items = [item for group in quote_data.get('groups', []) for item in group.get('lineItems', [])]
+        
+        # Manufacturing items often have part numbers; find them in one scan
+        # over all descriptions, NUL-separated so no match spans two items,
+        # and map each match back to its item by offset
+        descriptions = [item.get('description', '') for item in items]
+        item_starts = []
+        offset = 0
+        for description in descriptions:
+            item_starts.append(offset)
+            offset += len(description) + 1
+        part_number_items = {
+            bisect_right(item_starts, match.start()) - 1
+            for match in _PART_NUMBER_PATTERN.finditer('\x00'.join(descriptions))
+        }
+        
+        for index, item in enumerate(items):
+            if index in part_number_items:
+                item['hasPartNumber'] = True
+            
+            # Common manufacturing pricing expectations
+            unit_price = float(item.get('unitPrice', 0))
+            if unit_price > 500:
+                item['note'] = 'High-value component or assembly'
+            elif unit_price < 1:
+                item['note'] = 'Low-cost component or fastener'
         
         return quote_data
     
-    def apply_service_rules(self, quote_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply service-specific business rules."""
-        for group in quote_data.get('groups', []):
-            for item in group.get('lineItems', []):
-                desc = item.get('description', '').lower()
-                unit_price = float(item.get('unitPrice', 0))
-                
-                # Service pricing is often hourly
-                if any(word in desc for word in ['hour', 'labor', 'service']):
-                    if 25 <= unit_price <= 300:
-                        item['note'] = 'Standard hourly rate'
-                    elif unit_price > 300:
-                        item['note'] = 'Premium/specialist rate'
-                    elif unit_price < 25:
-                        item['note'] = 'Low hourly rate - verify'
+    def _items_with_lowered_descriptions(self, quote_data: Dict[str, Any],
+                                         descriptions_lower: Optional[List[str]]):
+        """Pair each line item with its lowercased description, lowercasing only when not given."""
+        items = [item for group in quote_data.get('groups', []) for item in group.get('lineItems', [])]
+        if descriptions_lower is None:
+            return ((item, item.get('description', '').lower()) for item in items)
+        return zip(items, descriptions_lower)
+    
+    def apply_service_rules(self, quote_data: Dict[str, Any],
+                            descriptions_lower: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Apply service-specific business rules.
+        
+        descriptions_lower may pass the line items' lowercased descriptions,
+        in order, when the caller already has them.
+        """
+        for item, desc in self._items_with_lowered_descriptions(quote_data, descriptions_lower):
+            unit_price = float(item.get('unitPrice', 0))
+            
+            # Service pricing is often hourly
+            if _SERVICE_RATE_KEYWORD_PATTERN.search(desc):
+                if 25 <= unit_price <= 300:
+                    item['note'] = 'Standard hourly rate'
+                elif unit_price > 300:
+                    item['note'] = 'Premium/specialist rate'
+                elif unit_price < 25:
+                    item['note'] = 'Low hourly rate - verify'
         
         return quote_data
     
-    def apply_material_rules(self, quote_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply material-specific business rules."""
-        for group in quote_data.get('groups', []):
-            for item in group.get('lineItems', []):
-                desc = item.get('description', '').lower()
-                
-                # Material pricing often per weight/area
-                if any(unit in desc for unit in ['lb', 'kg', 'sqft', 'sqm']):
-                    item['note'] = 'Priced per unit of measure'
-                
-                # High quantity materials are common
-                qty = float(item.get('quantity', 1))
-                if qty > 100:
-                    item['note'] = 'Bulk material order'
+    def apply_material_rules(self, quote_data: Dict[str, Any],
+                             descriptions_lower: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Apply material-specific business rules.
+        
+        descriptions_lower may pass the line items' lowercased descriptions,
+        in order, when the caller already has them.
+        """
+        for item, desc in self._items_with_lowered_descriptions(quote_data, descriptions_lower):
+            # Material pricing often per weight/area
+            if _MEASURED_UNIT_KEYWORD_PATTERN.search(desc):
+                item['note'] = 'Priced per unit of measure'
+            
+            # High quantity materials are common
+            qty = float(item.get('quantity', 1))
+            if qty > 100:
+                item['note'] = 'Bulk material order'
         
         return quote_data
     
@@ -948,13 +1392,24 @@ class AdaptivePDFParser:
         r'(\d+\.?\d*)\s*/\s*(?:lb|kg)',                # $5/lb
         r'(\d+\.?\d*)\s*(?:/|per)\s*(?:sq\s*ft|sqft)'  # $10/sqft
     ]
+    _CORE_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in CORE_PATTERNS]
+    # Every core pattern needs one of these literals, so a line without any
+    # of them is rejected in one scan instead of ten
+    _CORE_MARKER_PATTERN = re.compile(r'/|per|unit|rate|dollar|usd|@|each', re.IGNORECASE)
     
-    def extract_unit_prices_with_core_patterns(self, text: str) -> List[Dict[str, Any]]:
-        """Extract unit prices using the 80/20 core patterns."""
+    def extract_unit_prices_with_core_patterns(self, text: str, top_n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Extract unit prices using the 80/20 core patterns.
+        
+        top_n limits the result to that many of the most confident matches
+        (default: all of them).
+        """
         unit_prices = []
+        if not self._CORE_MARKER_PATTERN.search(text):
+            return unit_prices
         
-        for i, pattern in enumerate(self.CORE_PATTERNS):
-            for match in re.finditer(pattern, text, re.IGNORECASE):
+        for i, pattern in enumerate(self._CORE_REGEXES):
+            for match in pattern.finditer(text):
                 raw_price = match.group(1)
                 normalized_price = self._normalize_number(raw_price)
                 
@@ -971,6 +1426,9 @@ class AdaptivePDFParser:
                         'pattern_used': i
                     })
         
+        if top_n is not None:
+            return heapq.nlargest(top_n, unit_prices, key=itemgetter('confidence'))
+        
         # Remove duplicates and sort by confidence
         return sorted(unit_prices, key=lambda x: x['confidence'], reverse=True)
     
@@ -999,16 +1457,17 @@ class AdaptivePDFParser:
     
     def parse_data_sections(self, text: str) -> Dict[str, Any]:
         """Strategy 2: Parse using smart data section detection."""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = self._content_lines(text)
         data_sections = self.find_data_sections(lines)
         
+        # find_data_sections only collects lines that has_pricing_data
+        # accepted, so they are not checked (and lowercased) again
         all_line_items = []
         for section in data_sections:
             for line in section:
-                if self.has_pricing_data(line):
-                    line_item = self._extract_line_item_robust(line)
-                    if line_item:
-                        all_line_items.append(line_item)
+                line_item = self._extract_line_item_robust(line)
+                if line_item:
+                    all_line_items.append(line_item)
         
         if all_line_items:
             return parse_with_domain_knowledge(all_line_items)
@@ -1016,7 +1475,7 @@ class AdaptivePDFParser:
     
     def parse_line_by_line_scanning(self, text: str) -> Dict[str, Any]:
         """Strategy 3: Scan every line for potential line items."""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = self._content_lines(text)
         line_items = []
         
         for line in lines:
@@ -1032,16 +1491,15 @@ class AdaptivePDFParser:
     def parse_keyword_extraction(self, text: str) -> Dict[str, Any]:
         """Strategy 4: Extract based on keywords and context."""
         # Focus on lines with product/service keywords
-        product_keywords = ['widget', 'assembly', 'kit', 'service', 'product', 'item', 'part', 'component']
-        lines = text.split('\n')
+        lines = self._content_lines(text)
         
         candidate_lines = []
         for line in lines:
             line_lower = line.lower()
-            if any(keyword in line_lower for keyword in product_keywords):
+            if _PRODUCT_KEYWORD_PATTERN.search(line_lower):
                 # Look for numbers in this line
-                if len(re.findall(r'[\d,]+\.?\d*', line)) >= 2:
-                    candidate_lines.append(line.strip())
+                if len(_NUMBER_TOKEN_PATTERN.findall(line)) >= 2:
+                    candidate_lines.append(line)
         
         line_items = []
         for line in candidate_lines:
@@ -1056,8 +1514,7 @@ class AdaptivePDFParser:
     def parse_regex_fallback(self, text: str) -> Dict[str, Any]:
         """Strategy 5: Aggressive regex-based extraction."""
         # Look for any pattern that might be: description + numbers
-        pattern = r'([A-Za-z][A-Za-z0-9\s\-_\.]+?)\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)'
-        matches = re.findall(pattern, text)
+        matches = _DESCRIPTION_AND_NUMBERS_PATTERN.findall(text)
         
         line_items = []
         for match in matches:
@@ -1079,11 +1536,29 @@ class AdaptivePDFParser:
             return parse_with_domain_knowledge(line_items)
         return {"summary": {}, "groups": []}
     
+    def _scan_line_prices(self, line: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Return the best core-pattern unit price and the flexible prices found in line.
+        
+        The data-section, line-scanning and keyword strategies all run
+        _extract_line_item_robust over the same lines, so each line is only
+        scanned once.
+        """
+        cached = self._line_prices_cache.get(line)
+        if cached is None:
+            # Only the most confident core-pattern price is ever used
+            cached = (self.extract_unit_prices_with_core_patterns(line, top_n=1), self.extract_prices_flexible(line))
+            if len(self._line_prices_cache) >= self.NUMBERS_CACHE_SIZE:
+                self._line_prices_cache.clear()
+            self._line_prices_cache[line] = cached
+        return cached
+    
     def _extract_line_item_robust(self, line: str) -> Optional[LineItem]:
         """Robust line item extraction using multiple approaches."""
-        # First try core pricing patterns (80/20 approach)
-        unit_prices = self.extract_unit_prices_with_core_patterns(line)
+        unit_prices, prices = self._scan_line_prices(line)
+        quantity = None
         
+        # First try core pricing patterns (80/20 approach)
         if unit_prices:
             # Use the highest confidence unit price pattern
             best_unit_price = unit_prices[0]
@@ -1111,12 +1586,10 @@ class AdaptivePDFParser:
                 pass
         
         # Use flexible price extraction
-        prices = self.extract_prices_flexible(line)
-        numbers = self._extract_all_numbers(line)
-        
         if len(prices) >= 2:
             # Try with flexible quantity detection
-            quantity = self.extract_quantity_flexible(line)
+            if quantity is None:
+                quantity = self.extract_quantity_flexible(line)
             unit_price = prices[0]['normalized']
             total = prices[-1]['normalized']
             
@@ -1135,31 +1608,24 @@ class AdaptivePDFParser:
                 pass
         
         # Fallback to original adaptive method
-        return self._adaptive_line_item_extraction(line, numbers, {})
+        return self._adaptive_line_item_extraction(line, self._extract_all_numbers(line), {})
     
     def _create_line_item_from_numbers(self, description: str, numbers: List[str]) -> Optional[LineItem]:
         """Create line item from description and list of numbers."""
         if len(numbers) != 3:
             return None
             
-        # Try different permutations
-        from itertools import permutations
-        for perm in permutations(numbers):
-            try:
-                qty_str, price_str, total_str = perm
-                qty = float(self._normalize_number(qty_str) or 0)
-                price = float(self._normalize_number(price_str) or 0)
-                total = float(self._normalize_number(total_str) or 0)
-                
-                if 1 <= qty <= 10000 and price > 0 and abs(qty * price - total) <= 0.01:
-                    return LineItem(
-                        description=description,
-                        quantity=str(qty),
-                        unit_price=str(price),
-                        cost=str(total)
-                    )
-            except (ValueError, TypeError):
-                continue
+        # Normalize each number once, then try the different permutations
+        # of the parsed values
+        values = [float(self._normalize_number(number) or 0) for number in numbers]
+        for qty, price, total in permutations(values):
+            if 1 <= qty <= 10000 and price > 0 and abs(qty * price - total) <= 0.01:
+                return LineItem(
+                    description=description,
+                    quantity=str(qty),
+                    unit_price=str(price),
+                    cost=str(total)
+                )
         
         return None
     
@@ -1172,38 +1638,52 @@ class AdaptivePDFParser:
         groups = result.get('groups', [])
         summary = result.get('summary', {})
         
+        # One walk over the items gathers the item count, the cost sum for
+        # the totals check (as validate_totals computes it) and the
+        # description quality
+        total_items = 0
+        calculated_total = 0
+        costs_valid = True
+        description_quality = 0
+        for group in groups:
+            line_items = group.get('lineItems', [])
+            total_items += len(line_items)
+            for item in line_items:
+                if costs_valid:
+                    try:
+                        calculated_total += float(item.get('cost', 0))
+                    except (ValueError, TypeError):
+                        costs_valid = False
+                
+                # Has proper descriptions (not just numbers)
+                desc = item.get('description', '')
+                if desc and len(desc) > 3:
+                    # Good if it has letters
+                    if _LETTER_PATTERN.search(desc):
+                        description_quality += 5
+        
         # Has line items
         if groups and len(groups) > 0:
             score += 40
             
             # Multiple line items is better
-            total_items = sum(len(group.get('lineItems', [])) for group in groups)
             if total_items > 1:
                 score += 20
             if total_items > 3:
                 score += 10
         
-        # Has reasonable total price
         try:
             total_cost = float(summary.get('totalCost', 0))
-            if 0.01 <= total_cost <= 1000000:
-                score += 20
         except (ValueError, TypeError):
-            pass
+            total_cost = None
         
-        # Math validation - totals add up
-        if self.validate_totals(result):
-            score += 30
+        # Has reasonable total price
+        if total_cost is not None and 0.01 <= total_cost <= 1000000:
+            score += 20
         
-        # Has proper descriptions (not just numbers)
-        description_quality = 0
-        for group in groups:
-            for item in group.get('lineItems', []):
-                desc = item.get('description', '')
-                if desc and len(desc) > 3:
-                    # Good if it has letters
-                    if re.search(r'[A-Za-z]', desc):
-                        description_quality += 5
+        # Math validation - totals add up (allowing small rounding differences)
+        if costs_valid and total_cost is not None and abs(calculated_total - total_cost) <= 1.0:
+            score += 30
         
         score += min(description_quality, 20)
         
@@ -1231,15 +1711,9 @@ class AdaptivePDFParser:
     def create_minimal_result(self, text: str) -> Dict[str, Any]:
         """Create minimal result when no parsing strategies work."""
         # Try to extract any totals from the text
-        total_patterns = [
-            r'total[:\s]+\$?([\d,]+\.?\d*)',
-            r'\$?([\d,]+\.?\d*)\s*total',
-            r'amount[:\s]+\$?([\d,]+\.?\d*)'
-        ]
-        
         total_found = None
-        for pattern in total_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _MINIMAL_TOTAL_PATTERNS:
+            match = pattern.search(text)
             if match:
                 total_found = self._normalize_number(match.group(1))
                 break
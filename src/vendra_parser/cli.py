@@ -4,14 +4,17 @@ Beautiful Command-line interface for the Vendra Quote Parser.
 """
 
 import click
+import io
 import logging
 import os
 import sys
 import json
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -22,11 +25,47 @@ from rich.align import Align
 from rich.columns import Columns
 from rich.box import ROUNDED
 
+# Tesseract's OpenMP threads cost more in coordination than they gain on
+# page-sized images, so default to single-threaded OCR. Set these variables
+# explicitly in the environment to tune OCR threading.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 from .comprehensive_parser import ComprehensivePDFParser
 
+# Optional fast JSON encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Initialize Rich console
 console = Console()
 
+# Horizontal rules used to separate output sections
+RULE = "─" * 50
+WIDE_RULE = "─" * 60
+
+def dumps_json(result) -> str:
+    """Serialize results to indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+def write_json(result, stream) -> None:
+    """Stream results as indented UTF-8 JSON to a binary stream without building a str first."""
+    if ORJSON_AVAILABLE:
+        stream.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    
+    text_stream = io.TextIOWrapper(stream, encoding='utf-8')
+    try:
+        json.dump(result, text_stream, indent=2, ensure_ascii=False)
+        text_stream.flush()
+    finally:
+        text_stream.detach()
+
 def setup_logging(verbose: bool, quiet: bool = False):
     """Setup logging configuration."""
     if quiet:
@@ -40,7 +79,7 @@ def setup_logging(verbose: bool, quiet: bool = False):
     else:
         logging.basicConfig(level=logging.WARNING)
 
-def parse_quietly(pdf_path: str):
+def parse_quietly(pdf_path: str, parser: Optional[ComprehensivePDFParser] = None):
     """Parse PDF in complete silence, suppressing all output."""
     import os
     import sys
@@ -58,13 +97,60 @@ def parse_quietly(pdf_path: str):
         sys.stdout = devnull
         sys.stderr = devnull
         try:
-            parser = ComprehensivePDFParser()
+            if parser is None:
+                parser = ComprehensivePDFParser()
             result = parser.parse_quote(pdf_path)
             return result
         finally:
             sys.stdout = old_stdout
             sys.stderr = old_stderr
 
+def default_batch_jobs() -> int:
+    """Default worker count for batch parsing.
+    
+    Tesseract saturates roughly four cores per process, so one worker per
+    four cores keeps the machine busy without oversubscribing it.
+    """
+    return max(1, (os.cpu_count() or 1) // 4)
+
+# Parser reused by every PDF handled in a batch worker process
+_worker_parser = None
+
+def init_batch_worker():
+    """Configure a batch worker process before it parses anything."""
+    # Several workers each running multi-threaded Tesseract fight over the
+    # same cores; keep Tesseract single-threaded and parallelise across files
+    # unless the user set the limit explicitly
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+def batch_mp_context():
+    """Start method for batch workers.
+    
+    Forking copies the parent's threads' locks mid-use (rich's progress
+    display refreshes from a background thread), so workers are started
+    from a fresh interpreter via forkserver, or spawn where unavailable.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+def parse_in_worker(pdf_path: str, parser: Optional[ComprehensivePDFParser] = None):
+    """Parse one PDF for the batch command.
+    
+    Runs either in a worker process or inline. Returns a (result, error)
+    tuple so failures can be reported by the parent process.
+    """
+    global _worker_parser
+    
+    if parser is None:
+        if _worker_parser is None:
+            _worker_parser = ComprehensivePDFParser()
+        parser = _worker_parser
+    
+    try:
+        return parse_quietly(pdf_path, parser), None
+    except Exception as e:
+        return None, str(e)
+
 def print_header():
     """Print beautiful header."""
     header_text = Text()
@@ -112,13 +198,12 @@ def validate_pdf_file(pdf_path: str) -> bool:
         print_error("Please provide a PDF file")
         return False
     
-    try:
-        with open(pdf_path, 'rb') as f:
-            f.read(1024)  # Test if file is readable
-        return True
-    except Exception as e:
-        print_error(f"Cannot read file: {str(e)}")
+    # Check readability without opening the file; the parser opens it anyway
+    if not os.path.isfile(pdf_path) or not os.access(pdf_path, os.R_OK):
+        print_error(f"Cannot read file: {pdf_path}")
         return False
+    
+    return True
 
 def save_results(result: dict, output_file: Optional[str], pdf_path: str, quiet: bool = False) -> bool:
     """Save results to JSON file with beautiful formatting."""
@@ -127,8 +212,8 @@ def save_results(result: dict, output_file: Optional[str], pdf_path: str, quiet:
             pdf_name = Path(pdf_path).stem
             output_file = f"{pdf_name}_parsed.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            write_json(result, f)
         
         if not quiet:
             print_success(f"Results saved to: {output_file}")
@@ -241,7 +326,7 @@ def interactive_mode():
         try:
             another = Confirm.ask("\n🔄 Parse another PDF?", default=True)
             if another:
-                console.print("\n" + "─" * 60)
+                console.print("\n" + WIDE_RULE)
                 interactive_mode()
                 return
             else:
@@ -285,7 +370,7 @@ def print_summary(result):
             # Create summary panel
             summary_text = Text()
             summary_text.append("📊 PARSING SUMMARY\n", style="bold white")
-            summary_text.append("─" * 50 + "\n", style="cyan")
+            summary_text.append(RULE + "\n", style="cyan")
             
             # Summary stats
             summary_text.append(f"Total Quantity: {summary.get('totalQuantity', '0')}\n", style="green")
@@ -303,7 +388,7 @@ def print_summary(result):
                     currency = next(symbol for symbol in ['$', '£', '€', '¥', '₹'] if symbol in first_step)
                     summary_text.append(f"Currency: {currency}\n", style="yellow")
             
-            summary_text.append("─" * 50, style="cyan")
+            summary_text.append(RULE, style="cyan")
             
             summary_panel = Panel(
                 summary_text,
@@ -312,7 +397,9 @@ def print_summary(result):
                 title="📊 Summary Statistics",
                 title_align="center"
             )
-            console.print(summary_panel)
+            
+            # Collect every panel and render them in a single print call
+            panels = [summary_panel]
             
             # Group details
             for i, group in enumerate(groups, 1):
@@ -334,27 +421,37 @@ def print_summary(result):
                         box=ROUNDED,
                         padding=(0, 1)
                     )
-                    console.print(group_panel)
-                    
+                    panels.append(group_panel)
+            
+            console.print(Group(*panels))
+            
     except Exception as e:
         print_error(f"Error displaying summary: {str(e)}")
 
 def print_json_output(result, quiet=False):
     """Print JSON output with beautiful syntax highlighting."""
     try:
-        json_str = json.dumps(result, indent=2, ensure_ascii=False)
-        
         if quiet:
-            # In quiet mode, just print the raw JSON
-            print(json_str)
+            # In quiet mode, stream the raw JSON straight to stdout
+            stdout_buffer = getattr(sys.stdout, 'buffer', None)
+            if stdout_buffer is not None:
+                sys.stdout.flush()
+                write_json(result, stdout_buffer)
+                stdout_buffer.write(b"\n")
+                stdout_buffer.flush()
+            else:
+                print(dumps_json(result))
         else:
-            # Normal mode with syntax highlighting
+            # Normal mode with syntax highlighting, rendered in a single print
+            json_str = dumps_json(result)
             syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
             
-            console.print("\n📄 [bold cyan]FULL JSON OUTPUT:[/bold cyan]")
-            console.print("─" * 50, style="cyan")
-            console.print(syntax)
-            console.print("─" * 50, style="cyan")
+            console.print(Group(
+                Text.from_markup("\n📄 [bold cyan]FULL JSON OUTPUT:[/bold cyan]"),
+                Text(RULE, style="cyan"),
+                syntax,
+                Text(RULE, style="cyan"),
+            ))
         
     except Exception as e:
         if not quiet:
@@ -365,8 +462,10 @@ def print_json_output(result, quiet=False):
 @click.group(invoke_without_command=True, context_settings=dict(help_option_names=['-h', '--help']))
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 @click.option('--quiet', '-q', is_flag=True, help='Run in headless mode (suppress all output except results)')
+@click.option('--disk-cache', is_flag=True,
+              help='Cache extracted text and results on disk (same as VENDRA_PARSER_DISK_CACHE=1)')
 @click.pass_context
-def cli(ctx, verbose: bool, quiet: bool):
+def cli(ctx, verbose: bool, quiet: bool, disk_cache: bool):
     """
     🎯 VENDRA QUOTE PARSER
     
@@ -377,8 +476,13 @@ def cli(ctx, verbose: bool, quiet: bool):
         vendra-parser parse quote.pdf --output results.json
         vendra-parser parse quote.pdf --verbose
         vendra-parser parse quote.pdf --quiet
+        vendra-parser batch quotes/*.pdf --output-dir results/
+        vendra-parser --disk-cache batch quotes/*.pdf
     """
     setup_logging(verbose, quiet)
+    if disk_cache:
+        # Set in the environment so batch worker processes inherit it
+        os.environ["VENDRA_PARSER_DISK_CACHE"] = "1"
     
     # If no subcommand is provided, start interactive mode
     if ctx.invoked_subcommand is None:
@@ -495,6 +599,76 @@ def quick(pdf_path: str, output: Optional[str], verbose: bool, quiet: bool):
             print_error("Failed to parse PDF")
         sys.exit(1)
 
+@cli.command()
+@click.argument('pdf_paths', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--output-dir', '-d', type=click.Path(file_okay=False), default='.', show_default=True,
+              help='Directory for the {pdf_name}_parsed.json result files')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=None,
+              help='Number of worker processes (default: one per 4 CPU cores)')
+@click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
+@click.option('--quiet', '-q', is_flag=True, help='Run in headless mode (suppress all output)')
+def batch(pdf_paths, output_dir: str, jobs: Optional[int], verbose: bool, quiet: bool):
+    """Parse several PDF quotes in one run.
+    
+    All files share a single parser and one interpreter, so imports and
+    parser setup are paid once rather than once per PDF. With more than one
+    job, PDFs are spread over worker processes running single-threaded
+    Tesseract; results are always written by the parent process.
+    """
+    setup_logging(verbose, quiet)
+    
+    if not quiet:
+        print_header()
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    valid_paths = [pdf_path for pdf_path in pdf_paths if validate_pdf_file(pdf_path)]
+    failures = len(pdf_paths) - len(valid_paths)
+    
+    if jobs is None:
+        jobs = default_batch_jobs()
+    jobs = min(jobs, len(valid_paths)) or 1
+    
+    if not quiet:
+        print_info(f"Parsing {len(valid_paths)} PDFs with {jobs} worker(s)")
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        disable=quiet
+    ) as progress:
+        progress.add_task("📊 Extracting line items and prices...", total=None)
+        
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=batch_mp_context(),
+                                     initializer=init_batch_worker) as executor:
+                outcomes = list(zip(valid_paths, executor.map(parse_in_worker, valid_paths)))
+        else:
+            parser = ComprehensivePDFParser()
+            outcomes = [(pdf_path, parse_in_worker(pdf_path, parser)) for pdf_path in valid_paths]
+    
+    for pdf_path, (result, error) in outcomes:
+        if error or not result:
+            failures += 1
+            if not quiet:
+                print_error(f"Failed to parse {pdf_path}: {error or 'no result'}")
+            continue
+        
+        output_file = os.path.join(output_dir, f"{Path(pdf_path).stem}_parsed.json")
+        if not save_results(result, output_file, pdf_path, quiet):
+            failures += 1
+    
+    if not quiet:
+        parsed = len(pdf_paths) - failures
+        if failures:
+            print_warning(f"Parsed {parsed} of {len(pdf_paths)} PDFs")
+        else:
+            print_success(f"Parsed all {parsed} PDFs")
+    
+    if failures:
+        sys.exit(1)
+
 @cli.command()
 def version():
     """Show version information."""
@@ -519,7 +693,7 @@ def info():
     """Show parser capabilities and information."""
     capabilities_text = Text()
     capabilities_text.append("🎯 VENDRA QUOTE PARSER CAPABILITIES\n", style="bold white")
-    capabilities_text.append("─" * 50 + "\n", style="cyan")
+    capabilities_text.append(RULE + "\n", style="cyan")
     
     features = [
         "✅ Multi-format PDF parsing (invoice2data, OCR, direct text)",
@@ -536,7 +710,7 @@ def info():
     for feature in features:
         capabilities_text.append(f"{feature}\n", style="green")
     
-    capabilities_text.append("─" * 50 + "\n", style="cyan")
+    capabilities_text.append(RULE + "\n", style="cyan")
     capabilities_text.append("Supports any PDF quote format automatically!", style="bold yellow")
     
     capabilities_panel = Panel(
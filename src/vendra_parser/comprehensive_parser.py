@@ -38,6 +38,23 @@ class ComprehensivePDFParser:
         ]
         self.detected_currency = None
         self.currency_symbol = None
+        # Sub-parsers are created on first use and shared across methods
+        self._multi_format_parser = None
+        self._ocr_parser = None
+    
+    def _get_multi_format_parser(self):
+        """Return the shared MultiFormatPDFParser instance."""
+        if self._multi_format_parser is None:
+            from .multi_format_parser import MultiFormatPDFParser
+            self._multi_format_parser = MultiFormatPDFParser()
+        return self._multi_format_parser
+    
+    def _get_ocr_parser(self):
+        """Return the shared DynamicOCRParser instance."""
+        if self._ocr_parser is None:
+            from .ocr_parser import DynamicOCRParser
+            self._ocr_parser = DynamicOCRParser()
+        return self._ocr_parser
     
     def parse_quote(self, pdf_path: str) -> Dict[str, Any]:
         """
@@ -45,7 +62,9 @@ class ComprehensivePDFParser:
         """
         logger.info(f"🔍 Starting comprehensive parsing of: {pdf_path}")
         
-        # First, extract some text to detect currency
+        # First, extract some text to detect currency. The same sample is
+        # reused for CID detection so the leading pages are only read once.
+        sample_text = None
         try:
             import pdfplumber
             with pdfplumber.open(pdf_path) as pdf:
@@ -61,9 +80,10 @@ class ComprehensivePDFParser:
         except Exception as e:
             logger.warning(f"Failed to extract text for currency detection: {e}")
             self.detected_currency, self.currency_symbol = 'USD', '$'
+            sample_text = None
         
         # Check if this PDF has significant CID issues
-        has_cid_issues = self._detect_cid_issues(pdf_path)
+        has_cid_issues = self._detect_cid_issues(pdf_path, sample_text)
         if has_cid_issues:
             logger.info("🔧 Detected CID font encoding issues - prioritizing OCR fallback")
             # Reorder methods to prioritize OCR for CID issues
@@ -181,8 +201,7 @@ class ComprehensivePDFParser:
             
             # Try multi-format parser first (this is the main vendra-parser functionality)
             try:
-                from .multi_format_parser import MultiFormatPDFParser
-                parser = MultiFormatPDFParser()
+                parser = self._get_multi_format_parser()
                 result = parser.parse_quote(pdf_path)
                 if result and self._validate_result(result):
                     quality_score = self._score_result_quality(result)
@@ -197,8 +216,7 @@ class ComprehensivePDFParser:
             
             # Try OCR as another option
             try:
-                from .ocr_parser import DynamicOCRParser
-                parser = DynamicOCRParser()
+                parser = self._get_ocr_parser()
                 result = parser.parse_quote(pdf_path)
                 if result and self._validate_result(result):
                     quality_score = self._score_result_quality(result)
@@ -227,8 +245,7 @@ class ComprehensivePDFParser:
     def _extract_with_multi_format(self, pdf_path: str) -> Optional[Dict[str, Any]]:
         """Extract using multi-format parser."""
         try:
-            from .multi_format_parser import MultiFormatPDFParser
-            parser = MultiFormatPDFParser()
+            parser = self._get_multi_format_parser()
             return parser.parse_quote(pdf_path)
         except Exception as e:
             logger.error(f"Multi-format extraction failed: {e}")
@@ -237,8 +254,7 @@ class ComprehensivePDFParser:
     def _extract_with_ocr_fallback(self, pdf_path: str) -> Optional[Dict[str, Any]]:
         """Extract using OCR as final fallback."""
         try:
-            from .ocr_parser import DynamicOCRParser
-            parser = DynamicOCRParser()
+            parser = self._get_ocr_parser()
             return parser.parse_quote(pdf_path)
         except Exception as e:
             logger.error(f"OCR fallback extraction failed: {e}")
@@ -430,8 +446,7 @@ class ComprehensivePDFParser:
         # Try OCR if text extraction failed
         if len(all_text.strip()) < 50:
             try:
-                from .ocr_parser import DynamicOCRParser
-                ocr_parser = DynamicOCRParser()
+                ocr_parser = self._get_ocr_parser()
                 ocr_result = ocr_parser._extract_text_with_ocr(pdf_path)
                 if ocr_result:
                     all_text = ocr_result
@@ -1100,8 +1115,16 @@ class ComprehensivePDFParser:
             return []
         
         unique_items = []
+        # (unit price, description) of the kept items. Extraction strategies
+        # often find the very same item, and an exact repeat is always similar
+        # to the kept one, so those are dropped without the pairwise scan.
+        seen_keys = set()
         
         for item in line_items:
+            key = self._exact_duplicate_key(item)
+            if key is not None and key in seen_keys:
+                continue
+            
             is_duplicate = False
             
             # Check against existing unique items
@@ -1112,9 +1135,25 @@ class ComprehensivePDFParser:
             
             if not is_duplicate:
                 unique_items.append(item)
+                if key is not None:
+                    seen_keys.add(key)
         
         return unique_items
     
+    def _exact_duplicate_key(self, item) -> Optional[Tuple[float, str]]:
+        """
+        Key under which two items are always similar per _are_items_similar,
+        or None when the item can't be keyed (a zero or unparseable unit price
+        never compares as similar).
+        """
+        try:
+            price = float(item.unit_price)
+            if price == 0:
+                return None
+            return (price, item.description.lower().strip())
+        except Exception:
+            return None
+    
     def _are_items_similar(self, item1, item2) -> bool:
         """Check if two line items are similar enough to be considered duplicates."""
         try:
@@ -1312,24 +1351,33 @@ class ComprehensivePDFParser:
         
         return final_score
     
-    def _detect_cid_issues(self, pdf_path: str) -> bool:
-        """Detect if a PDF has significant CID font encoding issues."""
+    def _detect_cid_issues(self, pdf_path: str, sample_text: Optional[str] = None) -> bool:
+        """
+        Detect if a PDF has significant CID font encoding issues.
+        
+        If ``sample_text`` (text of the first few pages) is already available it
+        is used directly instead of opening the PDF a second time.
+        """
         try:
-            # Quick check using pdfplumber
-            import pdfplumber
-            
             cid_count = 0
             total_chars = 0
             
-            with pdfplumber.open(pdf_path) as pdf:
-                # Check first few pages for CID sequences
-                pages_to_check = min(len(pdf.pages), 3)
+            if sample_text is not None:
+                total_chars = len(sample_text)
+                cid_count = sample_text.count('cid:')
+            else:
+                # Quick check using pdfplumber
+                import pdfplumber
                 
-                for i in range(pages_to_check):
-                    text = pdf.pages[i].extract_text()
-                    if text:
-                        total_chars += len(text)
-                        cid_count += text.count('cid:')
+                with pdfplumber.open(pdf_path) as pdf:
+                    # Check first few pages for CID sequences
+                    pages_to_check = min(len(pdf.pages), 3)
+                    
+                    for i in range(pages_to_check):
+                        text = pdf.pages[i].extract_text()
+                        if text:
+                            total_chars += len(text)
+                            cid_count += text.count('cid:')
             
             # If more than 5% of characters are CID sequences, it's a problem
             if total_chars > 0:
@@ -5,6 +5,7 @@ Domain-aware parser for manufacturing quotes with abbreviation handling.
 
 import re
 import logging
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
 from decimal import Decimal, InvalidOperation
 import json
@@ -13,6 +14,36 @@ from .models import LineItem, QuoteGroup
 
 logger = logging.getLogger(__name__)
 
+# JSON keys for a serialized line item and the LineItem fields they come from
+_LINE_ITEM_KEYS = ("description", "quantity", "unitPrice", "cost")
+_line_item_fields = attrgetter("description", "quantity", "unit_price", "cost")
+
+# Patterns used by DomainAwareParser's line item filters
+_PART_NUMBER_PATTERN = re.compile(r'[A-Z0-9]+-[A-Z0-9]+|[A-Z]+\d+|REV\s+[A-Z0-9]')
+_PRODUCT_CODE_PATTERN = re.compile(r'[A-Z]+-\d+|[A-Z]+\d+')
+_SERVICE_FEE_PATTERN = re.compile('|'.join([
+    r'^(setup|processing|handling|service|administrative|documentation|expedite)\s+(fee|charge)$',
+    r'^(fee|charge)$',
+]))
+# Descriptions that are actual shipping charges (not products)
+_SHIPPING_CHARGE_PATTERN = re.compile('|'.join([
+    # Standalone shipping terms
+    r'^freight$', r'^shipping$', r'^delivery$', r'^handling$', 
+    r'^postage$', r'^courier$', r'^express$', r'^overnight$',
+    
+    # Shipping with simple descriptors (3 words or less)
+    r'^freight\s+(shipping|cost|charge|fee)$',
+    r'^shipping\s+(and\s+handling|cost|charge|fee)$',
+    r'^delivery\s+(charge|fee|cost)$',
+    r'^handling\s+(charge|fee|cost)$',
+    
+    # Common shipping charge formats
+    r'^rush\s+delivery$', r'^expedited\s+shipping$',
+    r'^standard\s+shipping$', r'^ground\s+shipping$'
+]))
+_DESCRIPTION_JUNK_PATTERN = re.compile(r'[^\w\s\-_:()]')
+_WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+
 
 class ManufacturingAbbreviationHandler:
     """Handles manufacturing domain-specific abbreviations and terminology."""
@@ -100,6 +131,20 @@ class ManufacturingAbbreviationHandler:
             r'finish\w*': 'finishing',
             r'cod\w*': 'cash on delivery',
         }
+        
+        # Compile once: the fuzzy patterns keep their order, and all the
+        # abbreviations are folded into one alternation so a line is scanned
+        # a single time instead of once per dictionary entry
+        self._fuzzy_regexes = [
+            (re.compile(pattern), replacement)
+            for pattern, replacement in self.fuzzy_patterns.items()
+        ]
+        self._abbreviation_pattern = re.compile(
+            r'\b(?:' + '|'.join(
+                re.escape(abbr) for abbr in sorted(self.abbreviations, key=len, reverse=True)
+            ) + r')\b',
+            re.IGNORECASE,
+        )
     
     def normalize_header(self, header: str) -> str:
         """Normalize header text using abbreviation dictionary and fuzzy matching."""
@@ -110,8 +155,8 @@ class ManufacturingAbbreviationHandler:
             return self.abbreviations[header_lower]
         
         # Fuzzy pattern matching
-        for pattern, replacement in self.fuzzy_patterns.items():
-            if re.search(pattern, header_lower):
+        for pattern, replacement in self._fuzzy_regexes:
+            if pattern.search(header_lower):
                 return replacement
         
         # Try partial matches
@@ -123,15 +168,10 @@ class ManufacturingAbbreviationHandler:
     
     def expand_abbreviations(self, text: str) -> str:
         """Expand abbreviations in text for better parsing."""
-        text_lower = text.lower()
-        expanded = text
-        
-        for abbr, full in self.abbreviations.items():
-            if abbr in text_lower:
-                # Replace abbreviation with full term
-                expanded = re.sub(r'\b' + re.escape(abbr) + r'\b', full, expanded, flags=re.IGNORECASE)
-        
-        return expanded
+        abbreviations = self.abbreviations
+        return self._abbreviation_pattern.sub(
+            lambda match: abbreviations[match.group(0).lower()], text
+        )
 
 
 class DomainAwareParser:
@@ -276,15 +316,7 @@ class DomainAwareParser:
             "quantity": str(total_item_count),  # Total items in this quantity group
             "unitPrice": str(unit_price_sum),  # Sum of all individual unit prices
             "totalPrice": total_cost,
-            "lineItems": [
-                {
-                    "description": item.description,
-                    "quantity": item.quantity,
-                    "unitPrice": item.unit_price,
-                    "cost": item.cost
-                }
-                for item in items
-            ]
+            "lineItems": [dict(zip(_LINE_ITEM_KEYS, _line_item_fields(item))) for item in items]
         }
     
     def normalize_line_item(self, line_item: LineItem) -> LineItem:
@@ -384,8 +416,7 @@ class DomainAwareParser:
         has_inventory_indicators = any(indicator in desc_lower for indicator in inventory_indicators)
         
         # Part number pattern (strong indicator)
-        import re
-        has_part_number = bool(re.search(r'[A-Z0-9]+-[A-Z0-9]+|[A-Z]+\d+|REV\s+[A-Z0-9]', line_item.description.upper()))
+        has_part_number = bool(_PART_NUMBER_PATTERN.search(line_item.description.upper()))
         
         # Must have either inventory indicators or part number pattern
         is_valid = has_inventory_indicators or has_part_number
@@ -444,41 +475,13 @@ class DomainAwareParser:
     
     def _is_service_fee(self, desc_lower):
         """Check if description is a service fee rather than a product."""
-        fee_patterns = [
-            r'^(setup|processing|handling|service|administrative|documentation|expedite)\s+(fee|charge)$',
-            r'^(fee|charge)$',
-        ]
-        
-        import re
-        for pattern in fee_patterns:
-            if re.match(pattern, desc_lower):
-                return True
-        
-        return False
+        return bool(_SERVICE_FEE_PATTERN.match(desc_lower))
     
     def _is_shipping_charge(self, desc_lower):
         """Check if description is a shipping charge vs product name with shipping words."""
         # Patterns that indicate actual shipping charges (not products)
-        shipping_charge_patterns = [
-            # Standalone shipping terms
-            r'^freight$', r'^shipping$', r'^delivery$', r'^handling$', 
-            r'^postage$', r'^courier$', r'^express$', r'^overnight$',
-            
-            # Shipping with simple descriptors (3 words or less)
-            r'^freight\s+(shipping|cost|charge|fee)$',
-            r'^shipping\s+(and\s+handling|cost|charge|fee)$',
-            r'^delivery\s+(charge|fee|cost)$',
-            r'^handling\s+(charge|fee|cost)$',
-            
-            # Common shipping charge formats
-            r'^rush\s+delivery$', r'^expedited\s+shipping$',
-            r'^standard\s+shipping$', r'^ground\s+shipping$'
-        ]
-        
-        import re
-        for pattern in shipping_charge_patterns:
-            if re.match(pattern, desc_lower):
-                return True
+        if _SHIPPING_CHARGE_PATTERN.match(desc_lower):
+            return True
         
         # Additional heuristics for shipping charges:
         words = desc_lower.split()
@@ -501,7 +504,7 @@ class DomainAwareParser:
         # - Specific material/process descriptions
         
         # If it has a part number pattern, it's likely a product
-        if re.search(r'[A-Z]+-\d+|[A-Z]+\d+', desc_lower.upper()):
+        if _PRODUCT_CODE_PATTERN.search(desc_lower.upper()):
             return False
         
         # If it has material terms, it's likely a product
@@ -518,9 +521,9 @@ class DomainAwareParser:
     def _clean_description(self, description: str) -> str:
         """Clean up description while preserving manufacturing terminology."""
         # Remove special characters but keep alphanumeric, spaces, hyphens, underscores, colons, parentheses
-        description = re.sub(r'[^\w\s\-_:()]', ' ', description)
+        description = _DESCRIPTION_JUNK_PATTERN.sub(' ', description)
         # Remove extra spaces
-        description = re.sub(r'\s+', ' ', description).strip()
+        description = _WHITESPACE_RUN_PATTERN.sub(' ', description).strip()
         return description
 
 
@@ -5,12 +5,95 @@ Uses the invoice2data library for robust invoice and quote parsing.
 """
 
 import logging
+import re
 from typing import Dict, List, Any, Optional
 from decimal import Decimal
 import json
 
 logger = logging.getLogger(__name__)
 
+# Currency symbols accepted in front of prices
+_CURRENCY_CHARS = '€$£¥₹₽₿₩₪₨₦₡₱₲₴₵₸₺₻₼₽₾₿'
+
+# Lines dropped by _filter_non_inventory_content, fused into one alternation
+# so each line is scanned once. Case-insensitive parts use scoped (?i:) groups.
+_NON_INVENTORY_PATTERN = re.compile('|'.join([
+    # Phone numbers
+    r'^\s*\d{3}[-.]?\d{3}[-.]?\d{4}\s*$|^\s*\d{3}-\d{3}-\d{4}\s*$|^\s*\d{3}-\d{4}\s*$',
+    # Street addresses
+    r'^\s*\d+\s+[A-Za-z\s]+(?:St|Ave|Rd|Blvd|Drive|Street|Avenue|Road|Boulevard)\s*$',
+    # Contact details
+    r'(?i:^\s*(?:Phone|Email|Fax|Tel|Contact|Address|City|State|ZIP|Postal)\s*[:=]?\s*)',
+    # Document metadata
+    r'(?i:^\s*(?:Quote|Invoice|Order|Date|Number|Valid|Terms|Payment|Due|Printed|Signature|Name)\s*[:=]?\s*)',
+    # Table and summary headers
+    r'(?i:^\s*(?:BILL TO|SHIP TO|DESCRIPTION|QTY|QUANTITY|UNIT PRICE|TOTAL|SUBTOTAL|TAX|DISCOUNT|SHIPPING)\s*$)',
+    # Separators
+    r'^\s*[-=_]{3,}\s*$|^\s*$',
+    # Standalone phone number fragments
+    r'^\s*\d{3}-\s*$|^\s*\d{3}-\d{3}-\s*$',
+]))
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
+# Patterns used by _is_likely_line_item and _is_line_item_component. The
+# price, quantity and product hints are fused so each line is scanned once.
+_PRICE_PATTERN = re.compile(r'[' + _CURRENCY_CHARS + r']?\s*\d+[.,]\d{2}')
+_LINE_ITEM_HINT_PATTERN = re.compile('|'.join([
+    _PRICE_PATTERN.pattern,
+    # Quantity at start
+    r'^\s*\d+\s+',
+    # Product-related words
+    r'(?i:\b(?:Assembly|Housing|Bracket|Screw|Bushing|Coating|Service|Inspection|Product|Item|Part|Steel|Aluminum|Custom|Machined|Powder|Quality)\b)',
+]))
+_LINE_ITEM_COMPONENT_HINT_PATTERN = re.compile('|'.join([
+    # Euro prices
+    r'€\d+[.,]\d{2}',
+    # Bare quantities
+    r'^\s*\d+\s*$',
+    # Product-related words
+    r'(?i:\b(?:Assembly|Housing|Bracket|Screw|Bushing|Coating|Service|Inspection|Steel|Aluminum|Custom|Machined|Powder|Quality)\b)',
+]))
+_LETTER_PATTERN = re.compile(r'[A-Za-z]')
+_DIGIT_PATTERN = re.compile(r'\d')
+
+# Patterns used by _extract_structured_line_items
+# Matches: Description Quantity CurrencyPrice CurrencyTotal (handles thousands separators)
+_LINE_ITEM_PATTERN = re.compile(
+    r'^([A-Za-z\s\-\(\)0-9]+?)\s+(\d+)\s+([' + _CURRENCY_CHARS + r'])(\d+[.,]\d{2})\s+([' + _CURRENCY_CHARS + r'])(\d+(?:\.\d{3})?[.,]\d{2})\s*$'
+)
+# The combined line from pymupdf (handles thousands separators)
+_COMBINED_LINE_ITEM_PATTERN = re.compile(
+    r'([A-Za-z\s\-\(\)0-9]+?)\s+(\d+)\s+([' + _CURRENCY_CHARS + r'])(\d+[.,]\d{2})\s+([' + _CURRENCY_CHARS + r'])(\d+(?:\.\d{3})?[.,]\d{2})'
+)
+# Lines that might be split across multiple lines (handles thousands separators)
+_MULTILINE_ITEM_PATTERN = re.compile(
+    r'([A-Za-z\s\-\(\)0-9]+?)\s+([' + _CURRENCY_CHARS + r'])(\d+[.,]\d{2})\s+([' + _CURRENCY_CHARS + r'])(\d+(?:\.\d{3})?[.,]\d{2})'
+)
+
+# Patterns used by _split_combined_line_items (European format)
+_EURO_ITEM_PATTERN = re.compile(r'([A-Za-z\s\-\(\)0-9]+?)\s+€(\d+[.,]\d{2})\s+€(\d+(?:\.\d{3})?[.,]\d{2})')
+_EURO_QUANTITY_ITEM_PATTERN = re.compile(r'([A-Za-z\s\-\(\)0-9]+?)\s+(\d+)\s+€(\d+[.,]\d{2})\s+€(\d+(?:\.\d{3})?[.,]\d{2})')
+_ZIP_PREFIX_PATTERN = re.compile(r'^\d{5}\s+')
+_STATE_ZIP_PREFIX_PATTERN = re.compile(r'^[A-Z]{2}\s+\d{5}\s+')
+
+# Patterns used by _clean_extracted_text and _is_garbled_text
+_ENCODED_NEWLINE_PATTERN = re.compile(r'<0a>')
+_HEX_CODE_PATTERN = re.compile(r'<[0-9a-f]{2}>')
+_INTERNAL_ERROR_PATTERN = re.compile(r'Internal Error:.*?\.', re.DOTALL)
+_URI_ERROR_PATTERN = re.compile(r'Cannot handle URI.*?\.', re.DOTALL)
+_LONG_WORD_PATTERN = re.compile(r'\b[A-Za-z]{20,}\b')
+_WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+_ALPHANUMERIC_PATTERN = re.compile(r'[A-Za-z0-9]')
+_GARBLED_TEXT_PATTERNS = [re.compile(p) for p in (
+    r'<0a>',  # HTML-like artifacts
+    r'<[0-9a-f]{2}>',  # Hex codes
+    r'Internal Error:',  # Error messages
+    r'Cannot handle URI',  # URI errors
+    r'[A-Za-z]{20,}',  # Very long words (likely encoding issues)
+    r'[^\x00-\x7F]{10,}',  # Too many non-ASCII characters
+)]
+_SPECIAL_CHAR_RUN_PATTERN = re.compile(r'[^\w\s]{5,}')
+
 class Invoice2DataParser:
     """
     Parser using invoice2data library for extracting data from invoices and quotes.
@@ -22,6 +105,16 @@ class Invoice2DataParser:
             ('pdfplumber', self._extract_with_pdfplumber),
             ('pymupdf', self._extract_with_pymupdf),
         ]
+        # Fallback line-item parser, created on first use and shared by every
+        # extraction method and every parse_quote call
+        self._line_item_parser = None
+    
+    def _get_line_item_parser(self):
+        """Return the shared DynamicOCRParser used when structured extraction finds nothing."""
+        if self._line_item_parser is None:
+            from .ocr_parser import DynamicOCRParser
+            self._line_item_parser = DynamicOCRParser()
+        return self._line_item_parser
     
     def parse_quote(self, pdf_path: str) -> Dict[str, Any]:
         """
@@ -119,21 +212,26 @@ class Invoice2DataParser:
                 'cost': str(result.get('amount', 0))
             })
         
+        # The single group and the summary share the same totals, so compute them once
+        total_quantity = str(sum(int(item['quantity']) for item in line_items))
+        total_unit_price = str(sum(float(item['unitPrice']) for item in line_items))
+        total_cost = str(sum(float(item['cost']) for item in line_items))
+        
         # Create groups
         groups = []
         if line_items:
             groups = [{
-                'quantity': str(sum(int(item['quantity']) for item in line_items)),
-                'unitPrice': str(sum(float(item['unitPrice']) for item in line_items)),
-                'totalPrice': str(sum(float(item['cost']) for item in line_items)),
+                'quantity': total_quantity,
+                'unitPrice': total_unit_price,
+                'totalPrice': total_cost,
                 'lineItems': line_items
             }]
         
         return {
             'summary': {
-                'totalQuantity': str(sum(int(item['quantity']) for item in line_items)),
-                'totalUnitPriceSum': str(sum(float(item['unitPrice']) for item in line_items)),
-                'totalCost': str(sum(float(item['cost']) for item in line_items)),
+                'totalQuantity': total_quantity,
+                'totalUnitPriceSum': total_unit_price,
+                'totalCost': total_cost,
                 'numberOfGroups': len(groups),
                 'subtotal': str(result.get('amount', 0)),
                 'finalTotal': str(result.get('amount', 0)),
@@ -149,19 +247,22 @@ class Invoice2DataParser:
             import pdfplumber
             
             with pdfplumber.open(pdf_path) as pdf:
-                all_text = ""
+                page_texts = []
                 
                 for page in pdf.pages:
                     text = page.extract_text()
+                    # Drop the page's parsed layout objects now rather than
+                    # holding every page's until the document closes
+                    page.flush_cache()
                     if text:
-                        all_text += text + "\n"
+                        page_texts.append(text + "\n")
+                all_text = "".join(page_texts)
                 
                 # Clean the text to remove HTML artifacts and encoding issues
                 cleaned_text = self._clean_extracted_text(all_text)
                 
-                # Filter out non-inventory content before processing
-                filtered_text = self._filter_non_inventory_content(cleaned_text)
-                return self._extract_line_items_manually(filtered_text)
+                # Non-inventory content is filtered out by _extract_line_items_manually
+                return self._extract_line_items_manually(cleaned_text)
                 
         except Exception as e:
             logger.warning(f"PDF extraction failed: {str(e)}")
@@ -169,34 +270,31 @@ class Invoice2DataParser:
     
     def _extract_line_items_manually(self, text: str) -> Dict[str, Any]:
         """Extract line items manually when invoice2data doesn't find a template."""
-        from .ocr_parser import DynamicOCRParser
-        
         # Apply filtering to remove non-inventory content
         filtered_text = self._filter_non_inventory_content(text)
         
-        # Debug: Log what's being filtered
-        logger.info(f"Original text lines: {len(text.split(chr(10)))}")
-        logger.info(f"Filtered text lines: {len(filtered_text.split(chr(10)))}")
+        # Debug: Log what's being filtered (counting newlines avoids splitting the text again)
+        logger.info(f"Original text lines: {text.count(chr(10)) + 1}")
+        logger.info(f"Filtered text lines: {filtered_text.count(chr(10)) + 1}")
         
         # Pre-process the text to better reconstruct line items
         processed_text = self._preprocess_line_items(filtered_text)
         
         # Debug: Log the processed text
-        logger.info(f"Processed text lines: {len(processed_text.split(chr(10)))}")
-        logger.debug(f"Processed text: {processed_text}")
-        
-        # Debug: Show what the splitting produces
-        lines = processed_text.split('\n')
-        for i, line in enumerate(lines):
-            logger.debug(f"Line {i}: {line}")
+        logger.info(f"Processed text lines: {processed_text.count(chr(10)) + 1}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Processed text: {processed_text}")
+            
+            # Debug: Show what the splitting produces
+            for i, line in enumerate(processed_text.split('\n')):
+                logger.debug(f"Line {i}: {line}")
         
         # Try to extract line items directly from the processed text first
         line_items = self._extract_structured_line_items(processed_text)
         
         # If direct extraction fails, fall back to OCR parser
         if not line_items:
-            parser = DynamicOCRParser()
-            line_items = parser.discover_line_items_dynamically(processed_text)
+            line_items = self._get_line_item_parser().discover_line_items_dynamically(processed_text)
         
         # Create result structure
         result = {
@@ -252,12 +350,16 @@ class Invoice2DataParser:
             import pdfplumber
             
             with pdfplumber.open(pdf_path) as pdf:
-                all_text = ""
+                page_texts = []
                 
                 for page in pdf.pages:
                     text = page.extract_text()
+                    # Drop the page's parsed layout objects now rather than
+                    # holding every page's until the document closes
+                    page.flush_cache()
                     if text:
-                        all_text += text + "\n"
+                        page_texts.append(text + "\n")
+                all_text = "".join(page_texts)
                 
                 return self._extract_line_items_manually(all_text)
                 
@@ -271,14 +373,15 @@ class Invoice2DataParser:
             import fitz
             
             doc = fitz.open(pdf_path)
-            all_text = ""
+            page_texts = []
             
             for page in doc:
                 text = page.get_text("text")
                 if text:
-                    all_text += text + "\n"
+                    page_texts.append(text + "\n")
             
             doc.close()
+            all_text = "".join(page_texts)
             
             return self._extract_line_items_manually(all_text)
             
@@ -311,6 +414,9 @@ class Invoice2DataParser:
                 'totalPrice': '0.00',
                 'lineItems': []
             }
+            # Running totals stay numeric and are only formatted when the group is closed
+            group_quantity = 0
+            group_total = Decimal('0.00')
             
             for item in unique_items:
                 if item.unit_price == current_group['unitPrice']:
@@ -321,12 +427,16 @@ class Invoice2DataParser:
                         'unitPrice': item.unit_price,
                         'cost': item.cost
                     })
-                    current_group['quantity'] = str(int(current_group['quantity']) + int(item.quantity))
-                    current_group['totalPrice'] = str(Decimal(current_group['totalPrice']) + Decimal(item.cost))
+                    group_quantity += int(item.quantity)
+                    group_total += Decimal(item.cost)
                 else:
                     # Start new group
                     if current_group['lineItems']:
+                        current_group['quantity'] = str(group_quantity)
+                        current_group['totalPrice'] = str(group_total)
                         groups.append(current_group)
+                    group_quantity = int(item.quantity)
+                    group_total = Decimal(item.cost)
                     current_group = {
                         'quantity': item.quantity,
                         'unitPrice': item.unit_price,
@@ -341,6 +451,8 @@ class Invoice2DataParser:
             
             # Add last group
             if current_group['lineItems']:
+                current_group['quantity'] = str(group_quantity)
+                current_group['totalPrice'] = str(group_total)
                 groups.append(current_group)
         
         return groups
@@ -405,35 +517,16 @@ class Invoice2DataParser:
     
     def _filter_non_inventory_content(self, text: str) -> str:
         """Filter out non-inventory content like phone numbers, addresses, etc."""
-        import re
-        
         lines = text.split('\n')
         filtered_lines = []
         
-        # Patterns for non-inventory content
-        phone_pattern = re.compile(r'^\s*\d{3}[-.]?\d{3}[-.]?\d{4}\s*$|^\s*\d{3}-\d{3}-\d{4}\s*$|^\s*\d{3}-\d{4}\s*$')
-        address_pattern = re.compile(r'^\s*\d+\s+[A-Za-z\s]+(?:St|Ave|Rd|Blvd|Drive|Street|Avenue|Road|Boulevard)\s*$')
-        contact_pattern = re.compile(r'^\s*(?:Phone|Email|Fax|Tel|Contact|Address|City|State|ZIP|Postal)\s*[:=]?\s*', re.IGNORECASE)
-        metadata_pattern = re.compile(r'^\s*(?:Quote|Invoice|Order|Date|Number|Valid|Terms|Payment|Due|Printed|Signature|Name)\s*[:=]?\s*', re.IGNORECASE)
-        header_pattern = re.compile(r'^\s*(?:BILL TO|SHIP TO|DESCRIPTION|QTY|QUANTITY|UNIT PRICE|TOTAL|SUBTOTAL|TAX|DISCOUNT|SHIPPING)\s*$', re.IGNORECASE)
-        separator_pattern = re.compile(r'^\s*[-=_]{3,}\s*$|^\s*$')
-        
-        # Pattern to identify standalone phone number fragments
-        phone_fragment_pattern = re.compile(r'^\s*\d{3}-\s*$|^\s*\d{3}-\d{3}-\s*$')
-        
         for line in lines:
             line = line.strip()
             if not line:
                 continue
                 
             # Skip lines that match non-inventory patterns
-            if (phone_pattern.search(line) or 
-                address_pattern.search(line) or 
-                contact_pattern.search(line) or 
-                metadata_pattern.search(line) or
-                header_pattern.search(line) or
-                separator_pattern.search(line) or
-                phone_fragment_pattern.search(line)):
+            if _NON_INVENTORY_PATTERN.search(line):
                 continue
                 
             # Skip very short lines (likely not line items)
@@ -441,7 +534,7 @@ class Invoice2DataParser:
                 continue
                 
             # Skip lines that are mostly punctuation
-            if len(re.sub(r'[^\w\s]', '', line)) < 3:
+            if len(_PUNCTUATION_PATTERN.sub('', line)) < 3:
                 continue
                 
             # Check if line is likely a line item
@@ -454,74 +547,35 @@ class Invoice2DataParser:
     
     def _is_likely_line_item(self, line: str) -> bool:
         """Check if a line is likely a line item."""
-        import re
-        
         # Skip very short lines
         if len(line.strip()) < 5:
             return False
             
-        # Patterns that suggest a line item
-        price_pattern = re.compile(r'[\$€£¥₹₽₿₩₪₨₦₡₱₲₴₵₸₺₻₼₽₾₿]?\s*\d+[.,]\d{2}')
-        quantity_pattern = re.compile(r'^\s*\d+\s+')
-        product_pattern = re.compile(r'\b(?:Assembly|Housing|Bracket|Screw|Bushing|Coating|Service|Inspection|Product|Item|Part|Steel|Aluminum|Custom|Machined|Powder|Quality)\b', re.IGNORECASE)
-        
-        # Check for price indicators
-        if price_pattern.search(line):
-            return True
-            
-        # Check for quantity at start
-        if quantity_pattern.search(line):
-            return True
-            
-        # Check for product-related words
-        if product_pattern.search(line):
+        # Check for price indicators, quantity at start or product-related words
+        if _LINE_ITEM_HINT_PATTERN.search(line):
             return True
             
-        # Check for typical line item structure (description + price)
-        parts = line.split()
-        if len(parts) >= 2:
-            # Check if last part looks like a price
-            last_part = parts[-1]
-            if re.match(r'[\$€£¥₹₽₿₩₪₨₦₡₱₲₴₵₸₺₻₼₽₾₿]?\s*\d+[.,]\d{2}', last_part):
-                return True
+        # A trailing price (description + price) is covered by the price search
+        # above, so the line is not split into words to look at the last one
         
         # If line contains both text and numbers, it might be a line item
-        if re.search(r'[A-Za-z]', line) and re.search(r'\d', line):
+        if _LETTER_PATTERN.search(line) and _DIGIT_PATTERN.search(line):
             return True
         
         return False
     
     def _extract_structured_line_items(self, text: str) -> List:
         """Extract line items with proper European number format handling."""
-        import re
-        from .models import LineItem
-        
         line_items = []
         lines = text.split('\n')
         
-        # Pattern to match structured line items with multiple currencies
-        # Matches: Description Quantity CurrencyPrice CurrencyTotal (handles thousands separators)
-        line_item_pattern = re.compile(
-            r'^([A-Za-z\s\-\(\)0-9]+?)\s+(\d+)\s+([€$£¥₹₽₿₩₪₨₦₡₱₲₴₵₸₺₻₼₽₾₿])(\d+[.,]\d{2})\s+([€$£¥₹₽₿₩₪₨₦₡₱₲₴₵₸₺₻₼₽₾₿])(\d+(?:\.\d{3})?[.,]\d{2})\s*$'
-        )
-        
-        # Also try to match the combined line from pymupdf (handles thousands separators)
-        combined_pattern = re.compile(
-            r'([A-Za-z\s\-\(\)0-9]+?)\s+(\d+)\s+([€$£¥₹₽₿₩₪₨₦₡₱₲₴₵₸₺₻₼₽₾₿])(\d+[.,]\d{2})\s+([€$£¥₹₽₿₩₪₨₦₡₱₲₴₵₸₺₻₼₽₾₿])(\d+(?:\.\d{3})?[.,]\d{2})'
-        )
-        
-        # Pattern for lines that might be split across multiple lines (handles thousands separators)
-        multiline_pattern = re.compile(
-            r'([A-Za-z\s\-\(\)0-9]+?)\s+([€$£¥₹₽₿₩₪₨₦₡₱₲₴₵₸₺₻₼₽₾₿])(\d+[.,]\d{2})\s+([€$£¥₹₽₿₩₪₨₦₡₱₲₴₵₸₺₻₼₽₾₿])(\d+(?:\.\d{3})?[.,]\d{2})'
-        )
-        
         for line in lines:
             line = line.strip()
             if not line:
                 continue
                 
             # Try individual line pattern first
-            match = line_item_pattern.search(line)
+            match = _LINE_ITEM_PATTERN.search(line)
             if match:
                 description, quantity, unit_price, total = match.groups()
                 # Filter out invalid descriptions
@@ -533,7 +587,7 @@ class Invoice2DataParser:
                 continue
             
             # Try combined line pattern (for pymupdf extraction)
-            matches = combined_pattern.findall(line)
+            matches = _COMBINED_LINE_ITEM_PATTERN.findall(line)
             for match in matches:
                 description, quantity, unit_price, total = match
                 # Filter out invalid descriptions
@@ -544,7 +598,7 @@ class Invoice2DataParser:
                     line_items.append(line_item)
             
             # Try multiline pattern for cases where quantity is missing
-            multiline_matches = multiline_pattern.findall(line)
+            multiline_matches = _MULTILINE_ITEM_PATTERN.findall(line)
             for match in multiline_matches:
                 description, unit_price, total = match
                 # Filter out invalid descriptions
@@ -611,8 +665,6 @@ class Invoice2DataParser:
     
     def _preprocess_line_items(self, text: str) -> str:
         """Pre-process text to better reconstruct line items from table format."""
-        import re
-        
         lines = text.split('\n')
         processed_lines = []
         current_line_item = []
@@ -658,39 +710,29 @@ class Invoice2DataParser:
     
     def _split_combined_line_items(self, combined_line: str) -> List[str]:
         """Split a combined line into individual line items."""
-        import re
-        
-        # Pattern to match individual line items with European format (handles thousands separators)
         # Look for: description + €price + €total (more flexible to capture product names with numbers)
-        line_item_pattern = re.compile(
-            r'([A-Za-z\s\-\(\)0-9]+?)\s+€(\d+[.,]\d{2})\s+€(\d+(?:\.\d{3})?[.,]\d{2})'
-        )
-        
-        matches = line_item_pattern.findall(combined_line)
+        matches = _EURO_ITEM_PATTERN.findall(combined_line)
         individual_items = []
         
         for match in matches:
             description, unit_price, total = match
             # Clean up description - remove ZIP codes and other prefixes
-            description = re.sub(r'^\d{5}\s+', '', description.strip())  # Remove ZIP code prefix
-            description = re.sub(r'^[A-Z]{2}\s+\d{5}\s+', '', description)  # Remove state + ZIP
+            description = _ZIP_PREFIX_PATTERN.sub('', description.strip())  # Remove ZIP code prefix
+            description = _STATE_ZIP_PREFIX_PATTERN.sub('', description)  # Remove state + ZIP
             # Create individual line item
             line_item = f"{description.strip()} €{unit_price} €{total}"
             individual_items.append(line_item)
         
         # If no matches found, try alternative pattern for lines with quantities (handles thousands separators)
         if not individual_items:
-            # Pattern for: description + quantity + €price + €total (more flexible for product names with numbers)
-            alt_pattern = re.compile(
-                r'([A-Za-z\s\-\(\)0-9]+?)\s+(\d+)\s+€(\d+[.,]\d{2})\s+€(\d+(?:\.\d{3})?[.,]\d{2})'
-            )
-            alt_matches = alt_pattern.findall(combined_line)
+            # Look for: description + quantity + €price + €total (more flexible for product names with numbers)
+            alt_matches = _EURO_QUANTITY_ITEM_PATTERN.findall(combined_line)
             
             for match in alt_matches:
                 description, quantity, unit_price, total = match
                 # Clean up description - remove ZIP codes and other prefixes
-                description = re.sub(r'^\d{5}\s+', '', description.strip())  # Remove ZIP code prefix
-                description = re.sub(r'^[A-Z]{2}\s+\d{5}\s+', '', description)  # Remove state + ZIP
+                description = _ZIP_PREFIX_PATTERN.sub('', description.strip())  # Remove ZIP code prefix
+                description = _STATE_ZIP_PREFIX_PATTERN.sub('', description)  # Remove state + ZIP
                 line_item = f"{description.strip()} {quantity} €{unit_price} €{total}"
                 individual_items.append(line_item)
         
@@ -702,21 +744,19 @@ class Invoice2DataParser:
     
     def _clean_extracted_text(self, text: str) -> str:
         """Clean extracted text to remove HTML artifacts and encoding issues."""
-        import re
-        
         # Remove HTML-like artifacts
-        text = re.sub(r'<0a>', '\n', text)
-        text = re.sub(r'<[0-9a-f]{2}>', '', text)
+        text = _ENCODED_NEWLINE_PATTERN.sub('\n', text)
+        text = _HEX_CODE_PATTERN.sub('', text)
         
         # Remove error messages
-        text = re.sub(r'Internal Error:.*?\.', '', text, flags=re.DOTALL)
-        text = re.sub(r'Cannot handle URI.*?\.', '', text, flags=re.DOTALL)
+        text = _INTERNAL_ERROR_PATTERN.sub('', text)
+        text = _URI_ERROR_PATTERN.sub('', text)
         
         # Remove very long words (likely encoding issues)
-        text = re.sub(r'\b[A-Za-z]{20,}\b', '', text)
+        text = _LONG_WORD_PATTERN.sub('', text)
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RUN_PATTERN.sub(' ', text)
         
         # Remove lines that are mostly special characters
         lines = text.split('\n')
@@ -724,7 +764,7 @@ class Invoice2DataParser:
         for line in lines:
             # Skip lines that are mostly special characters
             if len(line.strip()) > 0:
-                alphanumeric_ratio = len(re.findall(r'[A-Za-z0-9]', line)) / len(line) if line else 0
+                alphanumeric_ratio = len(_ALPHANUMERIC_PATTERN.findall(line)) / len(line) if line else 0
                 if alphanumeric_ratio > 0.3:  # At least 30% alphanumeric
                     cleaned_lines.append(line)
         
@@ -732,56 +772,30 @@ class Invoice2DataParser:
     
     def _is_garbled_text(self, text: str) -> bool:
         """Check if the extracted text is garbled or unusable."""
-        import re
-        
         # Check for common garbled text indicators
-        garbled_indicators = [
-            r'<0a>',  # HTML-like artifacts
-            r'<[0-9a-f]{2}>',  # Hex codes
-            r'Internal Error:',  # Error messages
-            r'Cannot handle URI',  # URI errors
-            r'[A-Za-z]{20,}',  # Very long words (likely encoding issues)
-            r'[^\x00-\x7F]{10,}',  # Too many non-ASCII characters
-        ]
-        
-        for pattern in garbled_indicators:
-            if re.search(pattern, text):
+        for pattern in _GARBLED_TEXT_PATTERNS:
+            if pattern.search(text):
                 return True
         
         # Check if text has too many special characters
-        special_char_ratio = len(re.findall(r'[^\w\s]', text)) / len(text) if text else 0
+        special_char_ratio = len(_PUNCTUATION_PATTERN.findall(text)) / len(text) if text else 0
         if special_char_ratio > 0.3:  # More than 30% special characters
             return True
         
         # Check if text has too many consecutive non-alphanumeric characters
-        if re.search(r'[^\w\s]{5,}', text):
+        if _SPECIAL_CHAR_RUN_PATTERN.search(text):
             return True
         
         return False
     
     def _is_line_item_component(self, line: str) -> bool:
         """Check if a line is likely part of a line item."""
-        import re
-        
-        # Patterns that suggest this is part of a line item
-        price_pattern = re.compile(r'€\d+[.,]\d{2}')
-        quantity_pattern = re.compile(r'^\s*\d+\s*$')
-        product_pattern = re.compile(r'\b(?:Assembly|Housing|Bracket|Screw|Bushing|Coating|Service|Inspection|Steel|Aluminum|Custom|Machined|Powder|Quality)\b', re.IGNORECASE)
-        
-        # Check for price indicators
-        if price_pattern.search(line):
-            return True
-            
-        # Check for quantity
-        if quantity_pattern.search(line):
-            return True
-            
-        # Check for product-related words
-        if product_pattern.search(line):
+        # Check for price indicators, a bare quantity or product-related words
+        if _LINE_ITEM_COMPONENT_HINT_PATTERN.search(line):
             return True
         
         # Check if line contains both text and numbers (likely part of a line item)
-        if re.search(r'[A-Za-z]', line) and re.search(r'\d', line):
+        if _LETTER_PATTERN.search(line) and _DIGIT_PATTERN.search(line):
             return True
         
         return False
\ No newline at end of file
@@ -9,6 +9,10 @@ from typing import List
 @dataclass
 class LineItem:
     """Represents a single line item in a quote."""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10): many of these
+    # are created per document, so skip the per-instance __dict__
+    __slots__ = ('description', 'quantity', 'unit_price', 'cost')
+
     description: str
     quantity: str
     unit_price: str
@@ -18,6 +22,8 @@ class LineItem:
 @dataclass
 class QuoteGroup:
     """Represents a group of quotes for a specific quantity."""
+    __slots__ = ('quantity', 'unit_price', 'total_price', 'line_items')
+
     quantity: str
     unit_price: str
     total_price: str
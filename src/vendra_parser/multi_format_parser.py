@@ -11,24 +11,82 @@ Uses multiple libraries to handle different PDF formats:
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from decimal import Decimal
 import json
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by _filter_non_inventory_content to identify non-inventory content.
+# Phone, address, contact and metadata lines are all dropped the same way, so
+# they are fused into one alternation and each line is scanned once.
+_NON_INVENTORY_PATTERN = re.compile('|'.join([
+    r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # US phone numbers
+    r'\b\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,4}\b',  # General phone patterns
+    r'\b\d{10,15}\b',  # Long number sequences
+
+    r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Place|Pl|Court|Ct)\b',
+    r'\b[A-Za-z\s]+,?\s+[A-Z]{2}\s+\d{5}\b',  # City, State ZIP
+    r'\b[A-Za-z\s]+\s+[A-Z]{2}\s+\d{5}\b',  # City State ZIP
+
+    r'\b(?:Phone|Tel|Telephone|Fax|Email|E-mail|Contact|Address|Attn|Attention)\s*[:=]\s*\S+',
+    r'\b(?:Phone|Tel|Telephone|Fax|Email|E-mail|Contact|Address|Attn|Attention)\b',
+
+    r'\b(?:Quote|Invoice|Order|PO|Purchase\s+Order)\s*#?\s*\d+\b',
+    r'\b(?:Date|Due\s+Date|Valid\s+Until|Expires|Issue\s+Date)\s*[:=]\s*\S+',
+    r'\b(?:Page|P)\s+\d+\s+(?:of|/)\s+\d+\b',
+    r'\b(?:Terms|Conditions|Payment|Thank\s+You|Signature|Printed\s+Name)\b',
+]), re.IGNORECASE)
+_NUMBER_ONLY_PATTERN = re.compile(r'^\s*\d+(?:[-.\s]\d+)*\s*$')
+_PUNCTUATION_ONLY_PATTERN = re.compile(r'^\s*[^\w\s]*\s*$')
+_HEADER_PATTERN = re.compile(r'^\s*(?:Description|Item|Part|Qty|Quantity|Unit\s+Price|Amount|Total|Cost)\s*$', re.IGNORECASE)
+_SEPARATOR_PATTERN = re.compile(r'^\s*[-=_*]{3,}\s*$')
+
+# Price, quantity and product hints used by _is_likely_line_item, fused into
+# one alternation so each line is scanned once. It is matched against the
+# lowercased line; the price alternatives contain no letters.
+_LINE_ITEM_HINT_PATTERN = re.compile('|'.join([
+    # Prices
+    r'\$\d+(?:,\d{3})*(?:\.\d{2})?',  # $1,234.56
+    r'\d+(?:,\d{3})*(?:\.\d{2})?\s*\$',  # 1,234.56 $
+    r'\d+(?:,\d{3})*(?:\.\d{2})?',  # 1,234.56
+    # Quantities
+    r'\b\d+\s*(?:pcs?|pieces?|units?|items?)\b',  # 5 pcs, 3 pieces
+    r'\b(?:qty|quantity)\s*[:=]?\s*\d+\b',  # Qty: 5
+    # Product descriptions
+    r'\b(?:screw|bolt|nut|washer|bearing|motor|sensor|valve|pump|filter|cable|connector)\b',
+    r'\b(?:steel|aluminum|plastic|copper|brass|stainless)\b',
+    r'\b(?:machining|assembly|installation|service|maintenance|repair)\b',
+]))
+_DIGITS_PATTERN = re.compile(r'\d+')
+_LETTER_PATTERN = re.compile(r'[A-Za-z]')
+
 class MultiFormatPDFParser:
     """
     Advanced PDF parser that uses multiple libraries to handle different PDF formats.
     Tries different extraction methods and picks the best result.
     """
     
+    # A first page with at least this many non-whitespace characters of
+    # embedded text marks a born-digital PDF, for which OCR is skipped
+    MIN_TEXT_LAYER_CHARS = 200
+    
     def __init__(self):
         self.extraction_methods = [
             ('pdfplumber', self._extract_with_pdfplumber),
             ('pymupdf', self._extract_with_pymupdf),
             ('ocr', self._extract_with_ocr),
         ]
+        # Line-item parser shared by every extraction method
+        self._line_item_parser = None
+    
+    def _get_line_item_parser(self):
+        """Return the shared DynamicOCRParser used to process extracted text."""
+        if self._line_item_parser is None:
+            from .ocr_parser import DynamicOCRParser
+            self._line_item_parser = DynamicOCRParser()
+        return self._line_item_parser
     
     def parse_quote(self, pdf_path: str) -> Dict[str, Any]:
         """
@@ -38,11 +96,27 @@ class MultiFormatPDFParser:
         
         results = []
         
-        # Try each extraction method
-        for method_name, method_func in self.extraction_methods:
-            try:
+        # Rasterizing and OCR'ing a born-digital PDF is several times slower
+        # than reading its text layer and rarely finds anything more
+        extraction_methods = self.extraction_methods
+        if self._has_text_layer(pdf_path):
+            logger.info("📄 Embedded text layer found, skipping OCR extraction")
+            extraction_methods = [(name, func) for name, func in extraction_methods if name != 'ocr']
+        
+        # The extraction methods are independent of each other, so run them
+        # concurrently. OCR spends its time in tesseract and PyMuPDF in C code,
+        # both of which overlap with pdfplumber's Python-level parsing.
+        self._get_line_item_parser()  # create the shared parser before the workers start
+        with ThreadPoolExecutor(max_workers=len(extraction_methods)) as executor:
+            futures = []
+            for method_name, method_func in extraction_methods:
                 logger.info(f"📊 Trying {method_name} extraction...")
-                result = method_func(pdf_path)
+                futures.append((method_name, executor.submit(method_func, pdf_path)))
+        
+        # Collect in method order so ties resolve the same way as before
+        for method_name, future in futures:
+            try:
+                result = future.result()
                 if result and self._validate_result(result):
                     quality_score = self._score_result_quality(result)
                     results.append({
@@ -66,36 +140,57 @@ class MultiFormatPDFParser:
         
         return best_result['result']
     
+    def _has_text_layer(self, pdf_path: str) -> bool:
+        """Check whether the first page carries enough embedded text to skip OCR."""
+        try:
+            import pdfplumber
+            
+            with pdfplumber.open(pdf_path) as pdf:
+                if not pdf.pages:
+                    return False
+                text = pdf.pages[0].extract_text() or ""
+        except Exception as e:
+            logger.debug(f"Text layer check failed: {str(e)}")
+            return False
+        
+        # CID placeholders mean the font has no usable mapping, so OCR is still needed
+        if 'cid:' in text:
+            return False
+        return sum(1 for ch in text if not ch.isspace()) >= self.MIN_TEXT_LAYER_CHARS
+    
     def _extract_with_pdfplumber(self, pdf_path: str) -> Optional[Dict[str, Any]]:
         """Extract using pdfplumber - best for table-based documents."""
         try:
             import pdfplumber
             
             with pdfplumber.open(pdf_path) as pdf:
-                all_text = ""
+                # Text pieces are collected and joined once at the end
+                text_parts = []
                 tables = []
                 
                 for page in pdf.pages:
                     # Extract text
                     text = page.extract_text()
                     if text:
-                        all_text += text + "\n"
+                        text_parts.append(text + "\n")
                     
                     # Extract tables and convert to text
                     page_tables = page.extract_tables()
+                    # Drop the page's parsed layout objects now rather than
+                    # holding every page's until the document closes
+                    page.flush_cache()
                     for table in page_tables:
                         if table and len(table) > 1:  # Skip empty tables
                             # Convert table to text format
-                            table_text = ""
                             for row in table:
                                 if row:
                                     # Filter out None values and join with tabs
                                     row_text = "\t".join([str(cell) if cell else "" for cell in row])
-                                    table_text += row_text + "\n"
-                            all_text += table_text + "\n"
+                                    text_parts.append(row_text + "\n")
+                            text_parts.append("\n")
                             tables.append(table)
                 
-                return self._process_extracted_data(all_text, tables, "pdfplumber")
+                return self._process_extracted_data("".join(text_parts), tables, "pdfplumber")
                 
         except Exception as e:
             logger.warning(f"pdfplumber extraction failed: {str(e)}")
@@ -107,13 +202,14 @@ class MultiFormatPDFParser:
             import fitz  # PyMuPDF
             
             doc = fitz.open(pdf_path)
-            all_text = ""
+            # Text pieces are collected and joined once at the end
+            text_parts = []
             
             for page in doc:
                 # Get text with better formatting
                 text = page.get_text("text")
                 if text:
-                    all_text += text + "\n"
+                    text_parts.append(text + "\n")
                 
                 # Also try to get text with layout preservation
                 try:
@@ -125,13 +221,13 @@ class MultiFormatPDFParser:
                                     if "spans" in line:
                                         line_text = " ".join([span["text"] for span in line["spans"]])
                                         if line_text.strip():
-                                            all_text += line_text + "\n"
+                                            text_parts.append(line_text + "\n")
                 except:
                     pass  # Fallback to basic text extraction
             
             doc.close()
             
-            return self._process_extracted_data(all_text, [], "pymupdf")
+            return self._process_extracted_data("".join(text_parts), [], "pymupdf")
             
         except Exception as e:
             logger.warning(f"PyMuPDF extraction failed: {str(e)}")
@@ -148,14 +244,14 @@ class MultiFormatPDFParser:
             # Convert PDF to images
             images = convert_from_path(pdf_path)
             
-            all_text = ""
+            page_texts = []
             for image in images:
                 # Extract text using OCR
                 text = pytesseract.image_to_string(image)
                 if text:
-                    all_text += text + "\n"
+                    page_texts.append(text + "\n")
             
-            return self._process_extracted_data(all_text, [], "ocr")
+            return self._process_extracted_data("".join(page_texts), [], "ocr")
             
         except Exception as e:
             logger.warning(f"OCR extraction failed: {str(e)}")
@@ -169,8 +265,7 @@ class MultiFormatPDFParser:
         filtered_text = self._filter_non_inventory_content(text)
         
         # Use the existing OCR parser logic for processing
-        from .ocr_parser import DynamicOCRParser
-        parser = DynamicOCRParser()
+        parser = self._get_line_item_parser()
         
         # Extract line items from filtered text
         line_items = parser.discover_line_items_dynamically(filtered_text)
@@ -217,57 +312,21 @@ class MultiFormatPDFParser:
     
     def _filter_non_inventory_content(self, text: str) -> str:
         """Filter out non-inventory content like phone numbers, addresses, etc."""
-        import re
-        
         lines = text.split('\n')
         filtered_lines = []
         
-        # Patterns to identify non-inventory content
-        phone_patterns = [
-            r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b',  # US phone numbers
-            r'\b\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,4}\b',  # General phone patterns
-            r'\b\d{10,15}\b',  # Long number sequences
-        ]
-        
-        address_patterns = [
-            r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Place|Pl|Court|Ct)\b',
-            r'\b[A-Za-z\s]+,?\s+[A-Z]{2}\s+\d{5}\b',  # City, State ZIP
-            r'\b[A-Za-z\s]+\s+[A-Z]{2}\s+\d{5}\b',  # City State ZIP
-        ]
-        
-        contact_patterns = [
-            r'\b(?:Phone|Tel|Telephone|Fax|Email|E-mail|Contact|Address|Attn|Attention)\s*[:=]\s*\S+',
-            r'\b(?:Phone|Tel|Telephone|Fax|Email|E-mail|Contact|Address|Attn|Attention)\b',
-        ]
-        
-        metadata_patterns = [
-            r'\b(?:Quote|Invoice|Order|PO|Purchase\s+Order)\s*#?\s*\d+\b',
-            r'\b(?:Date|Due\s+Date|Valid\s+Until|Expires|Issue\s+Date)\s*[:=]\s*\S+',
-            r'\b(?:Page|P)\s+\d+\s+(?:of|/)\s+\d+\b',
-            r'\b(?:Terms|Conditions|Payment|Thank\s+You|Signature|Printed\s+Name)\b',
-        ]
-        
-        # Compile patterns for efficiency
-        phone_regex = re.compile('|'.join(phone_patterns), re.IGNORECASE)
-        address_regex = re.compile('|'.join(address_patterns), re.IGNORECASE)
-        contact_regex = re.compile('|'.join(contact_patterns), re.IGNORECASE)
-        metadata_regex = re.compile('|'.join(metadata_patterns), re.IGNORECASE)
-        
         for line in lines:
             line = line.strip()
             if not line:
                 continue
             
             # Skip lines that are clearly non-inventory
-            if (phone_regex.search(line) or 
-                address_regex.search(line) or 
-                contact_regex.search(line) or 
-                metadata_regex.search(line)):
+            if _NON_INVENTORY_PATTERN.search(line):
                 logger.debug(f"Filtered out non-inventory line: {line}")
                 continue
             
             # Skip lines that are just numbers without context
-            if re.match(r'^\s*\d+(?:[-.\s]\d+)*\s*$', line):
+            if _NUMBER_ONLY_PATTERN.match(line):
                 logger.debug(f"Filtered out number-only line: {line}")
                 continue
             
@@ -276,16 +335,16 @@ class MultiFormatPDFParser:
                 continue
             
             # Skip lines that are just punctuation or special characters
-            if re.match(r'^\s*[^\w\s]*\s*$', line):
+            if _PUNCTUATION_ONLY_PATTERN.match(line):
                 continue
             
             # Skip lines that look like headers or labels
-            if re.match(r'^\s*(?:Description|Item|Part|Qty|Quantity|Unit\s+Price|Amount|Total|Cost)\s*$', line, re.IGNORECASE):
+            if _HEADER_PATTERN.match(line):
                 logger.debug(f"Filtered out header line: {line}")
                 continue
             
             # Skip lines that are just separators or dividers
-            if re.match(r'^\s*[-=_*]{3,}\s*$', line):
+            if _SEPARATOR_PATTERN.match(line):
                 continue
             
             # Only include lines that are likely to be line items
@@ -298,47 +357,12 @@ class MultiFormatPDFParser:
     
     def _is_likely_line_item(self, line: str) -> bool:
         """Check if a line is likely to be a line item based on content patterns."""
-        import re
-        
-        # Look for price patterns
-        price_patterns = [
-            r'\$\d+(?:,\d{3})*(?:\.\d{2})?',  # $1,234.56
-            r'\d+(?:,\d{3})*(?:\.\d{2})?\s*\$',  # 1,234.56 $
-            r'\d+(?:,\d{3})*(?:\.\d{2})?',  # 1,234.56
-        ]
-        
-        # Look for quantity patterns
-        quantity_patterns = [
-            r'\b\d+\s*(?:pcs?|pieces?|units?|items?)\b',  # 5 pcs, 3 pieces
-            r'\b(?:qty|quantity)\s*[:=]?\s*\d+\b',  # Qty: 5
-        ]
-        
-        # Look for product description patterns
-        product_patterns = [
-            r'\b(?:screw|bolt|nut|washer|bearing|motor|sensor|valve|pump|filter|cable|connector)\b',
-            r'\b(?:steel|aluminum|plastic|copper|brass|stainless)\b',
-            r'\b(?:machining|assembly|installation|service|maintenance|repair)\b',
-        ]
-        
-        line_lower = line.lower()
-        
-        # Check for price patterns
-        for pattern in price_patterns:
-            if re.search(pattern, line):
-                return True
-        
-        # Check for quantity patterns
-        for pattern in quantity_patterns:
-            if re.search(pattern, line_lower):
-                return True
-        
-        # Check for product description patterns
-        for pattern in product_patterns:
-            if re.search(pattern, line_lower):
-                return True
+        # Check for price, quantity and product description patterns
+        if _LINE_ITEM_HINT_PATTERN.search(line.lower()):
+            return True
         
         # If line contains both text and numbers, it might be a line item
-        if re.search(r'\d+', line) and re.search(r'[A-Za-z]', line):
+        if _DIGITS_PATTERN.search(line) and _LETTER_PATTERN.search(line):
             return True
         
         return False
@@ -368,6 +392,9 @@ class MultiFormatPDFParser:
                 'totalPrice': '0.00',
                 'lineItems': []
             }
+            # Running totals stay numeric and are only formatted when the group is closed
+            group_quantity = 0
+            group_total = Decimal('0.00')
             
             for item in unique_items:
                 if item.unit_price == current_group['unitPrice']:
@@ -378,12 +405,16 @@ class MultiFormatPDFParser:
                         'unitPrice': item.unit_price,
                         'cost': item.cost
                     })
-                    current_group['quantity'] = str(int(current_group['quantity']) + int(item.quantity))
-                    current_group['totalPrice'] = str(Decimal(current_group['totalPrice']) + Decimal(item.cost))
+                    group_quantity += int(item.quantity)
+                    group_total += Decimal(item.cost)
                 else:
                     # Start new group
                     if current_group['lineItems']:
+                        current_group['quantity'] = str(group_quantity)
+                        current_group['totalPrice'] = str(group_total)
                         groups.append(current_group)
+                    group_quantity = int(item.quantity)
+                    group_total = Decimal(item.cost)
                     current_group = {
                         'quantity': item.quantity,
                         'unitPrice': item.unit_price,
@@ -398,6 +429,8 @@ class MultiFormatPDFParser:
             
             # Add last group
             if current_group['lineItems']:
+                current_group['quantity'] = str(group_quantity)
+                current_group['totalPrice'] = str(group_total)
                 groups.append(current_group)
         
         return groups
@@ -5,10 +5,19 @@ No hardcoded assumptions - extracts data purely based on patterns found.
 """
 
 import re
+import contextlib
+import functools
+import hashlib
+import io
 import logging
 import subprocess
 import tempfile
+import threading
+import time
 import os
+import queue
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from decimal import Decimal, InvalidOperation
 import json
@@ -16,54 +25,771 @@ import json
 from .models import LineItem, QuoteGroup
 from .domain_parser import parse_with_domain_knowledge
 
+# Optional fast JSON encoder/decoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional fast non-cryptographic hash for page image cache keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional in-process tesseract bindings (no process spawn per page)
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Patterns used by the per-line OCR cleanup in _preprocess_extracted_text
+_CID_SEQUENCE_PATTERN = re.compile(r'\bcid:\d+\s*')
+_WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+_PUNCTUATION_ONLY_PATTERN = re.compile(r'^[:\s\.\,\-]+$')
+_NUMBER_LIKE_WORD_PATTERN = re.compile(r'[\$\d\.,\-O0lI§S]+$')
+_NUMBER_TOKEN_PATTERN = re.compile(r'[\d,]+\.?\d*')
+_SIGNED_NUMBER_TOKEN_PATTERN = re.compile(r'(-?[\d,]+\.?\d*)')
+_CID_TOKEN_PATTERN = re.compile(r'cid:\d+')
+
+# Patterns used by price normalization
+_CURRENCY_SYMBOL_PATTERN = re.compile(r'[\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿\$]')
+_SPACE_OR_DOT_PATTERN = re.compile(r'[\s\.]')
+_SPACE_OR_COMMA_PATTERN = re.compile(r'[\s,]')
+_NUMBER_SEPARATOR_PATTERN = re.compile(r'[\s,\.]')
+# Plain unsigned decimals with no currency symbol or grouping, which every
+# locale-aware parse reads the same way
+_PLAIN_DECIMAL_PATTERN = re.compile(r'[0-9]+(?:\.[0-9]+)?')
+
+# Patterns used by line item discovery and multiline reconstruction
+_DIGITS_PATTERN = re.compile(r'\d+')
+_SHORT_INTEGER_PATTERN = re.compile(r'\b(\d{1,4})\b')
+# Currency amounts, integers and decimals (including negative), avoiding part number fragments
+_LINE_AMOUNT_PATTERN = re.compile(r'-?\d+(?:,\d{3})*(?:\.\d{2})?')
+_TABLE_NUMBER_PATTERN = re.compile(r'\d+(?:,\d{3})*(?:\.\d{2})?')
+_PART_NUMBER_PATTERN = re.compile(r'[A-Z]+-\d+')  # e.g. "ROGUE-345"
+_PRODUCT_CODE_PATTERN = re.compile(r'[A-Z]+-\d+|[A-Z]+\d+')
+_PART_NUMBER_GAP_AFTER_UNDERSCORE = re.compile(r'(\d+)_\s+(\d+-)')  # "19_ 5-" -> "19_5-"
+_PART_NUMBER_GAP_BEFORE_UNDERSCORE = re.compile(r'(\d+)\s+_(\d+-)')  # "19 _5-" -> "19_5-"
+_DESCRIPTION_JUNK_PATTERN = re.compile(r'[^\w\s\-_:]')
+_CONTINUATION_LINE_PATTERN = re.compile('|'.join([
+    r'^(machine|de-burr|and|material|clear|steel|polypropylene)',  # Common description words
+    r'^[a-zA-Z\s\-_:]+$',  # Only letters/spaces/basic punctuation
+    r'^\w+\s+(and|de-burr|material)',  # Technical terms
+]))
+
+# Skip obvious non-line-item lines using more specific patterns.
+# Use patterns that require context to avoid blocking legitimate products.
+_SKIP_LINE_PATTERNS = [
+    # Financial summary lines
+    r'\btotal\s*:', r'\bsubtotal\s*:', r'\bbalance\s*:', r'\bgrand\s+total\b',
+    r'\bnet\s+total\b', r'\btax\s*:', r'\bdiscount\s*:', r'\bshipping\s*:',
+    r'^\s*total\s*\$', r'^\s*subtotal\s*\$', r'^\s*tax\s*\$',
+    
+    # Document metadata
+    r'\bquote\s*#', r'\binvoice\s*#', r'\border\s*#', r'\bpo\s*#',
+    r'\bdate\s*:', r'\bpage\s*:', r'\bdue\s+date\s*:', r'\bvalid\s+(until|through|for)\b',
+    r'\breport\s+generated\s*:', r'\bpage\s+\d+\s+of\s+\d+\b', 
+    
+    # Contact information
+    r'\bphone\s*:', r'\bfax\s*:', r'\bemail\s*:', r'\baddress\s*:',
+    r'\bcontact\s*:', r'\battn\s*:', r'\bto\s*:', r'\bfrom\s*:',
+    
+    # Terms and conditions
+    r'\bterms\s+and\s+conditions\b', r'\bpayment\s+terms\b', r'\bthank\s+you\b',
+    r'\bsignature\b', r'\bprinted\s+name\b',
+    
+    # Shipping and logistics (not inventory items)
+    r'^\s*freight\s*(shipping)?\s*$', r'^\s*shipping\s*(and\s+handling)?\s*$',
+    r'^\s*lead\s+time\s*', r'^\s*delivery\s*', r'^\s*via\s*:',
+    
+    # Headers and labels
+    r'\bdescription\s*:', r'\bunit\s+price\b', r'\bamount\s*:', r'\bqty\s*:',
+    r'\bquantity\s*:', r'\bitem\s+code\b', r'\bpart\s+number\b',
+    r'service/product\s+description', r'hours/quantity', r'hourly\s+fee',
+    
+    # Business metadata
+    r'\bquote\s+by\b', r'\border\s+by\b', r'\bmoq\s*:', r'\bweeks\s+after\b', 
+    r'\breceipt\s+of\b', r'\bquotation\s*:'
+]
+_SKIP_LINE_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in _SKIP_LINE_PATTERNS))
+
+# Descriptions matching any of these are obviously not products
+_OBVIOUS_NOISE_PATTERN = re.compile('|'.join([
+    r'https?://|www\.',
+    r'[A-Z]:\\|/Users/|/home/',
+    r'[<>/\\|&{}[\]]{2,}',
+    r'postcode\s+format',  # Test content
+    r'ice\s+code',  # Corrupted test content
+    r'qa-pressure-test',  # Test content
+    r'mingham\s+b15',  # Corrupted content
+]), re.IGNORECASE)
+
+# Descriptions that are actual shipping charges (not products)
+_SHIPPING_CHARGE_PATTERN = re.compile('|'.join([
+    # Standalone shipping terms
+    r'^freight$', r'^shipping$', r'^delivery$', r'^handling$', 
+    r'^postage$', r'^courier$', r'^express$', r'^overnight$',
+    
+    # Shipping with simple descriptors (3 words or less)
+    r'^freight\s+(shipping|cost|charge|fee)$',
+    r'^shipping\s+(and\s+handling|cost|charge|fee)$',
+    r'^delivery\s+(charge|fee|cost)$',
+    r'^handling\s+(charge|fee|cost)$',
+    
+    # Common shipping charge formats
+    r'^rush\s+delivery$', r'^expedited\s+shipping$',
+    r'^standard\s+shipping$', r'^ground\s+shipping$'
+]))
+
+# Test content and technical artifacts stripped from final descriptions.
+# Look for patterns that indicate test content without hardcoding specific terms.
+_TEST_CONTENT_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'expected\s+\w+\s+output',  # "expected X output"
+    r'different\s+\w+\s+format:',  # "different X format:"
+    r'different\s+\w+\s+structure:',  # "different X structure:"
+    r'detailed\s+\w+\s+information',  # "detailed X information"
+    r'json\s+\w+',  # "json X"
+    r'custom\s+\w+\s+\w+',  # "custom X Y"
+    r'mixed\s+units\s+pieces',  # "mixed units pieces"
+    r'clear\s+\w+\s+type',  # "clear X type"
+    r'p_r_i_c__in__g__',  # Corrupted pricing text
+    r'multi-line\s+descriptions\s+that\s+will\s+really\s+test',  # Test content
+    r'parser\s+s\s+robustness',  # Test content
+    r'p\s+hone:\s+\d+',  # Corrupted phone
+    r'print\s+name:\s+_+',  # Form field
+    r'postcode\s+format',  # Test content
+    r'ice\s+code',  # Corrupted test content
+    r'qa-pressure-test',  # Test content
+    r'mingham\s+b15',  # Corrupted content
+]]
+_TRAILING_AND_DIGIT_PATTERN = re.compile(r'\s+and\s+([1-9])\s*$')
+_TRAILING_COMMA_DIGIT_PATTERN = re.compile(r'\s+,\s*([1-9])\s*$')
+# Page suffix pdftoppm appends to its output root: -<page>.png
+_PAGE_IMAGE_SUFFIX_PATTERN = re.compile(r'-(\d+)\.png')
+
+# Keywords that raise the score of extracted text, matched against lowercased lines
+_PAGE_LINE_ITEM_KEYWORDS = ('qty', 'quantity', 'service', 'product')
+_QUOTE_CONTENT_KEYWORDS = ('service', 'product', 'freight', 'total', 'subtotal', 'quote', 'qty', 'quantity')
+
+# Address and contact detection
+_ZIP_CODE_PATTERN = re.compile(r'\b\d{5}(-\d{4})?\b')  # 5 digits, or 5+4 format
+_STREET_ADDRESS_PATTERN = re.compile(r'\b\d+\s+(street|avenue|road|drive|lane|blvd|st|ave|rd|dr|ln)\b')
+_LEADING_STREET_ADDRESS_PATTERN = re.compile(r'^\s*\d+\s+(street|avenue|road|drive|lane|blvd|st|ave|rd|dr|ln)')
+_SUITE_NUMBER_PATTERN = re.compile(r'(suite|ste|apt|apartment|unit|floor|room|#)\s*\d+')
+_PHONE_NUMBER_PATTERN = re.compile(r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b|\(\d{3}\)\s*\d{3}[-.\s]\d{4}')
+_EMAIL_PATTERN = re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b')
+_WEBSITE_PATTERN = re.compile(r'\bwww\.|\.com\b|\.org\b|\.net\b')
+_CITY_STATE_ZIP_PATTERN = re.compile(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\s+\d{5}\b')
+_NUMERIC_CHARS_PATTERN = re.compile(r'[\d,.$%-]+')
+_NON_WORD_CHAR_PATTERN = re.compile(r'[^\w\s]')
+
+# Keywords used by _is_address_or_contact_line, matched against lowercased lines
+_ADDRESS_KEYWORDS = (
+    'street', 'avenue', 'road', 'drive', 'lane', 'blvd', 'boulevard', 'st', 'ave', 'rd', 'dr', 'ln',
+    'suite', 'ste', 'apt', 'apartment', 'unit', 'floor', 'room', '#',
+    'san', 'francisco', 'jose', 'california', 'ca', 'los angeles', 'santa', 'north', 'south', 'east', 'west',
+    'city', 'county', 'state', 'zip', 'postal'
+)
+_CONTACT_KEYWORDS = (
+    'phone', 'tel', 'telephone', 'fax', 'email', 'mail', 'website', 'web', 'www',
+    'contact', 'attn', 'attention', 'to:', 'from:', 'c/o', 'care of'
+)
+# Company/header keywords that might contain numbers but aren't line items
+_COMPANY_KEYWORDS = (
+    'inc', 'corp', 'corporation', 'llc', 'ltd', 'limited', 'company', 'co',
+    'manufacturing', 'mfg', 'industries', 'group', 'enterprises'
+)
+# Manufacturing keywords that keep a company-looking line as a product line
+_PRODUCT_KEYWORDS = (
+    'material', 'materials', 'raw material', 'assembly', 'assemble', 'machining', 'machine', 'cnc',
+    'tooling', 'tools', 'tool setup', 'part', 'component', 'qty', 'quantity', 'base', 'basic', 'standard',
+    'solder', 'soldering', 'solder assembly', 'labor', 'labour', 'work', 'setup', 'set up', 'initial setup',
+    'finishing', 'finish', 'surface finish', 'packaging', 'package', 'pack', 'shipping', 'ship', 'delivery',
+    'design', 'engineering', 'prototype', 'proto', 'testing', 'test', 'quality', 'polycarbonate', 'steel',
+    'polypropylene', 'de-burr', 'deburr', 'clear', 'balancer', 'limiter', 'plug', 'cod'
+)
+
+
+def _keyword_regex(keyword: str) -> str:
+    """Regex for a keyword; short keywords only match as whole words to avoid false matches."""
+    if len(keyword) <= 3:
+        return r'\b' + re.escape(keyword) + r'\b'
+    return re.escape(keyword)
+
+
+# Each keyword set is fused into a single alternation so a line is scanned
+# once instead of once per keyword
+_ADDRESS_KEYWORD_MATCHERS = [(keyword, re.compile(_keyword_regex(keyword))) for keyword in _ADDRESS_KEYWORDS]
+_ADDRESS_KEYWORD_PATTERN = re.compile('|'.join(map(_keyword_regex, _ADDRESS_KEYWORDS)))
+_CONTACT_KEYWORD_PATTERN = re.compile('|'.join(map(_keyword_regex, _CONTACT_KEYWORDS)))
+_CONTACT_KEYWORD_SUBSTRING_PATTERN = re.compile('|'.join(map(re.escape, _CONTACT_KEYWORDS)))
+_COMPANY_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, _COMPANY_KEYWORDS)))
+_PRODUCT_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, _PRODUCT_KEYWORDS)))
+
+# Summary-level adjustments (tax, shipping, discounts, totals), matched
+# against lowercased lines (multi-currency support)
+_SUMMARY_ADJUSTMENT_PATTERNS = [(re.compile(pattern, re.IGNORECASE), adjustment_type) for pattern, adjustment_type in [
+    # Subtotal patterns - multi-currency (improved for European formats)
+    # Handle European format: €2.311,25 -> capture 2.311,25
+    (r'^subtotal\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'subtotal'),
+    (r'^sub[\s\-_]*total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'subtotal'),
+    
+    # Tax patterns - both absolute and percentage (percentage first to avoid conflicts)
+    (r'^tax\s*[:$]?\s*(\d+(?:\.\d{1,2})?)\s*%', 'tax_percentage'),
+    (r'^tax\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'tax_amount'),
+    (r'^sales\s+tax\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'tax_amount'),
+    (r'^sales\s+tax\s*[:$]?\s*(\d+(?:\.\d{1,2})?)\s*%', 'tax_percentage'),
+    
+    # Shipping/handling patterns - multi-currency
+    (r'^shipping\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'shipping'),
+    (r'^handling\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'handling'),
+    (r'^freight\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'freight'),
+    (r'^delivery\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'shipping'),
+    
+    # Discount patterns - both absolute and percentage
+    (r'^discount\s*[:$]?\s*-?[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'discount_amount'),
+    (r'^discount\s*[:$]?\s*-?(\d+(?:\.\d{1,2})?)\s*%', 'discount_percentage'),
+    
+    # Total patterns (to verify calculations) - multi-currency
+    (r'^total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'total'),
+    (r'^grand\s+total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'total'),
+    (r'^final\s+total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'total'),
+    (r'^quote\s+total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'total'),
+]]
+
+# Common OCR character misreads inside numbers
+_OCR_DIGIT_FIXES = str.maketrans({
+    'O': '0',  # Letter O -> Zero
+    'l': '1',  # Lowercase L -> One
+    'I': '1',  # Capital I -> One
+    'S': '5',  # S -> 5
+    '§': '5',  # Section symbol -> 5
+})
+
+
+# Version of the text extraction pipeline; bump to invalidate cached text
+# whenever extraction or cleanup changes in a way that alters the output
+# (3: pdftotext -layout text layer and the enhanced OCR DPI ladder)
+TEXT_CACHE_VERSION = 3
+
+# Version of the parsed-result cache used by parse_quote_to_json; bump when
+# line item discovery or totals change without a package version bump.
+# Results are derived from the extracted text, so bump this together with
+# TEXT_CACHE_VERSION as well.
+RESULT_CACHE_VERSION = 2
+
+
+def get_cache_dir() -> str:
+    """Return the on-disk cache directory (VENDRA_PARSER_CACHE_DIR or ~/.cache/vendra_parser)."""
+    return os.environ.get('VENDRA_PARSER_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'vendra_parser'
+    )
+
+
+# Cache files older than this are deleted the first time a parser with the
+# disk cache enabled is created in a process (VENDRA_PARSER_CACHE_MAX_AGE_DAYS)
+CACHE_MAX_AGE_DAYS = 30
+
+# Set once prune_cache_dir has run for this process
+_cache_pruned = False
+
+
+def disk_cache_enabled() -> bool:
+    """Return whether VENDRA_PARSER_DISK_CACHE opts parsers into the on-disk cache."""
+    return os.environ.get('VENDRA_PARSER_DISK_CACHE', '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def prune_cache_dir(max_age_days: Optional[float] = None) -> int:
+    """
+    Delete cache files under get_cache_dir() not written in the last max_age_days.
+    
+    Args:
+        max_age_days: Age limit (default: VENDRA_PARSER_CACHE_MAX_AGE_DAYS or CACHE_MAX_AGE_DAYS)
+        
+    Returns:
+        Number of files removed
+    """
+    if max_age_days is None:
+        try:
+            max_age_days = float(os.environ.get('VENDRA_PARSER_CACHE_MAX_AGE_DAYS', CACHE_MAX_AGE_DAYS))
+        except ValueError:
+            max_age_days = CACHE_MAX_AGE_DAYS
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for subdir in ('ocr', 'results', 'pages'):
+        directory = os.path.join(get_cache_dir(), subdir)
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError as e:
+                logger.debug(f"Could not prune cache file {entry.path}: {e}")
+    if removed:
+        logger.info(f"Removed {removed} cache files older than {max_age_days:g} days")
+    return removed
+
+
+def _prune_cache_once() -> None:
+    """Run prune_cache_dir the first time it is needed in this process."""
+    global _cache_pruned
+    if not _cache_pruned:
+        _cache_pruned = True
+        prune_cache_dir()
+
+
+@functools.lru_cache(maxsize=1)
+def _tesseract_version() -> str:
+    """Return the installed tesseract version string, or 'unknown'."""
+    try:
+        result = subprocess.run(['tesseract', '--version'], capture_output=True, text=True, check=True)
+        output = (result.stdout or result.stderr).strip()
+        return output.split('\n')[0] if output else 'unknown'
+    except (subprocess.CalledProcessError, OSError):
+        return 'unknown'
+
+
+def _extract_pdfplumber_page_texts(pdf_path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the embedded text of pages [start, stop) with pdfplumber ('' for empty pages).
+    
+    Module-level so it can run in a worker process; pdfplumber objects do not
+    pickle, so each worker opens the PDF itself.
+    """
+    import pdfplumber
+    
+    page_texts = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            page_texts.append(page.extract_text() or "")
+            # Drop the page's parsed layout objects before moving on
+            page.flush_cache()
+    return page_texts
+
+
+def _write_atomic(path: str, write) -> None:
+    """
+    Write to path via a temporary file so readers never see partial output.
+    
+    write is called with the temporary file, opened in binary mode.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_text_atomic(path: str, text: str) -> None:
+    """Write text to path as UTF-8 via a temporary file (see _write_atomic)."""
+    _write_atomic(path, lambda f: f.write(text.encode('utf-8')))
+
+
+def _dump_json(obj, stream) -> None:
+    """Stream indented JSON to a binary stream without building a str first."""
+    if ORJSON_AVAILABLE:
+        stream.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    
+    text_stream = io.TextIOWrapper(stream, encoding='utf-8')
+    try:
+        json.dump(obj, text_stream, indent=2)
+        text_stream.flush()
+    finally:
+        text_stream.detach()
+
+
+def _dumps_json(obj) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
+def _loads_json(text):
+    """Parse JSON text or UTF-8 bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _image_digest(path: str) -> str:
+    """Return a fast content digest of a rendered page image (xxh64 when installed)."""
+    digest = xxhash.xxh64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_sha256(path: str) -> str:
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TesserocrAPIPool:
+    """
+    Reusable tesserocr APIs keyed by tesseract arguments.
+    
+    Creating an API loads the language model, so APIs outlive the thread
+    pools that borrow them. An API is not thread-safe, so each is lent to one
+    thread at a time; at most max_per_config exist for any one configuration
+    and borrowers wait for a free one beyond that. close() ends them all.
+    """
+    
+    def __init__(self, max_per_config: int):
+        self.max_per_config = max(1, max_per_config)
+        self._idle: Dict[tuple, queue.Queue] = {}
+        self._created: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    @contextlib.contextmanager
+    def api(self, args: List[str]):
+        """Borrow an API configured for args (tesseract command line syntax)."""
+        key = tuple(args)
+        api = self._acquire(key)
+        try:
+            yield api
+        finally:
+            self._release(key, api)
+    
+    def close(self) -> None:
+        """End every idle API; APIs still lent out are ended when returned."""
+        with self._lock:
+            self._closed = True
+            idle_queues = list(self._idle.values())
+            self._idle.clear()
+        for idle in idle_queues:
+            while True:
+                try:
+                    idle.get_nowait().End()
+                except queue.Empty:
+                    break
+    
+    def _acquire(self, key: tuple):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("tesserocr API pool is closed")
+            idle = self._idle.setdefault(key, queue.Queue())
+            try:
+                return idle.get_nowait()
+            except queue.Empty:
+                pass
+            create = self._created.get(key, 0) < self.max_per_config
+            if create:
+                self._created[key] = self._created.get(key, 0) + 1
+        if not create:
+            return idle.get()
+        try:
+            return tesserocr.PyTessBaseAPI(**self._api_options(key))
+        except Exception:
+            with self._lock:
+                self._created[key] -= 1
+            raise
+    
+    def _release(self, key: tuple, api) -> None:
+        with self._lock:
+            idle = None if self._closed else self._idle.get(key)
+        if idle is None:
+            api.End()
+        else:
+            idle.put(api)
+    
+    @staticmethod
+    def _api_options(args: tuple) -> Dict[str, Any]:
+        """Translate --psm, --oem and -c name=value arguments to PyTessBaseAPI options."""
+        options = {'lang': 'eng', 'variables': {}}
+        arg_iter = iter(args)
+        for arg in arg_iter:
+            if arg == '--psm':
+                options['psm'] = int(next(arg_iter))
+            elif arg == '--oem':
+                options['oem'] = int(next(arg_iter))
+            elif arg == '-c':
+                name, _, value = next(arg_iter).partition('=')
+                options['variables'][name] = value
+        return options
+
 
 class DynamicOCRParser:
     """Dynamic OCR-based parser that makes no assumptions about structure."""
     
-    def __init__(self):
+    # Tesseract passes tried on every page by the enhanced OCR method
+    ENHANCED_OCR_PASSES = [
+        # Table-aware OCR: uniform block of text
+        ("table", ['--psm', '6', '-c', 'preserve_interword_spaces=1']),
+        # Line-oriented OCR: single column of text
+        ("lines", ['--psm', '4', '-c', 'preserve_interword_spaces=1']),
+        # Sparse text OCR (good for scattered data)
+        ("sparse", ['--psm', '11']),
+    ]
+    
+    # A page whose embedded text has at least this many characters (and at
+    # most this many CID sequences) is used as-is instead of being OCR'd
+    MIN_TEXT_LAYER_CHARS = 50
+    MAX_TEXT_LAYER_CIDS = 0
+    
+    # pdfplumber text extraction is CPU-bound Python, so when extraction_processes
+    # is above 1, documents with at least this many pages are split across that
+    # many worker processes (never more than the CPU count). Shorter ones are not
+    # worth the process start-up and re-opening the PDF.
+    PARALLEL_EXTRACTION_MIN_PAGES = 4
+    
+    # Seconds allowed for pdftotext to extract a document's text layer
+    PDFTOTEXT_TIMEOUT = 30
+    
+    # The basic OCR method renders pages at BASIC_OCR_DPI, which is plenty for
+    # typed quotes and much cheaper to OCR. Pages whose mean tesseract word
+    # confidence falls below MIN_PAGE_CONFIDENCE are re-rendered at
+    # BASIC_OCR_RETRY_DPI and the more confident result is kept.
+    BASIC_OCR_DPI = 150
+    BASIC_OCR_RETRY_DPI = 300
+    MIN_PAGE_CONFIDENCE = 70
+    
+    # Rendering resolutions tried by the enhanced OCR method, lowest first.
+    # A page moves up the ladder only while its best score stays at or below
+    # LOW_CONFIDENCE_PAGE_SCORE (no line item indicators, or mostly garbled).
+    ENHANCED_OCR_DPI_LADDER = (300, 600)
+    LOW_CONFIDENCE_PAGE_SCORE = 0
+    
+    # OCR engines selectable with the ocr_backend argument. Tesseract runs as
+    # an external process; the others are optional Python packages that run
+    # ONNX/Paddle inference in-process and are imported on first use.
+    OCR_BACKENDS = ("tesseract", "rapidocr", "paddle")
+    
+    # Maximum number of documents kept in the in-memory text cache
+    TEXT_CACHE_SIZE = 128
+    
+    def __init__(self, use_disk_cache: Optional[bool] = None, n_jobs: Optional[int] = None,
+                 ocr_backend: str = "tesseract", binarize_pages: bool = True,
+                 use_tesserocr: Optional[bool] = None, extraction_processes: int = 1):
+        """
+        Args:
+            use_disk_cache: Persist extracted text, OCR'd pages and parsed results
+                under get_cache_dir() so repeat runs on the same PDF skip OCR
+                entirely (default: only when VENDRA_PARSER_DISK_CACHE is set).
+                Cached files hold the document text, so this is opt-in.
+            n_jobs: Number of tesseract processes to run at once across pages
+                (default: one per CPU core)
+            ocr_backend: OCR engine for rendered pages, one of OCR_BACKENDS.
+                "rapidocr" needs rapidocr_onnxruntime and "paddle" needs paddleocr.
+            binarize_pages: Otsu-threshold rendered pages to 1-bit images before
+                handing them to tesseract (needs numpy and Pillow)
+            use_tesserocr: Run tesseract in-process through tesserocr instead of
+                spawning a tesseract process per pass (default: when installed)
+            extraction_processes: Worker processes for pdfplumber text extraction
+                of long documents (default: 1, extract in this process). Leave at
+                1 when the caller already runs parsers in several processes.
+        """
+        if ocr_backend not in self.OCR_BACKENDS:
+            raise ValueError(f"Unknown OCR backend {ocr_backend!r}, expected one of {self.OCR_BACKENDS}")
+        if use_tesserocr and not TESSEROCR_AVAILABLE:
+            raise ImportError("use_tesserocr=True requires the tesserocr package")
+        
         # No hardcoded patterns - we'll discover them dynamically
-        pass
+        # Extracted text keyed by SHA-256 of the PDF contents, so the same
+        # document is only run through the OCR pipeline once per parser
+        self._text_cache: Dict[str, str] = {}
+        self.use_disk_cache = disk_cache_enabled() if use_disk_cache is None else use_disk_cache
+        if self.use_disk_cache:
+            _prune_cache_once()
+        self.n_jobs = max(1, n_jobs or os.cpu_count() or 1)
+        self.extraction_processes = max(1, min(extraction_processes, os.cpu_count() or 1))
+        self.ocr_backend = ocr_backend
+        self.binarize_pages = binarize_pages
+        # In-process OCR engine for non-tesseract backends, created on first use.
+        # The engines are not documented as thread-safe, so calls are serialized.
+        self._ocr_engine = None
+        self._ocr_engine_lock = threading.Lock()
+        # tesserocr APIs load the language model once and are reused for every
+        # page and document, at most n_jobs per tesseract configuration
+        self.use_tesserocr = TESSEROCR_AVAILABLE if use_tesserocr is None else use_tesserocr
+        self._tesserocr_pool = TesserocrAPIPool(self.n_jobs)
+        # End the pooled APIs when the parser is garbage collected without close()
+        self._tesserocr_pool_finalizer = weakref.finalize(self, self._tesserocr_pool.close)
+        self._config_fingerprint: Optional[str] = None
+    
+    def close(self) -> None:
+        """Release the tesserocr APIs held by this parser."""
+        self._tesserocr_pool_finalizer()
     
     def extract_text_with_ocr(self, pdf_path: str) -> str:
         """
         Extract text from PDF using multiple OCR approaches for maximum accuracy.
         
+        Results are cached in memory and, when the disk cache is enabled
+        (use_disk_cache, VENDRA_PARSER_DISK_CACHE or --disk-cache), on disk,
+        keyed by the PDF's SHA-256, the pipeline version and the extraction
+        configuration (see _extraction_fingerprint).
+        
         Args:
             pdf_path: Path to the PDF file
             
         Returns:
             Extracted text string
         """
+        try:
+            digest = file_sha256(pdf_path)
+        except OSError as e:
+            logger.debug(f"Could not hash PDF for text cache: {e}")
+            digest = None
+        
+        cache_key = f"{digest}_{self._extraction_fingerprint()}" if digest is not None else None
+        if cache_key is not None and cache_key in self._text_cache:
+            logger.info("Using cached text extraction for identical PDF content")
+            return self._text_cache[cache_key]
+        
+        cache_path = self._text_cache_path(digest) if digest is not None else None
+        if cache_path is not None:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+                logger.info(f"Using cached text extraction from {cache_path}")
+                self._remember_text(cache_key, text)
+                return text
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Could not read text cache {cache_path}: {e}")
+        
+        text = self._extract_text_uncached(pdf_path)
+        
+        if cache_key is not None:
+            self._remember_text(cache_key, text)
+        if cache_path is not None:
+            try:
+                _write_text_atomic(cache_path, text)
+            except OSError as e:
+                logger.debug(f"Could not write text cache {cache_path}: {e}")
+        return text
+    
+    def _remember_text(self, cache_key: str, text: str) -> None:
+        """Store extracted text in the in-memory cache, clearing it when full."""
+        if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+            self._text_cache.clear()
+        self._text_cache[cache_key] = text
+    
+    def _text_cache_path(self, digest: str) -> Optional[str]:
+        """Return the on-disk cache file for a PDF digest, or None when disabled."""
+        if not self.use_disk_cache:
+            return None
+        fingerprint = self._extraction_fingerprint()
+        return os.path.join(get_cache_dir(), 'ocr', f"{digest}_v{TEXT_CACHE_VERSION}_{fingerprint}.txt")
+    
+    def _result_cache_path(self, pdf_path: str) -> Optional[str]:
+        """Return the on-disk JSON cache file for a PDF, or None when disabled or unhashable."""
+        if not self.use_disk_cache:
+            return None
+        try:
+            digest = file_sha256(pdf_path)
+        except OSError as e:
+            logger.debug(f"Could not hash PDF for result cache: {e}")
+            return None
+        from . import __version__
+        fingerprint = self._extraction_fingerprint()
+        return os.path.join(
+            get_cache_dir(), 'results',
+            f"{digest}_{__version__}_v{RESULT_CACHE_VERSION}_{fingerprint}.json"
+        )
+    
+    def _extraction_fingerprint(self) -> str:
+        """
+        Return a short digest of every setting that changes the extracted text.
+        
+        Covers the OCR backend and engine version, page binarization, whether
+        tesseract runs in-process, and the rendering resolutions, so text and
+        results cached under one configuration are never served to another.
+        """
+        if self._config_fingerprint is None:
+            engine_name = self._tesseract_engine_name() if self.ocr_backend == "tesseract" else self.ocr_backend
+            config = '\0'.join([
+                self.ocr_backend,
+                engine_name,
+                f"binarize={self.binarize_pages}",
+                f"tesserocr={self.use_tesserocr}",
+                f"dpi={self.BASIC_OCR_DPI},{self.BASIC_OCR_RETRY_DPI},{self.MIN_PAGE_CONFIDENCE}",
+                f"ladder={','.join(map(str, self.ENHANCED_OCR_DPI_LADDER))}",
+            ])
+            self._config_fingerprint = hashlib.sha256(config.encode('utf-8')).hexdigest()[:12]
+        return self._config_fingerprint
+    
+    def _extract_text_uncached(self, pdf_path: str) -> str:
+        """Run the full extraction pipeline (direct text, OCR, cleanup) on a PDF."""
         extraction_results = []
         
         # Method 1: Direct PDF text extraction (fastest, works for text-based PDFs)
+        page_texts = None
         try:
-            direct_text = self._extract_text_directly(pdf_path)
-            if direct_text and len(direct_text.strip()) > 50:  # Has substantial content
-                extraction_results.append(("direct", direct_text))
-                logger.info("Direct PDF extraction successful")
+            page_texts = self._extract_pages_directly(pdf_path)
         except Exception as e:
             logger.warning(f"Direct text extraction failed: {e}")
         
-        # Method 2: Enhanced OCR with multiple settings
-        try:
-            ocr_text = self._extract_with_enhanced_ocr(pdf_path)
-            if ocr_text and len(ocr_text.strip()) > 50:
-                extraction_results.append(("ocr", ocr_text))
-                logger.info("Enhanced OCR extraction successful")
-        except Exception as e:
-            logger.warning(f"Enhanced OCR failed: {e}")
+        # Fast path: if every page already has a usable text layer, rendering
+        # and OCR'ing the document can only cost time, so skip it entirely
+        if page_texts and all(self._has_usable_text_layer(text) for text in page_texts):
+            logger.info(f"All {len(page_texts)} pages have a text layer - skipping OCR")
+            cleaned_text = self._preprocess_extracted_text(self._join_page_texts(page_texts))
+            logger.info(f"Final text extraction: {len(cleaned_text)} characters")
+            return cleaned_text
         
-        # Method 3: Fallback to basic external tools
-        try:
-            basic_ocr = self._extract_with_external_tools(pdf_path)
-            if basic_ocr and len(basic_ocr.strip()) > 50:
-                extraction_results.append(("basic_ocr", basic_ocr))
-                logger.info("Basic OCR extraction successful")
-        except Exception as e:
-            logger.warning(f"Basic OCR failed: {e}")
+        if page_texts:
+            direct_text = self._join_page_texts(page_texts)
+            if direct_text and len(direct_text.strip()) > 50:  # Has substantial content
+                extraction_results.append(("direct", direct_text))
+                logger.info("Direct PDF extraction successful")
+        
+        if self.ocr_backend != "tesseract":
+            # Method 2 (alternative engine): a single in-process OCR pass per page
+            try:
+                ocr_text = self._extract_with_ocr_backend(pdf_path)
+                if ocr_text and len(ocr_text.strip()) > 50:
+                    extraction_results.append(("ocr", ocr_text))
+                    logger.info(f"{self.ocr_backend} OCR extraction successful")
+            except Exception as e:
+                logger.warning(f"{self.ocr_backend} OCR failed: {e}")
+        else:
+            # Method 2: Enhanced OCR with multiple settings
+            try:
+                ocr_text = self._extract_with_enhanced_ocr(pdf_path)
+                if ocr_text and len(ocr_text.strip()) > 50:
+                    extraction_results.append(("ocr", ocr_text))
+                    logger.info("Enhanced OCR extraction successful")
+            except Exception as e:
+                logger.warning(f"Enhanced OCR failed: {e}")
+            
+            # Method 3: Fallback to basic external tools
+            try:
+                basic_ocr = self._extract_with_external_tools(pdf_path)
+                if basic_ocr and len(basic_ocr.strip()) > 50:
+                    extraction_results.append(("basic_ocr", basic_ocr))
+                    logger.info("Basic OCR extraction successful")
+            except Exception as e:
+                logger.warning(f"Basic OCR failed: {e}")
         
         if not extraction_results:
             raise Exception("All text extraction methods failed")
@@ -98,51 +824,322 @@ class DynamicOCRParser:
             subprocess.run([
                 'pdftoppm', 
                 '-png', 
-                '-r', '300',  # High resolution for better OCR
+                '-r', str(self.BASIC_OCR_DPI),
                 pdf_path, 
                 image_path
             ], check=True)
             
-            # Extract text from each image using Tesseract
-            all_text = ""
-            page_num = 1
-            
-            while True:
-                image_file = f"{image_path}-{page_num}.png"
-                if not os.path.exists(image_file):
-                    break
-                
-                # Run Tesseract OCR
-                result = subprocess.run([
-                    'tesseract',
-                    image_file,
-                    'stdout',
-                    '--psm', '6'  # Assume uniform block of text
-                ], capture_output=True, text=True, check=True)
-                
-                page_text = result.stdout.strip()
-                if page_text:
-                    all_text += f"\n=== PAGE {page_num} ===\n{page_text}\n"
-                
-                page_num += 1
+            # Extract text from each image using Tesseract, several pages at once
+            image_files = self._rendered_page_images(image_path)
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                page_texts = list(executor.map(
+                    lambda page: self._ocr_basic_page(pdf_path, temp_dir, *page),
+                    enumerate(image_files, 1)
+                ))
+            all_text = self._join_page_texts(page_texts)
             
             logger.info(f"OCR extracted {len(all_text)} characters from PDF")
             return all_text
     
+    def _extract_with_ocr_backend(self, pdf_path: str) -> str:
+        """Extract text by rendering pages with pdftoppm and OCR'ing them with the selected in-process engine."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            image_path = os.path.join(temp_dir, "page")
+            subprocess.run([
+                'pdftoppm',
+                '-png',
+                '-r', '300',
+                pdf_path,
+                image_path
+            ], check=True)
+            
+            page_texts = [self._ocr_page_with_backend(image_file) for image_file in self._rendered_page_images(image_path)]
+            all_text = self._join_page_texts(page_texts)
+            
+            logger.info(f"{self.ocr_backend} OCR extracted {len(all_text)} characters from PDF")
+            return all_text
+    
+    def _get_ocr_engine(self):
+        """Return the in-process OCR engine for the selected backend, creating it on first use."""
+        if self._ocr_engine is None:
+            if self.ocr_backend == "rapidocr":
+                from rapidocr_onnxruntime import RapidOCR
+                self._ocr_engine = RapidOCR()
+            else:
+                from paddleocr import PaddleOCR
+                self._ocr_engine = PaddleOCR(use_angle_cls=False, lang='en', enable_mkldnn=True, show_log=False)
+        return self._ocr_engine
+    
+    def _ocr_page_with_backend(self, image_file: str) -> str:
+        """OCR one page image with the in-process engine, returning tesseract-style lines."""
+        with self._ocr_engine_lock:
+            engine = self._get_ocr_engine()
+            if self.ocr_backend == "rapidocr":
+                # [[box, text, score], ...] or None
+                result, _ = engine(image_file)
+                detections = [(box, text) for box, text, _ in (result or [])]
+            else:
+                # One entry per image: [[box, (text, score)], ...] or None
+                result = engine.ocr(image_file, cls=False)
+                detections = [(box, text) for box, (text, _) in ((result or [None])[0] or [])]
+        
+        return self._detections_to_text(detections)
+    
+    def _detections_to_text(self, detections) -> str:
+        """
+        Arrange OCR text boxes into lines of text like tesseract's output.
+        
+        Boxes whose vertical centres are within half a typical box height of
+        each other form a line; each line reads left to right.
+        """
+        if not detections:
+            return ""
+        
+        boxes = []
+        for box, text in detections:
+            xs = [point[0] for point in box]
+            ys = [point[1] for point in box]
+            boxes.append((sum(ys) / len(ys), min(xs), max(ys) - min(ys), text))
+        boxes.sort()
+        
+        heights = sorted(height for _, _, height, _ in boxes)
+        tolerance = max(heights[len(heights) // 2] / 2, 1)
+        
+        lines = []
+        current = [boxes[0]]
+        for box in boxes[1:]:
+            if box[0] - current[-1][0] <= tolerance:
+                current.append(box)
+            else:
+                lines.append(current)
+                current = [box]
+        lines.append(current)
+        
+        return "\n".join(
+            " ".join(text for _, _, _, text in sorted(line, key=lambda b: b[1]))
+            for line in lines
+        )
+    
+    def _ocr_basic_page(self, pdf_path: str, temp_dir: str, page_num: int, image_file: str) -> str:
+        """
+        OCR one page image for the basic external tools method ('' on failure).
+        
+        Low-confidence pages are re-rendered at BASIC_OCR_RETRY_DPI.
+        """
+        image_file = self._binarize_page_image(image_file)
+        
+        # Run Tesseract OCR. A failure on one page is logged and
+        # skipped so the pages already rendered are not wasted.
+        try:
+            text, confidence = self._run_tesseract_with_confidence(image_file, ['--psm', '6'])
+        except (subprocess.CalledProcessError, RuntimeError) as e:
+            logger.warning(f"Tesseract failed on page {page_num}: {e}")
+            return ""
+        
+        if confidence >= self.MIN_PAGE_CONFIDENCE:
+            return text
+        
+        logger.info(f"Page {page_num} confidence {confidence:.0f} - retrying OCR at {self.BASIC_OCR_RETRY_DPI} DPI")
+        retry_path = os.path.join(temp_dir, f"page{page_num}-{self.BASIC_OCR_RETRY_DPI}dpi")
+        try:
+            retry_file = self._binarize_page_image(
+                self._render_page(pdf_path, page_num, self.BASIC_OCR_RETRY_DPI, retry_path)
+            )
+            retry_text, retry_confidence = self._run_tesseract_with_confidence(retry_file, ['--psm', '6'])
+        except (subprocess.CalledProcessError, RuntimeError, OSError) as e:
+            logger.warning(f"High resolution retry failed on page {page_num}: {e}")
+            return text
+        
+        return retry_text if retry_confidence > confidence else text
+    
+    def _run_tesseract_with_confidence(self, image_file: str, args: List[str]):
+        """
+        Run tesseract once producing both plain text and TSV word data.
+        
+        Returns (text, mean word confidence); the confidence is 0 when no
+        words were recognised. Raises CalledProcessError (or RuntimeError
+        from tesserocr) on failure.
+        """
+        tesseract_args = args + self._binarized_tesseract_args() + ['txt', 'tsv']
+        cache_path = self._page_cache_path(image_file, tesseract_args)
+        cached = self._read_page_cache(cache_path)
+        if cached is not None:
+            return cached['text'], cached['confidence']
+        
+        if self.use_tesserocr:
+            text, word_confidences = self._run_tesserocr(image_file, args + self._binarized_tesseract_args())
+            confidence = sum(word_confidences) / len(word_confidences) if word_confidences else 0.0
+            self._write_page_cache(cache_path, {'text': text, 'confidence': confidence})
+            return text, confidence
+        
+        output_base = os.path.splitext(image_file)[0] + "-ocr"
+        subprocess.run(
+            ['tesseract', image_file, output_base] + tesseract_args,
+            capture_output=True, check=True, env=self._tesseract_env()
+        )
+        with open(output_base + '.txt', encoding='utf-8') as f:
+            text = f.read().strip()
+        with open(output_base + '.tsv', encoding='utf-8') as f:
+            confidence = self._mean_word_confidence(f.read())
+        
+        self._write_page_cache(cache_path, {'text': text, 'confidence': confidence})
+        return text, confidence
+    
+    def _mean_word_confidence(self, tsv: str) -> float:
+        """Mean confidence of the recognised words in tesseract TSV output."""
+        confidences = []
+        for row in tsv.splitlines()[1:]:
+            columns = row.split('\t')
+            # Word rows have 12 columns; conf is -1 for non-word levels
+            if len(columns) < 12 or not columns[11].strip():
+                continue
+            try:
+                conf = float(columns[10])
+            except ValueError:
+                continue
+            if conf >= 0:
+                confidences.append(conf)
+        return sum(confidences) / len(confidences) if confidences else 0.0
+    
+    def _render_page(self, pdf_path: str, page_num: int, dpi: int, output_base: str) -> str:
+        """Render a single PDF page to output_base + '.png' and return the image path."""
+        subprocess.run([
+            'pdftoppm',
+            '-png',
+            '-r', str(dpi),
+            '-f', str(page_num),
+            '-l', str(page_num),
+            '-singlefile',
+            pdf_path,
+            output_base
+        ], check=True)
+        return f"{output_base}.png"
+    
+    def _binarize_page_image(self, image_file: str) -> str:
+        """
+        Replace a rendered page with a 1-bit Otsu-thresholded copy.
+        
+        Tesseract binarizes every image internally before recognition, so
+        doing it once up front saves that work on every pass over the page
+        and shrinks the image it has to load. Returns the image path, left
+        untouched when binarization is disabled or numpy/Pillow are missing.
+        """
+        if not self.binarize_pages:
+            return image_file
+        try:
+            import numpy as np
+            from PIL import Image
+        except ImportError:
+            return image_file
+        
+        try:
+            with Image.open(image_file) as image:
+                gray = np.asarray(image.convert('L'))
+            
+            # Otsu's method: pick the threshold maximizing between-class variance
+            hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+            omega = np.cumsum(hist) / gray.size
+            mu = np.cumsum(hist * np.arange(256)) / gray.size
+            with np.errstate(divide='ignore', invalid='ignore'):
+                between_class = (mu[-1] * omega - mu) ** 2 / (omega * (1.0 - omega))
+            if np.all(np.isnan(between_class)):
+                return image_file  # Blank page, nothing to threshold
+            threshold = int(np.nanargmax(between_class))
+            
+            Image.fromarray(gray > threshold).save(image_file)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not binarize {image_file}: {e}")
+        return image_file
+    
+    def _binarized_tesseract_args(self) -> List[str]:
+        """Extra tesseract arguments for pre-binarized pages (skip the inverted-text pass)."""
+        return ['-c', 'tessedit_do_invert=0'] if self.binarize_pages else []
+    
+    def _rendered_page_images(self, image_path: str) -> List[str]:
+        """Return the page images pdftoppm wrote for image_path, in page order."""
+        # One directory listing instead of a stat per page; pdftoppm zero-pads
+        # the page number to the page count's width (page-01, ...), so sort
+        # on its value
+        directory, prefix = os.path.split(image_path)
+        pages = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix):
+                    match = _PAGE_IMAGE_SUFFIX_PATTERN.fullmatch(entry.name, len(prefix))
+                    if match:
+                        pages.append((int(match.group(1)), entry.path))
+        pages.sort()
+        return [path for _, path in pages]
+    
+    def _tesseract_env(self) -> Optional[Dict[str, str]]:
+        """
+        Environment for tesseract subprocesses.
+        
+        When pages are OCR'd in parallel each tesseract process is limited to a
+        single OpenMP thread, since several multi-threaded processes would just
+        contend for the same cores. Returns None (inherit) for serial runs.
+        """
+        if self.n_jobs <= 1:
+            return None
+        env = dict(os.environ)
+        env['OMP_THREAD_LIMIT'] = '1'
+        return env
+    
     def _extract_text_directly(self, pdf_path: str) -> str:
         """Extract text directly from PDF without OCR."""
+        return self._join_page_texts(self._extract_pages_directly(pdf_path))
+    
+    def _has_usable_text_layer(self, page_text: str) -> bool:
+        """Check whether a page's embedded text is substantial and not CID garbage."""
+        stripped = page_text.strip()
+        if len(stripped) < self.MIN_TEXT_LAYER_CHARS:
+            return False
+        return stripped.count('cid:') <= self.MAX_TEXT_LAYER_CIDS
+    
+    def _join_page_texts(self, page_texts: List[str]) -> str:
+        """Join per-page text into a single string with page markers."""
+        return "".join(
+            f"\n=== PAGE {page_num} ===\n{text}\n"
+            for page_num, text in enumerate(page_texts, 1)
+            if text
+        )
+    
+    def _extract_pages_directly(self, pdf_path: str) -> List[str]:
+        """
+        Extract the embedded text of each page without OCR ('' for empty pages).
+        
+        Poppler's pdftotext is tried first since it is much faster than
+        pdfplumber; its output is used when every page has a usable text
+        layer, otherwise pdfplumber's extraction is returned as before.
+        """
+        page_texts = self._extract_pages_with_pdftotext(pdf_path)
+        if page_texts and all(self._has_usable_text_layer(text) for text in page_texts):
+            logger.info(f"pdftotext extracted {sum(len(t) for t in page_texts)} characters from PDF")
+            return page_texts
+        
         try:
             import pdfplumber
             
-            all_text = ""
+            page_texts = None
             with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    text = page.extract_text()
-                    if text:
-                        all_text += f"\n=== PAGE {page_num} ===\n{text}\n"
-            
-            logger.info(f"Direct extraction got {len(all_text)} characters from PDF")
-            return all_text
+                page_count = len(pdf.pages)
+                if self.extraction_processes <= 1 or page_count < self.PARALLEL_EXTRACTION_MIN_PAGES:
+                    page_texts = []
+                    for page in pdf.pages:
+                        page_texts.append(page.extract_text() or "")
+                        page.flush_cache()
+            
+            if page_texts is None:
+                # Each worker extracts one contiguous run of pages
+                workers = min(self.extraction_processes, page_count)
+                bounds = [page_count * i // workers for i in range(workers + 1)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunks = executor.map(_extract_pdfplumber_page_texts,
+                                          [pdf_path] * workers, bounds[:-1], bounds[1:])
+                    page_texts = [text for chunk in chunks for text in chunk]
+            
+            logger.info(f"Direct extraction got {sum(len(t) for t in page_texts)} characters from PDF")
+            return page_texts
             
         except ImportError:
             logger.error("pdfplumber not available for direct text extraction")
@@ -151,80 +1148,194 @@ class DynamicOCRParser:
             logger.error(f"Direct text extraction failed: {e}")
             raise
     
+    def _extract_pages_with_pdftotext(self, pdf_path: str) -> Optional[List[str]]:
+        """Extract per-page text with pdftotext -layout, or None if it is unavailable or fails."""
+        try:
+            result = subprocess.run(
+                ['pdftotext', '-layout', '-enc', 'UTF-8', pdf_path, '-'],
+                capture_output=True, text=True, check=True, timeout=self.PDFTOTEXT_TIMEOUT
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            logger.debug(f"pdftotext extraction unavailable: {e}")
+            return None
+        
+        # Pages are separated by form feeds, with one after the last page
+        page_texts = result.stdout.split('\f')
+        if page_texts and not page_texts[-1].strip():
+            page_texts.pop()
+        return [text.strip('\n') for text in page_texts]
+    
     def _extract_with_enhanced_ocr(self, pdf_path: str) -> str:
-        """Extract text using enhanced OCR with multiple approaches."""
+        """
+        Extract text using enhanced OCR with multiple approaches.
+        
+        Pages are rendered at the first resolution of ENHANCED_OCR_DPI_LADDER.
+        Only pages whose best result scores at or below LOW_CONFIDENCE_PAGE_SCORE
+        are re-rendered at the next resolution and OCR'd again.
+        """
+        base_dpi, *retry_dpis = self.ENHANCED_OCR_DPI_LADDER
+        
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Convert PDF to images with higher quality
+            # Convert PDF to images
             image_path = os.path.join(temp_dir, "page")
             subprocess.run([
                 'pdftoppm', 
                 '-png', 
-                '-r', '600',  # Very high resolution for better OCR
+                '-r', str(base_dpi),
                 pdf_path, 
                 image_path
             ], check=True)
             
-            all_results = []
-            page_num = 1
+            image_files = self._rendered_page_images(image_path)
             
-            while True:
-                image_file = f"{image_path}-{page_num}.png"
-                if not os.path.exists(image_file):
-                    break
-                
-                # Try multiple OCR approaches for each page
-                page_results = []
-                
-                # Approach 1: Table-aware OCR
-                try:
-                    result = subprocess.run([
-                        'tesseract',
-                        image_file,
-                        'stdout',
-                        '--psm', '6',  # Uniform block of text
-                        '-c', 'preserve_interword_spaces=1'
-                    ], capture_output=True, text=True, check=True)
-                    page_results.append(("table", result.stdout.strip()))
-                except:
-                    pass
-                
-                # Approach 2: Line-oriented OCR
-                try:
-                    result = subprocess.run([
-                        'tesseract',
-                        image_file,
-                        'stdout',
-                        '--psm', '4',  # Single column of text
-                        '-c', 'preserve_interword_spaces=1'
-                    ], capture_output=True, text=True, check=True)
-                    page_results.append(("lines", result.stdout.strip()))
-                except:
-                    pass
-                
-                # Approach 3: Sparse text OCR (good for scattered data)
-                try:
-                    result = subprocess.run([
-                        'tesseract',
-                        image_file,
-                        'stdout',
-                        '--psm', '11',  # Sparse text
-                    ], capture_output=True, text=True, check=True)
-                    page_results.append(("sparse", result.stdout.strip()))
-                except:
-                    pass
-                
-                # Choose best result for this page
-                if page_results:
-                    best_page = self._choose_best_page_result(page_results)
-                    if best_page:
-                        all_results.append(f"\n=== PAGE {page_num} ===\n{best_page}\n")
-                
-                page_num += 1
+            # Each OCR approach is an independent tesseract process, so the
+            # passes for a page run concurrently, and the n_jobs budget is
+            # split so that several pages are OCR'd at once
+            page_workers = max(1, self.n_jobs // len(self.ENHANCED_OCR_PASSES))
+            with ThreadPoolExecutor(max_workers=len(self.ENHANCED_OCR_PASSES) * page_workers) as executor, \
+                    ThreadPoolExecutor(max_workers=page_workers) as page_executor:
+                page_texts = list(page_executor.map(
+                    lambda page: self._ocr_enhanced_page(executor, pdf_path, temp_dir, retry_dpis, *page),
+                    enumerate(image_files, 1)
+                ))
             
-            final_text = "".join(all_results)
+            final_text = self._join_page_texts(page_texts)
             logger.info(f"Enhanced OCR extracted {len(final_text)} characters")
             return final_text
     
+    def _ocr_enhanced_page(self, executor, pdf_path: str, temp_dir: str, retry_dpis,
+                           page_num: int, image_file: str) -> Optional[str]:
+        """OCR one page with every enhanced pass, re-rendering at higher DPI while it scores poorly."""
+        image_file = self._binarize_page_image(image_file)
+        
+        # Try multiple OCR approaches for each page
+        best_score, best_page = self._ocr_page_with_passes(executor, image_file)
+        
+        # Escalate resolution only for pages that came out poorly
+        for dpi in retry_dpis:
+            if best_page and best_score > self.LOW_CONFIDENCE_PAGE_SCORE:
+                break
+            
+            logger.info(f"Page {page_num} scored {best_score} - retrying OCR at {dpi} DPI")
+            retry_path = os.path.join(temp_dir, f"page{page_num}-{dpi}dpi")
+            try:
+                retry_file = self._binarize_page_image(self._render_page(pdf_path, page_num, dpi, retry_path))
+            except (subprocess.CalledProcessError, OSError) as e:
+                logger.warning(f"Failed to re-render page {page_num} at {dpi} DPI: {e}")
+                break
+            
+            score, text = self._ocr_page_with_passes(executor, retry_file)
+            if text and (not best_page or score > best_score):
+                best_score, best_page = score, text
+        
+        return best_page
+    
+    def _ocr_page_with_passes(self, executor, image_file: str):
+        """Run every enhanced OCR pass on a page image and return the best (score, text)."""
+        outputs = executor.map(
+            lambda args: self._run_tesseract(image_file, args),
+            [args for _, args in self.ENHANCED_OCR_PASSES]
+        )
+        page_results = [
+            (method, output)
+            for (method, _), output in zip(self.ENHANCED_OCR_PASSES, outputs)
+            if output is not None
+        ]
+        return self._best_scored_page_result(page_results)
+    
+    def _run_tesseract(self, image_file: str, args: List[str]) -> Optional[str]:
+        """Run a single tesseract pass on an image, returning None on failure."""
+        args = args + self._binarized_tesseract_args()
+        cache_path = self._page_cache_path(image_file, args)
+        cached = self._read_page_cache(cache_path)
+        if cached is not None:
+            return cached['text']
+        
+        try:
+            text = self._tesseract_text(image_file, args)
+        except Exception:
+            return None
+        
+        self._write_page_cache(cache_path, {'text': text})
+        return text
+    
+    def _tesseract_text(self, image_file: str, args: List[str]) -> str:
+        """
+        OCR an image and return tesseract's stripped text output.
+        
+        Runs in-process through tesserocr when enabled, otherwise as a
+        tesseract subprocess. Raises RuntimeError or CalledProcessError on failure.
+        """
+        if self.use_tesserocr:
+            text, _ = self._run_tesserocr(image_file, args)
+            return text
+        result = subprocess.run(
+            ['tesseract', image_file, 'stdout'] + args,
+            capture_output=True, text=True, check=True, env=self._tesseract_env()
+        )
+        return result.stdout.strip()
+    
+    def _run_tesserocr(self, image_file: str, args: List[str]):
+        """
+        OCR an image with a pooled tesserocr API configured for args.
+        
+        args uses the tesseract command line syntax (--psm, --oem, -c name=value).
+        Returns (text, word confidences).
+        """
+        with self._tesserocr_pool.api(args) as api:
+            api.SetImageFile(image_file)
+            text = api.GetUTF8Text().strip()
+            word_confidences = [conf for conf in api.AllWordConfidences() if conf >= 0]
+        return text, word_confidences
+    
+    def _tesseract_engine_name(self) -> str:
+        """Identify the tesseract build in cache keys (bindings may differ from the CLI)."""
+        if self.use_tesserocr:
+            return f"tesserocr {tesserocr.tesseract_version()}"
+        return _tesseract_version()
+    
+    def _page_cache_path(self, image_file: str, args: List[str]) -> Optional[str]:
+        """
+        Return the on-disk OCR cache file for a page image, or None when disabled.
+        
+        Keyed by the rendered image's content plus the tesseract arguments and
+        version, so identical pages (repeated across pages or documents) are
+        only OCR'd once with a given configuration.
+        """
+        if not self.use_disk_cache:
+            return None
+        try:
+            image_digest = _image_digest(image_file)
+        except OSError as e:
+            logger.debug(f"Could not hash page image for OCR cache: {e}")
+            return None
+        config = '\0'.join([self._tesseract_engine_name()] + list(args))
+        config_digest = hashlib.sha256(config.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(get_cache_dir(), 'pages', f"{image_digest}_{config_digest}.json")
+    
+    def _read_page_cache(self, cache_path: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Load a cached page OCR result, or None on a miss."""
+        if cache_path is None:
+            return None
+        try:
+            # Both decoders take the UTF-8 bytes directly, skipping a str copy
+            with open(cache_path, 'rb') as f:
+                return _loads_json(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read page OCR cache {cache_path}: {e}")
+            return None
+    
+    def _write_page_cache(self, cache_path: Optional[str], entry: Dict[str, Any]) -> None:
+        """Store a page OCR result; cache write failures are not fatal."""
+        if cache_path is None:
+            return
+        try:
+            _write_atomic(cache_path, lambda f: _dump_json(entry, f))
+        except OSError as e:
+            logger.debug(f"Could not write page OCR cache {cache_path}: {e}")
+    
     def _extract_with_pure_ocr(self, pdf_path: str) -> str:
         """Pure OCR extraction optimized for problematic PDFs with font issues."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -240,100 +1351,96 @@ class DynamicOCRParser:
                 image_path
             ], check=True)
             
-            all_text = ""
-            page_num = 1
-            
-            while True:
-                image_file = f"{image_path}-{page_num}.png"
-                if not os.path.exists(image_file):
-                    break
-                
-                # Use most reliable OCR settings for text extraction
-                try:
-                    result = subprocess.run([
-                        'tesseract',
-                        image_file,
-                        'stdout',
-                        '--psm', '6',  # Uniform block of text
-                        '--oem', '3',  # Default OCR Engine Mode
-                        '-c', 'tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz .,;:!?()[]{}/@#$%^&*+-=_|\\<>\'"',
-                    ], capture_output=True, text=True, check=True)
-                    
-                    page_text = result.stdout.strip()
-                    if page_text:
-                        all_text += f"\n=== PAGE {page_num} ===\n{page_text}\n"
-                    
-                except subprocess.CalledProcessError:
-                    # Fallback to basic OCR if whitelist fails
-                    try:
-                        result = subprocess.run([
-                            'tesseract',
-                            image_file,
-                            'stdout',
-                            '--psm', '6'
-                        ], capture_output=True, text=True, check=True)
-                        
-                        page_text = result.stdout.strip()
-                        if page_text:
-                            all_text += f"\n=== PAGE {page_num} ===\n{page_text}\n"
-                    except:
-                        logger.warning(f"OCR failed for page {page_num}")
-                
-                page_num += 1
+            image_files = self._rendered_page_images(image_path)
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                page_texts = list(executor.map(self._ocr_pure_page, range(1, len(image_files) + 1), image_files))
+            all_text = self._join_page_texts(page_texts)
             
             logger.info(f"Pure OCR extracted {len(all_text)} characters")
             return all_text
     
+    def _ocr_pure_page(self, page_num: int, image_file: str) -> str:
+        """OCR one page image for the pure OCR method ('' on failure)."""
+        image_file = self._binarize_page_image(image_file)
+        extra_args = self._binarized_tesseract_args()
+        
+        # Use most reliable OCR settings for text extraction
+        try:
+            return self._tesseract_text(image_file, [
+                '--psm', '6',  # Uniform block of text
+                '--oem', '3',  # Default OCR Engine Mode
+                '-c', 'tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz .,;:!?()[]{}/@#$%^&*+-=_|\\<>\'"',
+            ] + extra_args)
+            
+        except (subprocess.CalledProcessError, RuntimeError):
+            # Fallback to basic OCR if whitelist fails
+            try:
+                return self._tesseract_text(image_file, ['--psm', '6'] + extra_args)
+            except (subprocess.SubprocessError, RuntimeError, OSError) as e:
+                logger.warning(f"OCR failed for page {page_num}: {e}")
+                return ""
+    
     def _choose_best_page_result(self, page_results):
         """Choose the best OCR result for a single page."""
         if not page_results:
             return None
         
+        best_score, best_text = self._best_scored_page_result(page_results)
+        if best_score is not None:
+            return best_text
+        
+        # Fallback to first result
+        return page_results[0][1]
+    
+    def _best_scored_page_result(self, page_results):
+        """Return (score, text) for the highest scoring non-empty page result, or (None, None)."""
         # Score results based on content quality
         scored_results = []
         for method, text in page_results:
             if not text:
                 continue
-            
-            score = 0
-            lines = text.split('\n')
-            
-            # Score based on line item indicators
-            for line in lines:
-                line_clean = line.strip()
-                if not line_clean:
-                    continue
-                
-                # Look for patterns that suggest line items
-                import re
-                numbers = re.findall(r'[\d,]+\.?\d*', line_clean)
-                
-                # Lines with multiple numbers are likely line items
-                if len(numbers) >= 2:
-                    score += 10
-                
-                # Lines with currency symbols
-                if '$' in line_clean:
-                    score += 5
-                
-                # Lines with quantity indicators
-                if any(word in line_clean.lower() for word in ['qty', 'quantity', 'service', 'product']):
-                    score += 3
-                
-                # Penalize garbled text
-                garbled_chars = sum(1 for c in line_clean if c in '~`@#%^&*()+=[]{}|\\:";\'<>?/')
-                if garbled_chars > len(line_clean) * 0.1:  # More than 10% garbled
-                    score -= garbled_chars
-            
-            scored_results.append((score, text))
+            scored_results.append((self._score_page_text(text), text))
         
         # Return the highest scoring result
         if scored_results:
             scored_results.sort(key=lambda x: x[0], reverse=True)
-            return scored_results[0][1]
+            return scored_results[0]
         
-        # Fallback to first result
-        return page_results[0][1]
+        return None, None
+    
+    def _score_page_text(self, text: str) -> int:
+        """Score OCR output for a single page by its line item indicators."""
+        score = 0
+        lines = text.split('\n')
+        
+        # Score based on line item indicators
+        for line in lines:
+            line_clean = line.strip()
+            if not line_clean:
+                continue
+            
+            # Look for patterns that suggest line items
+            numbers = _NUMBER_TOKEN_PATTERN.findall(line_clean)
+            
+            # Lines with multiple numbers are likely line items
+            if len(numbers) >= 2:
+                score += 10
+            
+            # Lines with currency symbols
+            if '$' in line_clean:
+                score += 5
+            
+            # Lines with quantity indicators (lowercased once, not once per keyword)
+            line_lower = line_clean.lower()
+            if any(word in line_lower for word in _PAGE_LINE_ITEM_KEYWORDS):
+                score += 3
+            
+            # Penalize garbled text
+            garbled_chars = sum(1 for c in line_clean if c in '~`@#%^&*()+=[]{}|\\:";\'<>?/')
+            if garbled_chars > len(line_clean) * 0.1:  # More than 10% garbled
+                score -= garbled_chars
+        
+        return score
     
     def _choose_best_extraction(self, extraction_results):
         """Choose the best extraction result from multiple methods."""
@@ -393,8 +1500,7 @@ class DynamicOCRParser:
             if line_clean.count('cid:') > len(line_clean.split()) * 0.3:
                 continue
             
-            import re
-            numbers = re.findall(r'[\d,]+\.?\d*', line_clean)
+            numbers = _NUMBER_TOKEN_PATTERN.findall(line_clean)
             
             # Potential line items (3+ numbers: qty, price, total)
             if len(numbers) >= 3:
@@ -407,14 +1513,14 @@ class DynamicOCRParser:
                 score += 15
                 readable_content_score += 8
             
-            # Keywords that suggest this is quote content
-            quote_keywords = ['service', 'product', 'freight', 'total', 'subtotal', 'quote', 'qty', 'quantity']
-            if any(keyword in line_clean.lower() for keyword in quote_keywords):
+            # Keywords that suggest this is quote content (lowercased once, not once per keyword)
+            line_lower = line_clean.lower()
+            if any(keyword in line_lower for keyword in _QUOTE_CONTENT_KEYWORDS):
                 score += 5
                 readable_content_score += 3
             
             # Bonus for recognizable product names/part numbers
-            if re.search(r'[A-Z]+-\d+', line_clean.upper()):  # Pattern like "ROGUE-345"
+            if _PART_NUMBER_PATTERN.search(line_clean.upper()):  # Pattern like "ROGUE-345"
                 score += 10
                 readable_content_score += 5
         
@@ -429,7 +1535,7 @@ class DynamicOCRParser:
             score += 20
         
         # Penalty for very garbled text (excluding CID which is already penalized)
-        non_cid_text = re.sub(r'cid:\d+', '', text)
+        non_cid_text = _CID_TOKEN_PATTERN.sub('', text)
         if non_cid_text:
             garbled_chars = sum(1 for c in non_cid_text if c in '~`@#%^&*+=[]{}|\\:";\'<>?/')
             garbled_ratio = garbled_chars / len(non_cid_text)
@@ -482,20 +1588,19 @@ class DynamicOCRParser:
             
             # Try to remove isolated CID sequences while preserving structure
             # Pattern: "cid:NUMBER" optionally followed by space
-            import re
             
             # Remove standalone CID sequences
-            text = re.sub(r'\bcid:\d+\s*', ' ', text)
+            text = _CID_SEQUENCE_PATTERN.sub(' ', text)
             
             # Clean up multiple spaces created by CID removal
-            text = re.sub(r'\s+', ' ', text)
+            text = _WHITESPACE_RUN_PATTERN.sub(' ', text)
             
             # Clean up lines that became empty or just punctuation
             lines = text.split('\n')
             cleaned_lines = []
             for line in lines:
                 line = line.strip()
-                if line and not re.match(r'^[:\s\.\,\-]+$', line):  # Not just punctuation
+                if line and not _PUNCTUATION_ONLY_PATTERN.match(line):  # Not just punctuation
                     cleaned_lines.append(line)
             
             text = '\n'.join(cleaned_lines)
@@ -523,26 +1628,14 @@ class DynamicOCRParser:
     
     def _fix_common_ocr_errors(self, line):
         """Fix common OCR misreading errors."""
-        import re
-        
-        # Common character substitutions
-        fixes = {
-            'O': '0',  # Letter O -> Zero (in numbers)
-            'l': '1',  # Lowercase L -> One (in numbers)
-            'I': '1',  # Capital I -> One (in numbers)
-            'S': '5',  # S -> 5 (in numbers)
-            '§': '5',  # Section symbol -> 5
-        }
-        
         # Apply fixes to number-like contexts
         words = line.split()
         fixed_words = []
         
         for word in words:
             # If word looks like it should be a number
-            if re.match(r'[\$\d\.,\-O0lI§S]+$', word):
-                for wrong, right in fixes.items():
-                    word = word.replace(wrong, right)
+            if _NUMBER_LIKE_WORD_PATTERN.match(word):
+                word = word.translate(_OCR_DIGIT_FIXES)
             
             fixed_words.append(word)
         
@@ -550,11 +1643,9 @@ class DynamicOCRParser:
     
     def _reconstruct_line_items(self, line):
         """Try to reconstruct incomplete line items by inferring missing data."""
-        import re
-        
         # Look for patterns that suggest missing quantity
         # Pattern: "DESCRIPTION $price $total" -> should be "DESCRIPTION 1 $price $total"
-        numbers = re.findall(r'[\d,]+\.?\d*', line)
+        numbers = _NUMBER_TOKEN_PATTERN.findall(line)
         
         if len(numbers) == 2 and '$' in line:
             # Check if this could be quantity=1 case
@@ -583,6 +1674,13 @@ class DynamicOCRParser:
         if not price_str:
             return "0"
         
+        # Most tokens are already plain decimals like "1234.50", which would be
+        # detected as en_US and parse to the same Decimal, so skip the locale
+        # detection and babel parsing for them
+        stripped = price_str.strip()
+        if _PLAIN_DECIMAL_PATTERN.fullmatch(stripped):
+            return f"{Decimal(stripped):.2f}"
+        
         original_str = price_str
         
         try:
@@ -627,7 +1725,7 @@ class DynamicOCRParser:
                     detected_locale = 'en_US'  # Default to US format
             
             # Remove currency symbols for parsing
-            clean_price = re.sub(r'[\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿\$]', '', price_str.strip())
+            clean_price = _CURRENCY_SYMBOL_PATTERN.sub('', price_str.strip())
             
             # Parse using babel with detected locale
             try:
@@ -658,19 +1756,19 @@ class DynamicOCRParser:
             return "0"
         
         # Remove currency symbols
-        price_str = re.sub(r'[\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿\$]', '', price_str.strip())
+        price_str = _CURRENCY_SYMBOL_PATTERN.sub('', price_str.strip())
         
         # Simple number format normalization
         if ',' in price_str and '.' in price_str:
             # European format: "2.311,25" -> "2311.25"
             parts = price_str.split(',')
             if len(parts) == 2 and len(parts[1]) == 2:
-                integer_part = re.sub(r'[\s\.]', '', parts[0])
+                integer_part = _SPACE_OR_DOT_PATTERN.sub('', parts[0])
                 decimal_part = parts[1]
                 price_str = f"{integer_part}.{decimal_part}"
         
         # Remove spaces and commas (thousands separators)
-        price_str = re.sub(r'[\s,]', '', price_str)
+        price_str = _SPACE_OR_COMMA_PATTERN.sub('', price_str)
         
         try:
             from decimal import Decimal
@@ -699,32 +1797,32 @@ class DynamicOCRParser:
                 # European format with comma as decimal: "1 234,56"
                 parts = price_str.split(',')
                 if len(parts) == 2:
-                    integer_part = re.sub(r'[\s\.]', '', parts[0])  # Remove both spaces and dots
+                    integer_part = _SPACE_OR_DOT_PATTERN.sub('', parts[0])  # Remove both spaces and dots
                     decimal_part = parts[1]
                     price_str = f"{integer_part}.{decimal_part}"
             elif ' ' in price_str and (',' not in price_str and '.' not in price_str):
                 # European format with just spaces as thousands separator: "1 234"
-                price_str = re.sub(r'\s+', '', price_str)
+                price_str = _WHITESPACE_RUN_PATTERN.sub('', price_str)
             elif ' ' in price_str and ',' in price_str:
                 # European format: "1 234,56" 
                 parts = price_str.split(',')
                 if len(parts) == 2:
-                    integer_part = re.sub(r'[\s\.]', '', parts[0])  # Remove both spaces and dots
+                    integer_part = _SPACE_OR_DOT_PATTERN.sub('', parts[0])  # Remove both spaces and dots
                     decimal_part = parts[1]
                     price_str = f"{integer_part}.{decimal_part}"
             else:
                 # Remove spaces and dots (thousands separators), keep commas as decimals
-                price_str = re.sub(r'[\s\.]', '', price_str)
+                price_str = _SPACE_OR_DOT_PATTERN.sub('', price_str)
                 price_str = price_str.replace(',', '.')
         elif use_asian_format:
             # Asian format: often no decimal places, or different separators
             # Remove all separators and treat as whole numbers
-            price_str = re.sub(r'[\s,\.]', '', price_str)
+            price_str = _NUMBER_SEPARATOR_PATTERN.sub('', price_str)
         else:
             # US/International format: "1,234.56" (comma as thousands, dot as decimal)
             # Also handle spaces as thousands separators: "14 287.40"
-            price_str = re.sub(r',', '', price_str)
-            price_str = re.sub(r'\s+', '', price_str)  # Remove spaces (thousands separators)
+            price_str = price_str.replace(',', '')
+            price_str = _WHITESPACE_RUN_PATTERN.sub('', price_str)  # Remove spaces (thousands separators)
         
         return price_str
     
@@ -751,7 +1849,7 @@ class DynamicOCRParser:
             
             # Find all numbers in the line - improved regex to avoid part number components
             # This regex captures currency amounts, integers, and decimals (including negative), but avoids part number fragments
-            numbers = re.findall(r'-?\d+(?:,\d{3})*(?:\.\d{2})?', line)
+            numbers = _LINE_AMOUNT_PATTERN.findall(line)
             # Remove currency symbols for processing but keep the numeric values (including negative)
             numbers = [num.replace('$', '').replace(',', '') for num in numbers if num.replace('$', '').replace(',', '').replace('.', '').replace('-', '').isdigit() or (num.startswith('-') and num.replace('$', '').replace(',', '').replace('.', '').replace('-', '').isdigit())]
             
@@ -759,42 +1857,8 @@ class DynamicOCRParser:
             # Be very conservative about filtering
             line_lower = line.lower()
             
-                    # Skip obvious non-line-item lines using more specific patterns
-            # Use patterns that require context to avoid blocking legitimate products
-            skip_patterns = [
-                # Financial summary lines
-                r'\btotal\s*:', r'\bsubtotal\s*:', r'\bbalance\s*:', r'\bgrand\s+total\b',
-                r'\bnet\s+total\b', r'\btax\s*:', r'\bdiscount\s*:', r'\bshipping\s*:',
-                r'^\s*total\s*\$', r'^\s*subtotal\s*\$', r'^\s*tax\s*\$',
-                
-                # Document metadata
-                r'\bquote\s*#', r'\binvoice\s*#', r'\border\s*#', r'\bpo\s*#',
-                r'\bdate\s*:', r'\bpage\s*:', r'\bdue\s+date\s*:', r'\bvalid\s+(until|through|for)\b',
-                r'\breport\s+generated\s*:', r'\bpage\s+\d+\s+of\s+\d+\b', 
-                
-                # Contact information
-                r'\bphone\s*:', r'\bfax\s*:', r'\bemail\s*:', r'\baddress\s*:',
-                r'\bcontact\s*:', r'\battn\s*:', r'\bto\s*:', r'\bfrom\s*:',
-                
-                # Terms and conditions
-                r'\bterms\s+and\s+conditions\b', r'\bpayment\s+terms\b', r'\bthank\s+you\b',
-                r'\bsignature\b', r'\bprinted\s+name\b',
-                
-                # Shipping and logistics (not inventory items)
-                r'^\s*freight\s*(shipping)?\s*$', r'^\s*shipping\s*(and\s+handling)?\s*$',
-                r'^\s*lead\s+time\s*', r'^\s*delivery\s*', r'^\s*via\s*:',
-                
-                # Headers and labels
-                r'\bdescription\s*:', r'\bunit\s+price\b', r'\bamount\s*:', r'\bqty\s*:',
-                r'\bquantity\s*:', r'\bitem\s+code\b', r'\bpart\s+number\b',
-                r'service/product\s+description', r'hours/quantity', r'hourly\s+fee',
-                
-                # Business metadata
-                r'\bquote\s+by\b', r'\border\s+by\b', r'\bmoq\s*:', r'\bweeks\s+after\b', 
-                r'\breceipt\s+of\b', r'\bquotation\s*:'
-            ]
-            
-            if any(re.search(pattern, line_lower) for pattern in skip_patterns):
+                    # Skip obvious non-line-item lines (see _SKIP_LINE_PATTERN)
+            if _SKIP_LINE_PATTERN.search(line_lower):
                 continue
             
             # Skip lines that are addresses or contact info (enhanced filtering)
@@ -841,8 +1905,7 @@ class DynamicOCRParser:
         ]
         
         # Look for part number patterns (letters + numbers + dashes)
-        import re
-        has_part_number = bool(re.search(r'[A-Z]+-\d+', line.upper()))
+        has_part_number = bool(_PART_NUMBER_PATTERN.search(line.upper()))
         
         # Has product indicators or part numbers
         has_indicators = any(indicator in line_lower for indicator in product_indicators)
@@ -872,7 +1935,7 @@ class DynamicOCRParser:
                     if next_line_num < len(all_lines):
                         next_line = all_lines[next_line_num].strip()
                         if next_line:
-                            next_numbers = re.findall(r'(-?[\d,]+\.?\d*)', next_line)
+                            next_numbers = _SIGNED_NUMBER_TOKEN_PATTERN.findall(next_line)
                             
                             # If next line has numbers and looks like it continues this line item
                             if next_numbers and self._lines_should_combine(line, next_line):
@@ -904,7 +1967,7 @@ class DynamicOCRParser:
         
         # Do combine if second line looks like pricing info
         has_currency = '$' in line2
-        has_numbers = bool(re.findall(r'\d+', line2))
+        has_numbers = bool(_DIGITS_PATTERN.search(line2))
         is_short = len(line2.split()) <= 4  # Short lines are more likely to be pricing continuation
         
         return has_currency and has_numbers and is_short
@@ -1243,8 +2306,7 @@ class DynamicOCRParser:
                 continue
             
             # Check if this line looks like a table row (has at least 3 numbers)
-            import re
-            numbers = re.findall(r'\d+(?:,\d{3})*(?:\.\d{2})?', current_line)
+            numbers = _TABLE_NUMBER_PATTERN.findall(current_line)
             
             if len(numbers) >= 3:
                 # This looks like a table row - check if next line(s) are continuation
@@ -1258,18 +2320,11 @@ class DynamicOCRParser:
                         break
                     
                     # Check if next line is a continuation (no numbers or very few numbers)
-                    next_numbers = re.findall(r'\d+(?:,\d{3})*(?:\.\d{2})?', next_line)
+                    next_numbers = _TABLE_NUMBER_PATTERN.findall(next_line)
                     
                     # Continuation if: no numbers, OR only 1-2 numbers (like a part of description)
                     if len(next_numbers) <= 2:
-                        # Common continuation patterns
-                        continuation_patterns = [
-                            r'^(machine|de-burr|and|material|clear|steel|polypropylene)',  # Common description words
-                            r'^[a-zA-Z\s\-_:]+$',  # Only letters/spaces/basic punctuation
-                            r'^\w+\s+(and|de-burr|material)',  # Technical terms
-                        ]
-                        
-                        is_continuation = any(re.match(pattern, next_line.lower()) for pattern in continuation_patterns)
+                        is_continuation = bool(_CONTINUATION_LINE_PATTERN.match(next_line.lower()))
                         
                         if is_continuation:
                             # Combine with main line
@@ -1296,17 +2351,17 @@ class DynamicOCRParser:
     def _fix_part_number_artifacts(self, line: str) -> str:
         """Fix common OCR artifacts in part numbers."""
         # Fix spaces in part numbers like "19_ 5-basebalancer" -> "19_5-basebalancer" 
-        line = re.sub(r'(\d+)_\s+(\d+-)', r'\1_\2', line)
+        line = _PART_NUMBER_GAP_AFTER_UNDERSCORE.sub(r'\1_\2', line)
         # Fix "19 _5-" -> "19_5-"
-        line = re.sub(r'(\d+)\s+_(\d+-)', r'\1_\2', line)
+        line = _PART_NUMBER_GAP_BEFORE_UNDERSCORE.sub(r'\1_\2', line)
         return line
     
     def _clean_description(self, description: str) -> str:
         """Clean up description while preserving important parts."""
         # Remove special characters but keep alphanumeric, spaces, hyphens, underscores, colons
-        description = re.sub(r'[^\w\s\-_:]', ' ', description)
+        description = _DESCRIPTION_JUNK_PATTERN.sub(' ', description)
         # Remove extra spaces
-        description = re.sub(r'\s+', ' ', description).strip()
+        description = _WHITESPACE_RUN_PATTERN.sub(' ', description).strip()
         return description
     
     def _infer_quantity_from_prices(self, unit_price_str: str, cost_str: str) -> str:
@@ -1379,20 +2434,8 @@ class DynamicOCRParser:
         desc_lower = description.lower().strip()
         
         # Only reject obviously problematic content
-        obvious_noise_patterns = [
-            r'https?://|www\.',
-            r'[A-Z]:\\|/Users/|/home/',
-            r'[<>/\\|&{}[\]]{2,}',
-            r'postcode\s+format',  # Test content
-            r'ice\s+code',  # Corrupted test content
-            r'qa-pressure-test',  # Test content
-            r'mingham\s+b15',  # Corrupted content
-        ]
-        
-        import re
-        for pattern in obvious_noise_patterns:
-            if re.search(pattern, desc_lower, re.IGNORECASE):
-                return False
+        if _OBVIOUS_NOISE_PATTERN.search(desc_lower):
+            return False
         
         # Must have some meaningful content
         if len(description.strip()) < 3:
@@ -1403,26 +2446,8 @@ class DynamicOCRParser:
     def _is_shipping_charge(self, desc_lower):
         """Check if description is a shipping charge vs product name with shipping words."""
         # Patterns that indicate actual shipping charges (not products)
-        shipping_charge_patterns = [
-            # Standalone shipping terms
-            r'^freight$', r'^shipping$', r'^delivery$', r'^handling$', 
-            r'^postage$', r'^courier$', r'^express$', r'^overnight$',
-            
-            # Shipping with simple descriptors (3 words or less)
-            r'^freight\s+(shipping|cost|charge|fee)$',
-            r'^shipping\s+(and\s+handling|cost|charge|fee)$',
-            r'^delivery\s+(charge|fee|cost)$',
-            r'^handling\s+(charge|fee|cost)$',
-            
-            # Common shipping charge formats
-            r'^rush\s+delivery$', r'^expedited\s+shipping$',
-            r'^standard\s+shipping$', r'^ground\s+shipping$'
-        ]
-        
-        import re
-        for pattern in shipping_charge_patterns:
-            if re.match(pattern, desc_lower):
-                return True
+        if _SHIPPING_CHARGE_PATTERN.match(desc_lower):
+            return True
         
         # Additional heuristics for shipping charges:
         words = desc_lower.split()
@@ -1445,7 +2470,7 @@ class DynamicOCRParser:
         # - Specific material/process descriptions
         
         # If it has a part number pattern, it's likely a product
-        if re.search(r'[A-Z]+-\d+|[A-Z]+\d+', desc_lower.upper()):
+        if _PRODUCT_CODE_PATTERN.search(desc_lower.upper()):
             return False
         
         # If it has material terms, it's likely a product
@@ -1464,40 +2489,16 @@ class DynamicOCRParser:
         if not description:
             return description
         
-        import re
-        
-        # 1. Remove test content and technical artifacts using intelligent patterns
-        # Look for patterns that indicate test content without hardcoding specific terms
-        test_content_patterns = [
-            r'expected\s+\w+\s+output',  # "expected X output"
-            r'different\s+\w+\s+format:',  # "different X format:"
-            r'different\s+\w+\s+structure:',  # "different X structure:"
-            r'detailed\s+\w+\s+information',  # "detailed X information"
-            r'json\s+\w+',  # "json X"
-            r'custom\s+\w+\s+\w+',  # "custom X Y"
-            r'mixed\s+units\s+pieces',  # "mixed units pieces"
-            r'clear\s+\w+\s+type',  # "clear X type"
-            r'p_r_i_c__in__g__',  # Corrupted pricing text
-            r'multi-line\s+descriptions\s+that\s+will\s+really\s+test',  # Test content
-            r'parser\s+s\s+robustness',  # Test content
-            r'p\s+hone:\s+\d+',  # Corrupted phone
-            r'print\s+name:\s+_+',  # Form field
-            r'postcode\s+format',  # Test content
-            r'ice\s+code',  # Corrupted test content
-            r'qa-pressure-test',  # Test content
-            r'mingham\s+b15',  # Corrupted content
-        ]
-        
-        # Remove test content
-        for pattern in test_content_patterns:
-            description = re.sub(pattern, '', description, flags=re.IGNORECASE)
+        # 1. Remove test content and technical artifacts (see _TEST_CONTENT_PATTERNS)
+        for pattern in _TEST_CONTENT_PATTERNS:
+            description = pattern.sub('', description)
         
         # 2. Remove trailing artifacts that are clearly formatting
-        description = re.sub(r'\s+and\s+([1-9])\s*$', '', description)  # Only single digits
-        description = re.sub(r'\s+,\s*([1-9])\s*$', '', description)  # Only single digits
+        description = _TRAILING_AND_DIGIT_PATTERN.sub('', description)  # Only single digits
+        description = _TRAILING_COMMA_DIGIT_PATTERN.sub('', description)  # Only single digits
         
         # 3. Clean up extra whitespace and normalize
-        description = re.sub(r'\s+', ' ', description).strip()
+        description = _WHITESPACE_RUN_PATTERN.sub(' ', description).strip()
         
         # 4. Remove empty or very short descriptions
         if len(description) < 3:
@@ -1751,105 +2752,64 @@ class DynamicOCRParser:
         Comprehensive check if a line is an address or contact information.
         This works regardless of how many numbers are in the line.
         """
-        # Address keywords (more comprehensive)
-        address_keywords = [
-            'street', 'avenue', 'road', 'drive', 'lane', 'blvd', 'boulevard', 'st', 'ave', 'rd', 'dr', 'ln',
-            'suite', 'ste', 'apt', 'apartment', 'unit', 'floor', 'room', '#',
-            'san', 'francisco', 'jose', 'california', 'ca', 'los angeles', 'santa', 'north', 'south', 'east', 'west',
-            'city', 'county', 'state', 'zip', 'postal'
-        ]
-        
-        # Contact keywords
-        contact_keywords = [
-            'phone', 'tel', 'telephone', 'fax', 'email', 'mail', 'website', 'web', 'www',
-            'contact', 'attn', 'attention', 'to:', 'from:', 'c/o', 'care of'
-        ]
-        
-        # Company/header keywords that might contain numbers but aren't line items
-        company_keywords = [
-            'inc', 'corp', 'corporation', 'llc', 'ltd', 'limited', 'company', 'co',
-            'manufacturing', 'mfg', 'industries', 'group', 'enterprises'
-        ]
-        
-        # Check for address patterns (using word boundaries for better precision)
+        # Check for address patterns (using word boundaries for better precision).
+        # Most lines contain no address keyword at all, so one fused scan rules
+        # them out before the individual keywords are counted.
         address_matches = []
-        for keyword in address_keywords:
-            # Use word boundaries for short keywords to avoid false matches
-            if len(keyword) <= 3:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', line_lower):
-                    address_matches.append(keyword)
-            else:
-                if keyword in line_lower:
-                    address_matches.append(keyword)
+        if _ADDRESS_KEYWORD_PATTERN.search(line_lower):
+            address_matches = [keyword for keyword, pattern in _ADDRESS_KEYWORD_MATCHERS
+                               if pattern.search(line_lower)]
         
         if address_matches:
             # Additional validation: check if it has address-like number patterns
             # Zip codes (5 digits, or 5+4 format)
-            if re.search(r'\b\d{5}(-\d{4})?\b', line):
+            if _ZIP_CODE_PATTERN.search(line):
                 return True
             # Street addresses (number + street keyword)
-            if re.search(r'\b\d+\s+(street|avenue|road|drive|lane|blvd|st|ave|rd|dr|ln)\b', line_lower):
+            if _STREET_ADDRESS_PATTERN.search(line_lower):
                 return True
             # Suite/apartment numbers
-            if re.search(r'(suite|ste|apt|apartment|unit|floor|room|#)\s*\d+', line_lower):
+            if _SUITE_NUMBER_PATTERN.search(line_lower):
                 return True
             # If it has 2+ address keywords, it's probably an address even without specific patterns
             if len(address_matches) >= 2:
                 return True
         
         # Check for contact patterns
-        if any(keyword in line_lower for keyword in contact_keywords):
+        if _CONTACT_KEYWORD_SUBSTRING_PATTERN.search(line_lower):
             # Phone number patterns
-            if re.search(r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b', line) or re.search(r'\(\d{3}\)\s*\d{3}[-.\s]\d{4}', line):
+            if _PHONE_NUMBER_PATTERN.search(line):
                 return True
             # Email patterns
-            if re.search(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b', line):
+            if _EMAIL_PATTERN.search(line):
                 return True
             # Website patterns
-            if re.search(r'\bwww\.|\.com\b|\.org\b|\.net\b', line_lower):
+            if _WEBSITE_PATTERN.search(line_lower):
                 return True
         
         # Check for company header lines (these often have numbers but aren't line items)
-        if any(keyword in line_lower for keyword in company_keywords):
+        if _COMPANY_KEYWORD_PATTERN.search(line_lower):
             # If it contains company keywords and no obvious product/manufacturing terms, skip it
-            # Enhanced manufacturing keywords from advanced parser
-            product_keywords = [
-                'material', 'materials', 'raw material', 'assembly', 'assemble', 'machining', 'machine', 'cnc',
-                'tooling', 'tools', 'tool setup', 'part', 'component', 'qty', 'quantity', 'base', 'basic', 'standard',
-                'solder', 'soldering', 'solder assembly', 'labor', 'labour', 'work', 'setup', 'set up', 'initial setup',
-                'finishing', 'finish', 'surface finish', 'packaging', 'package', 'pack', 'shipping', 'ship', 'delivery',
-                'design', 'engineering', 'prototype', 'proto', 'testing', 'test', 'quality', 'polycarbonate', 'steel',
-                'polypropylene', 'de-burr', 'deburr', 'clear', 'balancer', 'limiter', 'plug', 'cod'
-            ]
-            if not any(keyword in line_lower for keyword in product_keywords):
+            if not _PRODUCT_KEYWORD_PATTERN.search(line_lower):
                 return True
         
         # Check for lines that are just numbers with no meaningful description
         # Remove all numbers from the line and see what's left
-        text_without_numbers = re.sub(r'[\d,.$%-]+', '', line).strip()
-        meaningful_text = re.sub(r'[^\w\s]', ' ', text_without_numbers).strip()
+        text_without_numbers = _NUMERIC_CHARS_PATTERN.sub('', line).strip()
+        meaningful_text = _NON_WORD_CHAR_PATTERN.sub(' ', text_without_numbers).strip()
         
         # If after removing numbers there's very little meaningful text, it might be an address/contact line
         # Use the same precise matching logic for contact keywords
-        contact_matches = []
-        for keyword in contact_keywords:
-            if len(keyword) <= 3:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', line_lower):
-                    contact_matches.append(keyword)
-            else:
-                if keyword in line_lower:
-                    contact_matches.append(keyword)
-        
-        if len(meaningful_text.split()) <= 2 and (address_matches or contact_matches):
+        if len(meaningful_text.split()) <= 2 and (address_matches or _CONTACT_KEYWORD_PATTERN.search(line_lower)):
             return True
         
         # Check for specific problematic patterns that commonly get misidentified
         # Lines that start with numbers but are addresses (e.g., "123 Main Street")
-        if re.match(r'^\s*\d+\s+(street|avenue|road|drive|lane|blvd|st|ave|rd|dr|ln)', line_lower):
+        if _LEADING_STREET_ADDRESS_PATTERN.match(line_lower):
             return True
         
         # Lines that contain city, state, zip patterns
-        if re.search(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\s+\d{5}\b', line):
+        if _CITY_STATE_ZIP_PATTERN.search(line):
             return True
         
         return False
@@ -1860,6 +2820,9 @@ class DynamicOCRParser:
         No assumptions about format - purely pattern-based discovery.
         """
         quantities = []
+        # The context check only depends on the number itself (its first
+        # occurrence in the text), so each distinct number is inspected once
+        checked = set()
         
         # Look for standalone numbers that could be quantities
         lines = text.split('\n')
@@ -1870,17 +2833,21 @@ class DynamicOCRParser:
                 continue
             
             # Find all numbers in the line
-            numbers = re.findall(r'\b(\d{1,4})\b', line)
+            numbers = _SHORT_INTEGER_PATTERN.findall(line)
             
             for num in numbers:
+                if num in checked:
+                    continue
+                checked.add(num)
+                
                 if 1 <= int(num) <= 100000:
                     # Check if this number appears in a quantity-like context
-                    context = text[max(0, text.find(num)-30):text.find(num)+30]
+                    position = text.find(num)
+                    context = text[max(0, position-30):position+30].lower()
                     
                     # If it appears near quantity-related words or pricing, it might be a quantity
-                    if any(keyword in context.lower() for keyword in ['qty', 'quantity', 'price', 'total', '$', 'rate']):
-                        if num not in quantities:
-                            quantities.append(num)
+                    if any(keyword in context for keyword in ['qty', 'quantity', 'price', 'total', '$', 'rate']):
+                        quantities.append(num)
         
         # Sort quantities
         quantities.sort(key=int)
@@ -1930,44 +2897,14 @@ class DynamicOCRParser:
         adjustments = []
         lines = text.split('\n')
         
-        # Patterns for different types of adjustments (multi-currency support)
-        adjustment_patterns = [
-            # Subtotal patterns - multi-currency (improved for European formats)
-            # Handle European format: €2.311,25 -> capture 2.311,25
-            (r'^subtotal\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'subtotal'),
-            (r'^sub[\s\-_]*total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'subtotal'),
-            
-            # Tax patterns - both absolute and percentage (percentage first to avoid conflicts)
-            (r'^tax\s*[:$]?\s*(\d+(?:\.\d{1,2})?)\s*%', 'tax_percentage'),
-            (r'^tax\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'tax_amount'),
-            (r'^sales\s+tax\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'tax_amount'),
-            (r'^sales\s+tax\s*[:$]?\s*(\d+(?:\.\d{1,2})?)\s*%', 'tax_percentage'),
-            
-            # Shipping/handling patterns - multi-currency
-            (r'^shipping\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'shipping'),
-            (r'^handling\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'handling'),
-            (r'^freight\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'freight'),
-            (r'^delivery\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'shipping'),
-            
-            # Discount patterns - both absolute and percentage
-            (r'^discount\s*[:$]?\s*-?[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'discount_amount'),
-            (r'^discount\s*[:$]?\s*-?(\d+(?:\.\d{1,2})?)\s*%', 'discount_percentage'),
-            
-            # Total patterns (to verify calculations) - multi-currency
-            (r'^total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'total'),
-            (r'^grand\s+total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'total'),
-            (r'^final\s+total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'total'),
-            (r'^quote\s+total\s*[:$]?\s*[\$\€\£\¥\₹\₽\₩\₪\₦\₨\₫\₭\₮\₯\₰\₱\₲\₳\₴\₵\₶\₷\₸\₹\₺\₻\₼\₽\₾\₿]?(\d+(?:[,\s\.]\d{3})*(?:[.,]\d{2})?)', 'total'),
-        ]
         
-        import re
         for line in lines:
             line_clean = line.strip().lower()
             if not line_clean:
                 continue
                 
-            for pattern, adjustment_type in adjustment_patterns:
-                match = re.match(pattern, line_clean, re.IGNORECASE)
+            for pattern, adjustment_type in _SUMMARY_ADJUSTMENT_PATTERNS:
+                match = pattern.match(line_clean)
                 if match:
                     value = match.group(1)  # Don't remove comma - let babel handle it
                     
@@ -2111,18 +3048,65 @@ class DynamicOCRParser:
         
         return result
     
-    def parse_quote_to_json(self, pdf_path: str, output_path: Optional[str] = None) -> str:
-        """Parse quote and return JSON string."""
-        result = self.parse_quote(pdf_path)
+    def parse_quote_to_json(self, pdf_path: str, output_path: Optional[str] = None,
+                            return_obj: bool = False):
+        """
+        Parse quote and return JSON string.
+        
+        When the disk cache is enabled (use_disk_cache, VENDRA_PARSER_DISK_CACHE
+        or --disk-cache), the JSON is cached keyed by the PDF's SHA-256, the
+        package version and the extraction configuration, so re-parsing an
+        unchanged PDF skips OCR and line item discovery altogether.
         
-        json_str = json.dumps(result, indent=2)
+        Args:
+            pdf_path: Path to the PDF file
+            output_path: Optional file to write the JSON to
+            return_obj: Return the parsed structure instead of a JSON string,
+                so callers that only inspect the result skip a dumps/loads round trip
+        """
+        cache_path = self._result_cache_path(pdf_path)
+        json_str = None
+        result = None
+        
+        if cache_path is not None:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    json_str = f.read()
+                logger.info(f"Using cached parse result from {cache_path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Could not read result cache {cache_path}: {e}")
+        
+        if json_str is None:
+            result = self.parse_quote(pdf_path)
+            
+            # Only build the string when it is returned; otherwise the
+            # encoder streams straight into the cache and output files
+            if not return_obj:
+                json_str = _dumps_json(result)
+            
+            if cache_path is not None:
+                try:
+                    if json_str is not None:
+                        _write_text_atomic(cache_path, json_str)
+                    else:
+                        _write_atomic(cache_path, lambda f: _dump_json(result, f))
+                except OSError as e:
+                    logger.debug(f"Could not write result cache {cache_path}: {e}")
+        elif return_obj:
+            result = _loads_json(json_str)
         
         if output_path:
-            with open(output_path, 'w') as f:
-                f.write(json_str)
+            if json_str is not None:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(json_str)
+            else:
+                with open(output_path, 'wb') as f:
+                    _dump_json(result, f)
             logger.info(f"Results saved to: {output_path}")
         
-        return json_str
+        return result if return_obj else json_str
 
 
 # Alias for backward compatibility
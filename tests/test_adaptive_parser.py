@@ -0,0 +1,53 @@
+"""Tests for line item selection in AdaptivePDFParser."""
+
+import pytest
+
+from vendra_parser.adaptive_parser import AdaptivePDFParser
+
+
+@pytest.fixture
+def parser():
+    return AdaptivePDFParser()
+
+
+def validate(parser, line):
+    return parser._try_mathematical_validation(line, parser._extract_all_numbers(line))
+
+
+def test_mathematical_validation_prefers_leading_quantity(parser):
+    item = validate(parser, '5 10.00 2.00 50.00 Bolt')
+
+    assert item is not None
+    assert (item.quantity, item.unit_price, item.cost) == ('5.00', '10.00', '50.00')
+
+
+def test_mathematical_validation_prefers_earliest_total(parser):
+    item = validate(parser, 'Kit 4 25 100 200 50')
+
+    assert item is not None
+    assert (item.quantity, item.unit_price, item.cost) == ('4.00', '25.00', '100.00')
+
+
+@pytest.mark.parametrize('line', [
+    'Subtotal: $1,590.56',
+    'Grand Total $1,721.78',
+])
+def test_robust_extraction_skips_single_price_totals(parser, line):
+    assert parser._extract_line_item_robust(line) is None
+
+
+def test_robust_extraction_keeps_priced_line_item(parser):
+    item = parser._extract_line_item_robust('Bracket 2 $10.00 $20.00')
+
+    assert item is not None
+    assert (item.description, item.quantity, item.unit_price, item.cost) == ('Bracket', '2.00', '10.00', '20.00')
+
+
+def test_tolerance_boundary_matches_decimal_arithmetic(parser):
+    # 17 x 0.78 = 13.26 is exactly 15% below 15.60, which the Decimal
+    # check rejected, leaving 20 x 0.78 = 15.60
+    line = 'Rate: | 17 | 20 | $0.78 | $15.60'
+    item = parser._adaptive_line_item_extraction(line, parser._extract_all_numbers(line), {})
+
+    assert item is not None
+    assert (item.quantity, item.unit_price, item.cost) == ('20.00', '0.78', '15.60')